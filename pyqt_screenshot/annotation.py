@@ -0,0 +1,562 @@
+from math import sqrt
+from array import array
+
+from PyQt5.QtCore import QPointF, QRectF, QLineF, Qt
+from PyQt5.QtGui import QColor, QPen, QBrush, QFont, QPolygonF, QFontMetricsF, QPainterPath
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsLineItem, \
+    QGraphicsPolygonItem, QGraphicsPathItem, QGraphicsSimpleTextItem
+
+from pyqt_screenshot.constant import *
+from pyqt_screenshot.redact import Effect
+
+
+def arrow_polygon(x1, y1, x2, y2, sideLength):
+    """
+    :return: QPolygonF of an arrow from (x1, y1) to the head at (x2, y2), None if both points are the same
+    """
+    arrow = QPolygonF()
+
+    linex = float(x1 - x2)
+    liney = float(y1 - y2)
+    line = sqrt(pow(linex, 2) + pow(liney, 2))
+
+    # in case to divided by 0
+    if line == 0:
+        return None
+
+    sinAngel = liney / line
+    cosAngel = linex / line
+
+    # sideLength is the length of bottom side of the body of an arrow
+    # arrowSize is the size of the head of an arrow, left and right
+    # sides' size is arrowSize, and the bottom side's size is arrowSize / 2
+    arrowSize = 8
+    bottomSize = arrowSize / 2
+
+    tmpPoint = QPointF(x2 + arrowSize * sideLength * cosAngel, y2 + arrowSize * sideLength * sinAngel)
+
+    point1 = QPointF(x1 + sideLength * sinAngel, y1 - sideLength * cosAngel)
+    point2 = QPointF(x1 - sideLength * sinAngel, y1 + sideLength * cosAngel)
+    point3 = QPointF(tmpPoint.x() - sideLength * sinAngel, tmpPoint.y() + sideLength * cosAngel)
+    point4 = QPointF(tmpPoint.x() - bottomSize * sideLength * sinAngel,
+                     tmpPoint.y() + bottomSize * sideLength * cosAngel)
+    point5 = QPointF(x2, y2)
+    point6 = QPointF(tmpPoint.x() + bottomSize * sideLength * sinAngel,
+                     tmpPoint.y() - bottomSize * sideLength * cosAngel)
+    point7 = QPointF(tmpPoint.x() + sideLength * sinAngel, tmpPoint.y() - sideLength * cosAngel)
+
+    arrow.append(point1)
+    arrow.append(point2)
+    arrow.append(point3)
+    arrow.append(point4)
+    arrow.append(point5)
+    arrow.append(point6)
+    arrow.append(point7)
+    arrow.append(point1)
+    return arrow
+
+
+def simplify_points(points, tolerance):
+    """
+    Douglas-Peucker, drop the points of a polyline that are closer than tolerance to the simplified line
+    :param points: flat x, y coordinates
+    :return: array('d'), flat x, y coordinates of the points kept, the first and the last one always are
+    """
+    count = len(points) // 2
+    if count < 3:
+        return array('d', points)
+
+    keep = bytearray(count)
+    keep[0] = keep[-1] = 1
+    limit = tolerance * tolerance
+    ranges = [(0, count - 1)]
+    while ranges:
+        first, last = ranges.pop()
+        x1, y1 = points[2 * first], points[2 * first + 1]
+        dx, dy = points[2 * last] - x1, points[2 * last + 1] - y1
+        length = dx * dx + dy * dy
+
+        farthest, distance = None, limit
+        for i in range(first + 1, last):
+            px, py = points[2 * i] - x1, points[2 * i + 1] - y1
+            if length == 0:
+                d = px * px + py * py
+            else:
+                cross = px * dy - py * dx
+                d = cross * cross / length
+            if d > distance:
+                farthest, distance = i, d
+
+        if farthest is not None:
+            keep[farthest] = 1
+            ranges.append((first, farthest))
+            ranges.append((farthest, last))
+
+    result = array('d')
+    for i in range(count):
+        if keep[i]:
+            result.append(points[2 * i])
+            result.append(points[2 * i + 1])
+    return result
+
+
+def segment_distance(px, py, x1, y1, x2, y2):
+    """ :return: the distance of (px, py) to the segment from (x1, y1) to (x2, y2) """
+    dx, dy = x2 - x1, y2 - y1
+    length = dx * dx + dy * dy
+    t = 0 if length == 0 else max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / length))
+    return sqrt(pow(px - x1 - t * dx, 2) + pow(py - y1 - t * dy, 2))
+
+
+def points_path(points):
+    """ :return: QPainterPath, the polyline through the flat x, y coordinates """
+    path = QPainterPath()
+    if len(points) >= 2:
+        path.moveTo(points[0], points[1])
+        for i in range(2, len(points) - 1, 2):
+            path.lineTo(points[i], points[i + 1])
+    return path
+
+
+class Style:
+    """ The pen and brush of annotations, shared by all annotations with the same color and width """
+
+    __slots__ = ('color', 'width', 'pen', 'brush')
+
+    def __init__(self, color, width):
+        self.color = QColor(color)
+        self.width = width
+        self.pen = QPen(self.color, width)
+        self.brush = QBrush(self.color)
+
+
+class StylePool:
+    """ Interns styles and fonts, so hundreds of annotations hold a handful of Qt objects """
+
+    def __init__(self):
+        self.styles = {}
+        self.fonts = {}
+        self.effects = {}
+        self.source = None  # the grab the effects redact
+
+    def setSource(self, image):
+        """ :type image: QImage, the grab redactions are computed from, the effects of the last one are dropped """
+        self.source = image
+        self.effects.clear()
+
+    def effect(self, mode, blockSize):
+        """ :return: Effect of the grab, shared by the redactions with mode and blockSize """
+        key = (mode, blockSize)
+        effect = self.effects.get(key)
+        if effect is None:
+            effect = self.effects[key] = Effect(self.source, mode, blockSize)
+        return effect
+
+    def style(self, color, width):
+        """
+        :param color: QColor or a color name
+        :param width: the pen width
+        :return: Style
+        """
+        color = QColor(color)
+        key = (color.rgba(), int(width))
+        style = self.styles.get(key)
+        if style is None:
+            style = self.styles[key] = Style(color, int(width))
+        return style
+
+    def font(self, font):
+        """
+        :type font: QFont
+        :return: QFont, equal to font and shared
+        """
+        key = font.toString()
+        shared = self.fonts.get(key)
+        if shared is None:
+            shared = self.fonts[key] = QFont(font)
+        return shared
+
+
+class Annotation:
+    """ One committed drawing step. Subclasses keep their geometry in __slots__ """
+
+    __slots__ = ('style', 'boundsCache')
+    kind = None
+
+    def __init__(self, style):
+        self.style = style
+        self.boundsCache = None
+
+    def bounds(self):
+        """ :return: QRectF, the scene area the annotation paints on, pen included """
+        if self.boundsCache is None:
+            margin = self.style.width / 2 + 1
+            self.boundsCache = self.geometryBounds().adjusted(-margin, -margin, margin, margin)
+        return self.boundsCache
+
+    def geometryBounds(self):
+        raise NotImplementedError
+
+    def createItem(self):
+        """ :return: QGraphicsItem showing the annotation, not added to any scene """
+        raise NotImplementedError
+
+    def paint(self, painter):
+        """ paint the annotation the way createItem() shows it """
+        raise NotImplementedError
+
+    def hitTest(self, point, tolerance):
+        """
+        :type point: QPointF
+        :param tolerance: how far from the annotation point may be
+        :return: True if point is on the annotation
+        """
+        return self.bounds().adjusted(-tolerance, -tolerance, tolerance, tolerance).contains(point)
+
+    def translated(self, dx, dy):
+        """ :return: Annotation, a moved copy, annotations are never changed in place """
+        raise NotImplementedError
+
+    def toDict(self):
+        """ :return: dict of plain values, which annotation_from_dict() turns back into the annotation """
+        return {'kind': self.kind, 'color': self.style.color.name(QColor.HexArgb), 'width': self.style.width}
+
+    @classmethod
+    def fromDict(cls, data, style, stylePool):
+        raise NotImplementedError
+
+
+class RectAnnotation(Annotation):
+
+    __slots__ = ('x1', 'y1', 'x2', 'y2')
+    kind = ACTION_RECT
+
+    def __init__(self, x1, y1, x2, y2, style):
+        super().__init__(style)
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+
+    def rect(self):
+        return QRectF(QPointF(self.x1, self.y1), QPointF(self.x2, self.y2))
+
+    def geometryBounds(self):
+        return self.rect().normalized()
+
+    def createItem(self):
+        item = QGraphicsRectItem(self.rect())
+        item.setPen(self.style.pen)
+        return item
+
+    def paint(self, painter):
+        painter.setPen(self.style.pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(self.rect())
+
+    def translated(self, dx, dy):
+        return type(self)(self.x1 + dx, self.y1 + dy, self.x2 + dx, self.y2 + dy, self.style)
+
+    def toDict(self):
+        data = super().toDict()
+        data['points'] = [self.x1, self.y1, self.x2, self.y2]
+        return data
+
+    @classmethod
+    def fromDict(cls, data, style, stylePool):
+        return cls(*data['points'], style)
+
+
+class EllipseAnnotation(RectAnnotation):
+
+    __slots__ = ()
+    kind = ACTION_ELLIPSE
+
+    def createItem(self):
+        item = QGraphicsEllipseItem(self.rect())
+        item.setPen(self.style.pen)
+        return item
+
+    def paint(self, painter):
+        painter.setPen(self.style.pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(self.rect())
+
+
+class LineAnnotation(RectAnnotation):
+
+    __slots__ = ()
+    kind = ACTION_LINE
+
+    def line(self):
+        return QLineF(QPointF(self.x1, self.y1), QPointF(self.x2, self.y2))
+
+    def createItem(self):
+        item = QGraphicsLineItem(self.line())
+        item.setPen(self.style.pen)
+        return item
+
+    def paint(self, painter):
+        painter.setPen(self.style.pen)
+        painter.drawLine(self.line())
+
+    def hitTest(self, point, tolerance):
+        return segment_distance(point.x(), point.y(), self.x1, self.y1, self.x2, self.y2) \
+            <= tolerance + self.style.width / 2
+
+
+class ArrowAnnotation(RectAnnotation):
+
+    __slots__ = ('polygon',)
+    kind = ACTION_ARROW
+
+    def __init__(self, x1, y1, x2, y2, style):
+        super().__init__(x1, y1, x2, y2, style)
+        # computed once here, not on every redraw
+        self.polygon = arrow_polygon(x1, y1, x2, y2, style.width)
+
+    def geometryBounds(self):
+        return self.polygon.boundingRect() if self.polygon is not None else QRectF()
+
+    def createItem(self):
+        if self.polygon is None:
+            return None
+        item = QGraphicsPolygonItem(self.polygon)
+        item.setPen(self.style.pen)
+        item.setBrush(self.style.brush)
+        return item
+
+    def paint(self, painter):
+        if self.polygon is not None:
+            painter.setPen(self.style.pen)
+            painter.setBrush(self.style.brush)
+            painter.drawPolygon(self.polygon)
+
+    def hitTest(self, point, tolerance):
+        return self.polygon is not None and (self.polygon.containsPoint(point, Qt.OddEvenFill) or
+                                             LineAnnotation.hitTest(self, point, tolerance))
+
+
+class FreePenAnnotation(Annotation):
+
+    __slots__ = ('points',)
+    kind = ACTION_FREEPEN
+
+    def __init__(self, points, style):
+        """
+        :param points: array('d') of flat x, y coordinates, the polyline of the stroke
+        """
+        super().__init__(style)
+        self.points = points if isinstance(points, array) else array('d', points)
+
+    def painterPath(self):
+        return points_path(self.points)
+
+    def geometryBounds(self):
+        if not self.points:
+            return QRectF()
+        xs, ys = self.points[0::2], self.points[1::2]
+        return QRectF(QPointF(min(xs), min(ys)), QPointF(max(xs), max(ys)))
+
+    def createItem(self):
+        item = QGraphicsPathItem(self.painterPath())
+        item.setPen(self.style.pen)
+        return item
+
+    def paint(self, painter):
+        painter.setPen(self.style.pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self.painterPath())
+
+    def hitTest(self, point, tolerance):
+        if not super().hitTest(point, tolerance + self.style.width / 2):
+            return False
+        px, py, points = point.x(), point.y(), self.points
+        tolerance += self.style.width / 2
+        if len(points) == 2:
+            return segment_distance(px, py, points[0], points[1], points[0], points[1]) <= tolerance
+        return any(segment_distance(px, py, points[i], points[i + 1], points[i + 2], points[i + 3]) <= tolerance
+                   for i in range(0, len(points) - 3, 2))
+
+    def translated(self, dx, dy):
+        points = array('d', self.points)
+        for i in range(0, len(points), 2):
+            points[i] += dx
+            points[i + 1] += dy
+        return FreePenAnnotation(points, self.style)
+
+    def toDict(self):
+        data = super().toDict()
+        data['points'] = self.points.tolist()
+        return data
+
+    @classmethod
+    def fromDict(cls, data, style, stylePool):
+        return cls(data['points'], style)
+
+
+class StrokeItem(QGraphicsItem):
+    """ The free pen stroke being drawn. points are appended in place, nothing is copied per mouse move """
+
+    def __init__(self, x, y, style, bounds, minDistance=FREEPEN_MIN_DISTANCE):
+        """
+        :type style: Style
+        :type bounds: QRectF
+        :param bounds: the area all points of the stroke stay in
+        :param minDistance: points closer than it to the last one are dropped
+        """
+        super().__init__()
+        self.style = style
+        self.minDistance = minDistance
+        self.points = array('d', (x, y))
+        self.path = QPainterPath(QPointF(x, y))
+        self.margin = style.width / 2 + 1
+        self.bounds = QRectF(bounds).adjusted(-self.margin, -self.margin, self.margin, self.margin)
+
+    def addPoint(self, x, y, force=False):
+        """
+        :param force: add the point even if it is close to the last one, the end of a stroke is never dropped
+        :return: QRectF, the area of the new segment. None if the point was dropped
+        """
+        lastX, lastY = self.points[-2], self.points[-1]
+        dx, dy = x - lastX, y - lastY
+        if dx * dx + dy * dy < self.minDistance * self.minDistance and not (force and (dx or dy)):
+            return None
+
+        self.points.append(x)
+        self.points.append(y)
+        self.path.lineTo(x, y)
+        return QRectF(QPointF(lastX, lastY), QPointF(x, y)).normalized() \
+            .adjusted(-self.margin, -self.margin, self.margin, self.margin)
+
+    def finish(self, tolerance=FREEPEN_TOLERANCE):
+        """ :return: FreePenAnnotation of the simplified stroke """
+        return FreePenAnnotation(simplify_points(self.points, tolerance), self.style)
+
+    def boundingRect(self):
+        return self.bounds
+
+    def paint(self, painter, option, widget=None):
+        painter.setPen(self.style.pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self.path)
+
+
+class RedactAnnotation(RectAnnotation):
+    """ Pixelates or blurs the pixels of the grab from (x1, y1) to (x2, y2), both included """
+
+    __slots__ = ('effect',)
+    kind = ACTION_REDACT
+
+    def __init__(self, x1, y1, x2, y2, style, effect):
+        """ :type effect: Effect """
+        super().__init__(x1, y1, x2, y2, style)
+        self.effect = effect
+
+    def area(self):
+        rect = self.rect().normalized()
+        return rect.adjusted(0, 0, 1, 1)
+
+    def geometryBounds(self):
+        return self.area()
+
+    def createItem(self):
+        return AnnotationItem(self)
+
+    def paint(self, painter):
+        image = self.effect.image()
+        scale = image.devicePixelRatio()
+        area = self.area()
+        painter.drawImage(area, image, QRectF(area.x() * scale, area.y() * scale,
+                                              area.width() * scale, area.height() * scale))
+
+    def translated(self, dx, dy):
+        return type(self)(self.x1 + dx, self.y1 + dy, self.x2 + dx, self.y2 + dy, self.style, self.effect)
+
+    def toDict(self):
+        data = super().toDict()
+        data['mode'] = self.effect.mode
+        data['blockSize'] = self.effect.blockSize
+        return data
+
+    @classmethod
+    def fromDict(cls, data, style, stylePool):
+        return cls(*data['points'], style, stylePool.effect(data['mode'], data['blockSize']))
+
+
+class AnnotationItem(QGraphicsItem):
+    """ Shows an annotation that has no Qt item of its own by painting it """
+
+    def __init__(self, annotation):
+        super().__init__()
+        self.annotation = annotation
+
+    def boundingRect(self):
+        return self.annotation.bounds()
+
+    def paint(self, painter, option, widget=None):
+        self.annotation.paint(painter)
+
+
+class TextAnnotation(Annotation):
+
+    __slots__ = ('text', 'font', 'position')
+    kind = ACTION_TEXT
+
+    def __init__(self, text, font, position, style):
+        """
+        :type font: QFont
+        :type position: QPointF
+        :param position: the top left of the text
+        """
+        super().__init__(style)
+        self.text = text
+        self.font = font
+        self.position = QPointF(position)
+
+    def bounds(self):
+        if self.boundsCache is None:
+            self.boundsCache = self.geometryBounds()
+        return self.boundsCache
+
+    def geometryBounds(self):
+        return QRectF(self.position, QFontMetricsF(self.font).size(0, self.text))
+
+    def createItem(self):
+        item = QGraphicsSimpleTextItem(self.text)
+        item.setFont(self.font)
+        item.setPos(self.position)
+        item.setBrush(self.style.brush)
+        return item
+
+    def paint(self, painter):
+        painter.setFont(self.font)
+        painter.setPen(self.style.pen)
+        painter.drawText(self.bounds(), Qt.AlignLeft | Qt.AlignTop, self.text)
+
+    def translated(self, dx, dy):
+        return TextAnnotation(self.text, self.font, self.position + QPointF(dx, dy), self.style)
+
+    def toDict(self):
+        data = super().toDict()
+        data.update(text=self.text, font=self.font.toString(), position=[self.position.x(), self.position.y()])
+        return data
+
+    @classmethod
+    def fromDict(cls, data, style, stylePool):
+        font = QFont()
+        font.fromString(data['font'])
+        return cls(data['text'], stylePool.font(font), QPointF(*data['position']), style)
+
+
+ANNOTATION_TYPES = {cls.kind: cls for cls in (RectAnnotation, EllipseAnnotation, LineAnnotation, ArrowAnnotation,
+                                              FreePenAnnotation, TextAnnotation, RedactAnnotation)}
+
+
+def annotation_from_dict(data, stylePool):
+    """
+    :param data: dict made by Annotation.toDict()
+    :type stylePool: StylePool
+    :return: Annotation
+    """
+    if data['kind'] not in ANNOTATION_TYPES:
+        raise ValueError('unknown annotation kind {0}'.format(data['kind']))
+    style = stylePool.style(QColor(data['color']), data['width'])
+    return ANNOTATION_TYPES[data['kind']].fromDict(data, style, stylePool)
@@ -0,0 +1,107 @@
+"""
+numpy views of grabs and captures, and QImages over numpy arrays, without copying the pixels.
+numpy is only needed by this module
+
+    from pyqt_screenshot.arrays import image_to_array
+
+    pixels = image_to_array(img, rgb=True)  # (height, width, 3) uint8, sharing the pixels of img
+"""
+import sys
+
+import numpy
+from PyQt5 import sip
+from PyQt5.QtGui import QImage
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+# QImage.Format -> the channels in the order they are in memory
+CHANNELS = {
+    QImage.Format_RGB32: 'BGRX' if _LITTLE_ENDIAN else 'XRGB',
+    QImage.Format_ARGB32: 'BGRA' if _LITTLE_ENDIAN else 'ARGB',
+    QImage.Format_ARGB32_Premultiplied: 'BGRA' if _LITTLE_ENDIAN else 'ARGB',
+    QImage.Format_RGBX8888: 'RGBX',
+    QImage.Format_RGBA8888: 'RGBA',
+    QImage.Format_RGBA8888_Premultiplied: 'RGBA',
+    QImage.Format_RGB888: 'RGB',
+    QImage.Format_BGR888: 'BGR',
+    QImage.Format_Grayscale8: 'L',
+}
+
+# the channels of an array -> the format array_to_image() gives its QImage by default
+FORMATS = {
+    4: QImage.Format_RGB32,
+    3: QImage.Format_RGB888,
+    1: QImage.Format_Grayscale8,
+}
+
+
+class _ImageBuffer:
+    """ Exposes the pixels of a QImage to numpy, the arrays made from it keep the image alive """
+
+    def __init__(self, image, shape, strides, readonly):
+        self.image = image
+        pointer = image.constBits() if readonly else image.bits()
+        self.__array_interface__ = {
+            'version': 3,
+            'shape': shape,
+            'strides': strides,
+            'typestr': '|u1',
+            'data': (int(pointer), readonly),
+        }
+
+
+def image_to_array(image, rgb=False, writable=False):
+    """
+    :type image: QImage
+    :param rgb: give the red, green and blue channels in this order, a view with reordered strides.
+                the channels are in the order of CHANNELS[image.format()] otherwise
+    :param writable: writes to the array change image. image is detached from the pixmaps and images it
+                     shares its pixels with first, a read only array never copies
+    :return: numpy.ndarray of uint8, (height, width, channels) or (height, width) for grayscale
+    """
+    channels = CHANNELS.get(image.format())
+    if channels is None:
+        raise ValueError('QImage.Format {0} has no array layout, convert the image first'.format(image.format()))
+
+    if len(channels) == 1:
+        shape, strides = (image.height(), image.width()), (image.bytesPerLine(), 1)
+    else:
+        shape, strides = (image.height(), image.width(), len(channels)), (image.bytesPerLine(), len(channels), 1)
+    array = numpy.asarray(_ImageBuffer(image, shape, strides, not writable))
+    if not rgb or len(channels) == 1:
+        return array
+    red, blue = channels.index('R'), channels.index('B')
+    return array[..., red:blue + 1] if red < blue else array[..., red::-1]
+
+
+def region_array(image, rect, rgb=False, writable=False):
+    """
+    :type rect: QRect
+    :param rect: an area of image, in its pixels
+    :return: numpy.ndarray, the part of image_to_array(image) inside rect, still a view
+    """
+    rect = rect & image.rect()
+    return image_to_array(image, rgb, writable)[rect.top():rect.bottom() + 1, rect.left():rect.right() + 1]
+
+
+def array_to_image(array, format=None):
+    """
+    :param array: numpy.ndarray of uint8, (height, width, channels) or (height, width), its pixels in rows
+                  with one stride, like the arrays of image_to_array() or those numpy creates
+    :param format: QImage.Format matching the channels of array, FORMATS[channels] by default
+    :return: QImage over the pixels of array, painting on it changes array. array has to outlive it
+    """
+    if array.dtype != numpy.uint8 or array.ndim not in (2, 3):
+        raise ValueError('array must be (height, width[, channels]) of uint8, not {0} of {1}'.format(
+            array.shape, array.dtype))
+    channels = 1 if array.ndim == 2 else array.shape[2]
+    if array.strides[1] != channels or (array.ndim == 3 and array.strides[2] != 1):
+        raise ValueError('the pixels of a row must be contiguous, use numpy.ascontiguousarray() first')
+    if not array.flags.writeable:
+        raise ValueError('array is read only')
+    if format is None:
+        format = FORMATS[channels]
+
+    height, width = array.shape[:2]
+    pointer = array.__array_interface__['data'][0]
+    return QImage(sip.voidptr(pointer), width, height, array.strides[0], format)
@@ -0,0 +1,78 @@
+"""
+how long it takes from the hotkey to the overlay on the screen
+
+    python -m pyqt_screenshot.benchmark --repeat 10
+
+import is timed in fresh interpreters, the grab, the construction of the overlay and its first frame in this one
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_CODE = 'import time; start = time.perf_counter(); import {0}; print(time.perf_counter() - start)'
+
+
+def time_import(module='pyqt_screenshot.screenshot', repeat=5):
+    """ :return: [seconds] importing module took, each in a new python process """
+    runs = []
+    for i in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_CODE.format(module)], cwd=ROOT)
+        runs.append(float(output))
+    return runs
+
+
+def time_overlay(flags, repeat=5):
+    """
+    :return: {stage: [seconds]} for the grab alone, the construction of a Screenshot with flags
+             and its construction until the first frame was painted
+    """
+    from PyQt5.QtWidgets import QApplication
+    from pyqt_screenshot.capture import cursor_screen, grab_screen
+    from pyqt_screenshot.screenshot import Screenshot
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    stages = {'grab': [], 'construct': [], 'first frame': []}
+    for i in range(repeat):
+        start = time.perf_counter()
+        grab_screen(cursor_screen())
+        stages['grab'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        screenshot = Screenshot(flags)
+        stages['construct'].append(time.perf_counter() - start)
+        app.processEvents()
+        stages['first frame'].append(time.perf_counter() - start)
+
+        screenshot.close()
+        app.processEvents()
+    return stages
+
+
+def report(name, runs):
+    print('{0:<14}{1:>10.1f}{2:>10.1f}{3:>10.1f}'.format(name, min(runs) * 1000, median(runs) * 1000,
+                                                         max(runs) * 1000))
+
+
+def main(argv=None):
+    from pyqt_screenshot import constant
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='runs of every measurement')
+    parser.add_argument('--flags', type=lambda value: int(value, 0), default=constant.CLIPBOARD | constant.RECT |
+                        constant.ELLIPSE | constant.ARROW | constant.LINE | constant.FREEPEN | constant.TEXT |
+                        constant.SAVE_TO_FILE, help='the flags of the Screenshot, see constant.py')
+    args = parser.parse_args(argv)
+
+    print('{0:<14}{1:>10}{2:>10}{3:>10}'.format('ms', 'min', 'median', 'max'))
+    report('import', time_import(repeat=args.repeat))
+    for name, runs in time_overlay(args.flags, args.repeat).items():
+        report(name, runs)
+
+
+if __name__ == '__main__':
+    main()
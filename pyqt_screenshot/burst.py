@@ -0,0 +1,106 @@
+import time
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter
+
+from pyqt_screenshot.capture import cursor_screen, grab_screen, screen_area
+from pyqt_screenshot.coordinates import device_size
+from pyqt_screenshot.encoder import encode_async
+
+
+class BurstCapture(QObject):
+    """ Capture an area of a screen count times at a fixed interval, into a preallocated ring of images.
+    every grab still is a pixmap made by Qt, it is painted into the ring and dropped """
+
+    frameCaptured = pyqtSignal(int)  # the number of the frame, counted from 0
+    finished = pyqtSignal()
+
+    def __init__(self, rect, count, interval, screen=None, capacity=None, parent=None):
+        """
+        :type rect: QRect
+        :param rect: the area in logical pixels, relative to the top left of screen
+        :param count: how many frames to capture
+        :param interval: the time between two frames, in milliseconds
+        :param screen: QScreen, the screen under the cursor by default
+        :param capacity: how many frames are kept, older ones are overwritten. count by default
+        """
+        super().__init__(parent)
+
+        self.screen = screen or cursor_screen()
+        self.area = screen_area(rect, self.screen)
+        self.count = count
+        self.capacity = max(1, capacity or count)
+
+        # the frames kept are allocated here, capturing paints into them
+        size = device_size(self.area.size(), self.screen.devicePixelRatio())
+        self.ring = [QImage(size, QImage.Format_RGB32) for i in range(self.capacity)]
+        self.timestamps = [0.0] * self.capacity  # time.monotonic() of every frame in ring
+        self.encoding = [None] * self.capacity  # the Future of the last encode of every frame in ring
+        self.captured = 0
+        self.skipped = 0  # ticks the next slot was still being encoded
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.captureFrame)
+
+    def start(self):
+        self.captured = 0
+        self.captureFrame()
+        if self.captured < self.count:
+            self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def isActive(self):
+        return self.timer.isActive()
+
+    def captureFrame(self):
+        slot = self.captured % self.capacity
+        future = self.encoding[slot]
+        if future is not None and not future.done():
+            # painting into it would detach the image, the frame is taken on a later tick instead
+            self.skipped += 1
+            return
+        self.encoding[slot] = None
+
+        pixmap = grab_screen(self.screen, self.area)
+        self.timestamps[slot] = time.monotonic()
+
+        image = self.ring[slot]
+        painter = QPainter(image)
+        painter.drawPixmap(image.rect(), pixmap)
+        painter.end()
+
+        self.captured += 1
+        self.frameCaptured.emit(self.captured - 1)
+        if self.captured >= self.count:
+            self.timer.stop()
+            self.finished.emit()
+
+    def __len__(self):
+        return min(self.captured, self.capacity)
+
+    def frames(self):
+        """
+        yield (number, timestamp, QImage) of the kept frames, oldest first.
+        the images are the ring buffers themselves, copy one to keep it past the next capture
+        """
+        for number in range(max(0, self.captured - self.capacity), self.captured):
+            slot = number % self.capacity
+            yield number, self.timestamps[slot], self.ring[slot]
+
+    def encode(self, fileName='burst_{number:04d}.png', picType='png', profile='fastest'):
+        """
+        save the kept frames in the encoder pool. a capture still running does not paint into the
+        frames being saved, it skips its ticks until they are done
+        :param fileName: formatted with the number and the timestamp of every frame
+        :return: [concurrent.futures.Future], each resolving to the EncodeResult of one frame
+        """
+        futures = []
+        for number, timestamp, image in self.frames():
+            future = encode_async(image, fileName.format(number=number, timestamp=timestamp), picType, profile)
+            self.encoding[number % self.capacity] = future
+            futures.append(future)
+        return futures
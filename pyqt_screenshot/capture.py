@@ -0,0 +1,135 @@
+"""
+grabbing the screens, without any widget involved
+
+    from pyqt_screenshot.capture import grab_region
+
+    img = grab_region(QRect(0, 0, 400, 300))  # QImage in device pixels
+"""
+
+from PyQt5 import sip
+from PyQt5.QtCore import QRect, QPoint, Qt
+from PyQt5.QtGui import QGuiApplication, QImage, QPainter, QPixmap, QCursor
+
+from pyqt_screenshot.coordinates import crop_rect, device_point, device_rect, device_size
+
+
+def sub_image(image, rect):
+    """
+    :type image: QImage
+    :type rect: QRect
+    :param rect: an area of image, in its pixels
+    :return: QImage sharing the pixels of image, no copy is made. image has to outlive it
+    """
+    rect = rect & image.rect()
+    offset = rect.top() * image.bytesPerLine() + rect.left() * image.depth() // 8
+    return QImage(sip.voidptr(int(image.bits()) + offset), rect.width(), rect.height(),
+                  image.bytesPerLine(), image.format())
+
+
+def cursor_screen():
+    return QGuiApplication.screenAt(QCursor.pos()) or QGuiApplication.primaryScreen()
+
+
+def grab_screen(screen, area=None):
+    """
+    the single place the screens are grabbed, it has to run in the gui thread
+    :type screen: QScreen
+    :param area: QRect, the part of screen to grab in logical pixels, the whole screen by default
+    :return: QPixmap
+    """
+    if area is None:
+        return screen.grabWindow(0)
+    return screen.grabWindow(0, area.x(), area.y(), area.width(), area.height())
+
+
+def screen_area(rect, screen):
+    """
+    :return: QRect, the part of rect, relative to the top left of screen, that is on screen
+    """
+    return rect.normalized() & QRect(QPoint(0, 0), screen.geometry().size())
+
+
+def virtual_desktop_geometry(screens=None):
+    """
+    :return: QRect, the bounding rect of all screens in logical pixels
+    """
+    geometry = QRect()
+    for screen in screens or QGuiApplication.screens():
+        geometry |= screen.geometry()
+    return geometry
+
+
+def grab_virtual_desktop(screens=None):
+    """
+    grab every screen into one image of the whole virtual desktop
+    :param screens: [QScreen], all screens by default
+    :return: (QPixmap, QRect) the image, with the device pixel ratio of the sharpest screen,
+             and the logical geometry of the desktop it covers
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    screens = screens or QGuiApplication.screens()
+    geometry = virtual_desktop_geometry(screens)
+    scale = max(screen.devicePixelRatio() for screen in screens)
+
+    # QScreen.grabWindow() has to run in the gui thread, the conversion of the grabs
+    # into the desktop image is done for all screens at the same time
+    grabs = [(screen.geometry(), grab_screen(screen).toImage()) for screen in screens]
+
+    desktop_size = device_size(geometry.size(), scale)
+    desktop = QImage(desktop_size, QImage.Format_RGB32)
+    desktop.fill(Qt.black)  # for the gaps between screens of different sizes
+
+    # every screen paints into its own part of the desktop image, so no two threads share pixels. the parts
+    # are cut here, desktop.bits() may detach the image and is not called from the workers
+    parts = [(sub_image(desktop, device_rect(screen_geometry.translated(-geometry.topLeft()), scale)), image)
+             for screen_geometry, image in grabs]
+
+    def paint(part):
+        target, image = part
+        painter = QPainter(target)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(target.rect(), image)
+        painter.end()
+
+    with ThreadPoolExecutor(max_workers=len(parts)) as pool:
+        list(pool.map(paint, parts))
+
+    pixmap = QPixmap.fromImage(desktop)
+    pixmap.setDevicePixelRatio(scale)
+    return pixmap, geometry
+
+
+def grab_region(rect, screen=None, scale=None, encoder=None):
+    """
+    capture an area of a screen without building the overlay
+    :type rect: QRect
+    :param rect: the area in logical pixels, relative to the top left of screen
+    :param screen: QScreen, the screen under the cursor by default
+    :param scale: the device pixel ratio of the result, the one of the screen by default
+    :param encoder: callable taking the QImage, its result is returned instead of the image
+    :return: QImage, a null one if rect is outside of screen
+    """
+    screen = screen or cursor_screen()
+    area = screen_area(rect, screen)
+    if area.isEmpty():
+        return QImage()
+
+    # the area and a pixel around it are grabbed, then cut with the crop math of the overlay, relative to the
+    # top left of the screen, so both give the same device pixels for the same logical area
+    bounds = QRect(QPoint(0, 0), screen.geometry().size())
+    grabbed = area.adjusted(-1, -1, 1, 1) & bounds
+    pixmap = grab_screen(screen, grabbed)
+    grab_scale = pixmap.devicePixelRatio()
+    image = pixmap.toImage()
+    source = crop_rect(area, bounds, grab_scale).translated(-device_point(grabbed.topLeft(), grab_scale))
+    if source != image.rect():
+        image = image.copy(source & image.rect())
+
+    if scale is not None and scale != grab_scale and not image.isNull():
+        image = image.scaled(device_rect(area, scale).size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    image.setDevicePixelRatio(scale or grab_scale)
+
+    if encoder is not None:
+        return encoder(image)
+    return image
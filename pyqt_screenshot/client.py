@@ -0,0 +1,100 @@
+"""
+asks the capture daemon, see daemon.py, for a screenshot. only the standard library is imported here, so a
+hotkey starting this pays neither for Qt nor for building the overlay
+
+    python -m pyqt_screenshot.client --result path --file shot.png
+
+    from pyqt_screenshot.client import request_capture
+
+    reply, data = request_capture(result='bytes')
+
+a request is one line of json. the reply is one line of json too, followed by reply['size'] bytes of the
+encoded image for 'bytes' results
+"""
+import os
+import sys
+import json
+import socket
+import argparse
+import tempfile
+
+from pyqt_screenshot.constant import DAEMON_SOCKET
+
+RESULTS = ('path', 'bytes', 'shm', 'raw')
+
+
+def socket_path():
+    """ :return: the path of the unix socket the daemon of this user listens on """
+    return os.path.join(tempfile.gettempdir(), '{0}-{1}.sock'.format(DAEMON_SOCKET, os.getuid()))
+
+
+def request_capture(flags=None, result='path', fileName=None, picType='png', profile=None, path=None,
+                    clipboard=False):
+    """
+    show the overlay of the daemon and wait until it is closed
+    :param flags: the flags of the capture, the ones the daemon was started with by default
+    :param result: 'path' to write the image to fileName, 'bytes' to receive it, 'shm' to receive the name of
+                   a shared memory block holding it, see shared.read_shared(), 'raw' to receive the name of a
+                   block holding the pixels, not encoded, see shared.open_raw()
+    :param fileName: where 'path' results are written, a new file in the temporary directory by default
+    :param profile: the encoder profile, see encoder.PROFILES
+    :param path: the socket of the daemon, socket_path() by default
+    :param clipboard: also copy the image to the clipboard when the capture is finished with the clipboard button.
+                      the daemon keeps owning it
+    :return: (reply, data) the reply of the daemon and the encoded image for 'bytes' results, None otherwise.
+             reply['ok'] is False with reply['error'] set if the capture was canceled or failed
+    """
+    if result not in RESULTS:
+        raise ValueError('result must be one of {0}'.format(', '.join(RESULTS)))
+    request = {'result': result, 'picType': picType}
+    if flags is not None:
+        request['flags'] = flags
+    if fileName:
+        request['fileName'] = os.path.abspath(fileName)
+    if profile:
+        request['profile'] = profile
+    if clipboard:
+        request['clipboard'] = True
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path or socket_path())
+        connection.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with connection.makefile('rb') as stream:
+            line = stream.readline()
+            if not line:
+                raise ConnectionError('the daemon closed the connection without a reply')
+            reply = json.loads(line.decode('utf-8'))
+            data = None
+            if reply.get('ok') and result == 'bytes':
+                data = stream.read(reply['size'])
+    return reply, data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='take a screenshot with the running capture daemon')
+    parser.add_argument('--result', choices=RESULTS, default='path',
+                        help='print the path of the file, write the image to stdout or print the shared memory holding it '
+                             'encoded or raw')
+    parser.add_argument('--file', help='the file path results are written to')
+    parser.add_argument('--type', default='png', help='the image format')
+    parser.add_argument('--profile', help='the encoder profile, see encoder.PROFILES')
+    parser.add_argument('--flags', type=lambda value: int(value, 0), help='the flags, see constant.py')
+    parser.add_argument('--clipboard', action='store_true', help='also copy the image to the clipboard')
+    args = parser.parse_args(argv)
+
+    reply, data = request_capture(args.flags, args.result, args.file, args.type, args.profile,
+                                  clipboard=args.clipboard)
+    if not reply.get('ok'):
+        print(reply.get('error', 'capture failed'), file=sys.stderr)
+        return 1
+    if args.result == 'path':
+        print(reply['path'])
+    elif args.result == 'bytes':
+        sys.stdout.buffer.write(data)
+    else:
+        print(reply['shm'], reply['size'])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
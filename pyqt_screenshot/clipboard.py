@@ -0,0 +1,54 @@
+"""
+on x11 and wayland the clipboard only refers to the process that set it, so a screenshot copied by the
+overlay is gone once the overlay exits. hold_clipboard() hands the image to a small detached process that
+owns the clipboard and serves the pastes instead, it exits when something else is copied
+
+    python -m pyqt_screenshot.clipboard <shared memory name> <size>
+"""
+import os
+import sys
+import subprocess
+
+from PyQt5.QtGui import QGuiApplication, QImage, QClipboard
+
+from pyqt_screenshot.encoder import encode_data
+from pyqt_screenshot.shared import publish_shared, read_shared
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the platforms whose clipboard does not keep the data of a process that exited, prefixes of the platform
+# name since the plugins come in variants like wayland-egl
+HOLDER_PLATFORMS = ('xcb', 'wayland')
+
+
+def needs_holder():
+    return QGuiApplication.platformName().startswith(HOLDER_PLATFORMS)
+
+
+def hold_clipboard(image):
+    """
+    start a process owning the clipboard with image, it does not exit with this one
+    :type image: QImage
+    :return: subprocess.Popen
+    """
+    # the holder decodes it once, a fast encoding keeps the shared memory small enough
+    data, trials = encode_data(image, 'png', 'fastest')
+    name = publish_shared(data)
+    return subprocess.Popen([sys.executable, '-m', 'pyqt_screenshot.clipboard', name, str(len(data))], cwd=ROOT,
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                            start_new_session=True)
+
+
+def main(argv=None):
+    name, size = (argv or sys.argv[1:])[:2]
+    app = QGuiApplication(sys.argv[:1])
+    image = QImage.fromData(read_shared(name, int(size)), 'png')
+    clipboard = app.clipboard()
+    clipboard.setImage(image, QClipboard.Clipboard)
+    # set after the image, the change made by this process does not count
+    clipboard.dataChanged.connect(lambda: clipboard.ownsClipboard() or app.quit())
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
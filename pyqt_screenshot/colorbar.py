@@ -1,11 +1,12 @@
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QWidget, QPushButton, QHBoxLayout, QFrame, QButtonGroup, QGridLayout, QFontDialog, \
-    QSizePolicy
+    QSizePolicy, QSpinBox
 
 from pyqt_screenshot.constant import *
 from PyQt5.QtCore import pyqtSignal, Qt
 
-from resource import resource
+from pyqt_screenshot.icons import icon
+from pyqt_screenshot.redact import REDACT_MODES
 
 
 class PenSetWidget(QWidget):
@@ -13,6 +14,8 @@ class PenSetWidget(QWidget):
     penSizeTrigger = pyqtSignal(int)
     penColorTrigger = pyqtSignal(str)
     fontChangeTrigger = pyqtSignal(QFont)
+    redactModeTrigger = pyqtSignal(str)
+    redactBlockSizeTrigger = pyqtSignal(int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -36,7 +39,7 @@ class PenSetWidget(QWidget):
             button = QPushButton(parent)
             button.setObjectName(color[0])
             button.setStyleSheet('QPushButton { background-color: %s; }' % color[1])
-            button.setFixedSize(self.iconWidth / 2, self.iconHeight / 2)
+            button.setFixedSize(self.iconWidth // 2, self.iconHeight // 2)
             button.setCheckable(True)
             self.colorButtons.append(button)
 
@@ -48,6 +51,7 @@ class PenSetWidget(QWidget):
 
         self.initPenSizeButtons()
         self.initFontWidget()
+        self.initRedactWidget()
         self.initPenColorButtons()
 
         self.separator = QFrame(self)
@@ -56,6 +60,7 @@ class PenSetWidget(QWidget):
 
         self.mainLayout.addWidget(self.penSize)
         self.mainLayout.addWidget(self.changeFontButton)
+        self.mainLayout.addWidget(self.redactSet)
         self.mainLayout.addWidget(self.separator)
 
         self.mainLayout.addWidget(self.colorSet)
@@ -66,19 +71,19 @@ class PenSetWidget(QWidget):
         self.penSize.setLayout(self.penSizeLayout)
         # adjust pen size
         self.penSize1 = QPushButton(self.penSize)
-        self.penSize1.setIcon(QIcon(":/resource/icon/pensize1.png"))
+        self.penSize1.setIcon(icon('pensize1'))
         self.penSize1.setObjectName('1')
         self.penSize1.setFixedSize(self.iconWidth, self.iconHeight)
         self.penSize1.setCheckable(True)
 
         self.penSize2 = QPushButton(self.penSize)
-        self.penSize2.setIcon(QIcon(":/resource/icon/pensize2.png"))
+        self.penSize2.setIcon(icon('pensize2'))
         self.penSize2.setObjectName('2')
         self.penSize2.setFixedSize(self.iconWidth, self.iconHeight)
         self.penSize2.setCheckable(True)
 
         self.penSize3 = QPushButton(self.penSize)
-        self.penSize3.setIcon(QIcon(":/resource/icon/pensize3.png"))
+        self.penSize3.setIcon(icon('pensize3'))
         self.penSize3.setObjectName('3')
         self.penSize3.setFixedSize(self.iconWidth, self.iconHeight)
         self.penSize3.setCheckable(True)
@@ -154,37 +159,86 @@ class PenSetWidget(QWidget):
         self.colorLayout.addWidget(self.colorPick)
 
     def initFontWidget(self):
-        self.fontDialog = QFontDialog()
+        # no QFontDialog here, it enumerates every font of the system. it is built when the button is clicked
+        self.currentFont = QFont('Sans serif')
         self.changeFontButton = QPushButton(self)
-        self.fontDialog.setCurrentFont(QFont('Sans serif'))
-        self.changeFontButton.setText('{0} {1}'.format(self.fontDialog.currentFont().family(),
-                                                       self.fontDialog.currentFont().pointSize()))
+        self.changeFontButton.setText('{0} {1}'.format(self.currentFont.family(), self.currentFont.pointSize()))
         self.changeFontButton.clicked.connect(self.fontButtonClicked)
 
+    def initRedactWidget(self):
+        """ the mode of the redaction and its block size, the pen does not apply to it """
+        self.redactSet = QWidget(self)
+        self.redactLayout = QHBoxLayout()
+        self.redactLayout.setSpacing(5)
+        self.redactLayout.setContentsMargins(0, 0, 0, 0)
+        self.redactSet.setLayout(self.redactLayout)
+
+        self.redactModeGroup = QButtonGroup(self.redactSet)
+        for mode in REDACT_MODES:
+            button = QPushButton(mode.capitalize(), self.redactSet)
+            button.setObjectName(mode)
+            button.setFixedHeight(self.iconHeight)
+            button.setCheckable(True)
+            button.setChecked(mode == REDACT_MODE)
+            self.redactModeGroup.addButton(button)
+            self.redactLayout.addWidget(button)
+        self.redactModeGroup.buttonClicked.connect(self.redactModeToggled)
+
+        self.redactBlockSize = QSpinBox(self.redactSet)
+        self.redactBlockSize.setRange(2, 64)
+        self.redactBlockSize.setSuffix(' px')
+        self.redactBlockSize.setValue(REDACT_BLOCK_SIZE)
+        self.redactBlockSize.setFixedHeight(self.iconHeight)
+        self.redactBlockSize.valueChanged.connect(self.redactBlockSizeTrigger)
+        self.redactLayout.addWidget(self.redactBlockSize)
+        self.redactSet.hide()
+
     def showFontWidget(self):
         self.changeFontButton.show()
         self.penSize1.hide()
         self.penSize2.hide()
         self.penSize3.hide()
+        self.redactSet.hide()
+        self.separator.show()
+        self.colorSet.show()
+        self.adjustSize()
 
     def showPenWidget(self):
         self.changeFontButton.hide()
         self.penSize1.show()
         self.penSize2.show()
         self.penSize3.show()
+        self.redactSet.hide()
+        self.separator.show()
+        self.colorSet.show()
+        self.adjustSize()
+
+    def showRedactWidget(self):
+        self.changeFontButton.hide()
+        self.penSize1.hide()
+        self.penSize2.hide()
+        self.penSize3.hide()
+        self.redactSet.show()
+        self.separator.hide()
+        self.colorSet.hide()
+        self.adjustSize()
 
     # slots
     def colorButtonToggled(self, button):
         self.presentColor.setStyleSheet('QPushButton { background-color: %s; }' % button.objectName())
         self.penColorTrigger.emit(button.objectName())
 
+    def redactModeToggled(self, button):
+        self.redactModeTrigger.emit(button.objectName())
+
     def sizeButtonToggled(self, button):
         self.penSizeTrigger.emit(int(button.objectName()) * 2)
 
     def fontButtonClicked(self):
         ok = True
-        font = QFontDialog.getFont(self)
+        font = QFontDialog.getFont(self.currentFont, self)
         if font[1]:
+            self.currentFont = font[0]
             self.changeFontButton.setText('{0} {1}'.format(font[0].family(),
                                                            font[0].pointSize()))
             self.fontChangeTrigger.emit(font[0])
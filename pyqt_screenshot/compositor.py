@@ -0,0 +1,37 @@
+from PyQt5.QtCore import QRectF, QSizeF
+from PyQt5.QtGui import QPainter
+
+
+def render_annotations(image, steps, origin, scale):
+    """
+    paint the annotations onto a crop of the grab. only the steps reaching into the crop are painted,
+    so the cost follows the size of the crop, not the one of the screen
+    :type image: QImage
+    :param image: the crop, in device pixels
+    :param steps: [Annotation], drawListResult, in logical scene coordinates
+    :type origin: QPointF
+    :param origin: the top left of the crop, in logical scene coordinates
+    :param scale: the device pixel ratio of the crop
+    """
+    if image.isNull() or not steps:
+        return
+
+    area = QRectF(origin, QSizeF(image.width() / scale, image.height() / scale))
+    steps = [step for step in steps if step.bounds().intersects(area)]
+    if not steps:
+        return
+
+    # the painter does the logical to device mapping itself, not the one of the image
+    ratio = image.devicePixelRatio()
+    image.setDevicePixelRatio(1)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    painter.scale(scale, scale)
+    painter.translate(-origin)
+    painter.setClipRect(area)
+    for step in steps:
+        step.paint(painter)
+    painter.end()
+
+    image.setDevicePixelRatio(ratio)
@@ -11,6 +11,9 @@ FREEPEN         = 0b00010000
 TEXT            = 0b00100000
 CLIPBOARD       = 0b01000000
 SAVE_TO_FILE    = 0b10000000
+VIRTUAL_DESKTOP = 0b100000000
+SHARED_MEMORY   = 0b1000000000
+REDACT          = 0b10000000000
 
 DEFAULT         = 0b01000000
 
@@ -27,8 +30,10 @@ ACTION_UNDO = 26
 ACTION_SAVE = 27
 ACTION_CANCEL = 28
 ACTION_SURE = 29
+ACTION_REDO = 41
+ACTION_REDACT = 42
 
-DRAW_ACTION = [ACTION_RECT, ACTION_ELLIPSE, ACTION_ARROW, ACTION_LINE, ACTION_FREEPEN, ACTION_TEXT]
+DRAW_ACTION = [ACTION_RECT, ACTION_ELLIPSE, ACTION_ARROW, ACTION_LINE, ACTION_FREEPEN, ACTION_TEXT, ACTION_REDACT]
 
 
 class MousePosition:
@@ -45,9 +50,60 @@ class MousePosition:
     WAIT_FOR_SELECT = 40
 
 
+# z values of the scene layers, from bottom to top
+Z_BACKGROUND = 0
+Z_MASK = 1
+Z_ANNOTATION = 2
+Z_PROCESS = 3
+Z_SELECTION = 4
+Z_INFO = 5
+Z_MAGNIFIER = 6
+
+# the overlay is redrawn at most MAX_FPS times per second, mouse moves in between are coalesced
+MAX_FPS = 60
+
 # the range of judging if your mouse is on the border of selected area
 ERRORRANGE = 6
 
+# the size of the cells of the grid the annotations are indexed in, for hit tests
+SPATIAL_CELL_SIZE = 64
+
+# the magnifier shows MAGNIFIER_WATCH_SIZE x MAGNIFIER_WATCH_SIZE pixels around the cursor,
+# zoomed MAGNIFIER_ZOOM times
+MAGNIFIER_WATCH_SIZE = 16
+MAGNIFIER_ZOOM = 10
+
+# free pen points closer than FREEPEN_MIN_DISTANCE to the last one are dropped while drawing, the finished
+# stroke is simplified so that no point moves more than FREEPEN_TOLERANCE, both in logical pixels
+FREEPEN_MIN_DISTANCE = 2
+FREEPEN_TOLERANCE = 0.5
+
+# a watched region is compared in tiles of WATCH_TILE_SIZE device pixels, a frame is only passed on when
+# at least WATCH_THRESHOLD pixels changed since the last frame passed on
+WATCH_TILE_SIZE = 32
+WATCH_THRESHOLD = 16
+
+# two neighbouring pixels whose brightness differs by more than EDGE_THRESHOLD are on an edge. the edges the
+# selected area snaps to are at least EDGE_MIN_LENGTH device pixels long
+EDGE_THRESHOLD = 24
+EDGE_MIN_LENGTH = 16
+
+# redacted areas are pixelated or blurred, see redact.REDACT_MODES, in blocks of REDACT_BLOCK_SIZE logical pixels
+REDACT_MODE = 'pixelate'
+REDACT_BLOCK_SIZE = 10
+
+# captures written to a TileStore are cut in squares of STORE_TILE_SIZE device pixels, each kept once
+STORE_TILE_SIZE = 64
+
+# how many steps can be undone, older ones are forgotten
+UNDO_LIMIT = 100
+
+# the name of the unix socket the capture daemon listens on, in the temporary directory
+DAEMON_SOCKET = 'pyqt-screenshot'
+
+# the encoder profile saved screenshots are written with, see encoder.PROFILES
+ENCODER_PROFILE = 'balanced'
+
 PENCOLOR = '#ff0000'  # red
 PENSIZE = 1
 FONTSIZE = 10
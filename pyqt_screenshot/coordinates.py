@@ -0,0 +1,62 @@
+"""
+the mapping between logical pixels, the ones of the scene and of the selected area, and the device pixels
+of a grab. every coordinate is rounded half up, the way qRound() does, so areas sharing an edge in logical
+pixels share it in device pixels too, whatever the device pixel ratio is
+"""
+from math import floor
+
+from PyQt5.QtCore import QRect, QPoint, QPointF, QSize
+
+
+def to_device(value, scale):
+    """ :return: int, the device pixel edge nearest to the logical coordinate value """
+    return floor(value * scale + 0.5)
+
+
+def device_point(point, scale):
+    """
+    :param point: QPoint or QPointF in logical pixels
+    :return: QPoint, the device pixel the logical pixel at point starts in
+    """
+    return QPoint(to_device(point.x(), scale), to_device(point.y(), scale))
+
+
+def device_size(size, scale):
+    """
+    :type size: QSize
+    :return: QSize, the size of an area of size logical pixels starting on a device pixel edge
+    """
+    return QSize(to_device(size.width(), scale), to_device(size.height(), scale))
+
+
+def device_rect(rect, scale):
+    """
+    :type rect: QRect
+    :param rect: an area in logical pixels
+    :param scale: the device pixel ratio
+    :return: QRect, the same area in device pixels
+    """
+    left, top = to_device(rect.x(), scale), to_device(rect.y(), scale)
+    right, bottom = to_device(rect.x() + rect.width(), scale), to_device(rect.y() + rect.height(), scale)
+    return QRect(left, top, right - left, bottom - top)
+
+
+def logical_point(point, scale):
+    """
+    :type point: QPoint
+    :param point: a device pixel edge
+    :return: QPointF, the same point in logical pixels, not rounded
+    """
+    return QPointF(point) / scale
+
+
+def crop_rect(rect, bounds, scale):
+    """
+    :type rect: QRect
+    :param rect: the selected area, in logical pixels
+    :type bounds: QRect
+    :param bounds: the area that was grabbed, in logical pixels
+    :param scale: the device pixel ratio of the grab
+    :return: QRect, the part of rect inside bounds, in device pixels of the grab
+    """
+    return device_rect(rect.normalized() & bounds, scale)
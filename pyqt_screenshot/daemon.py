@@ -0,0 +1,157 @@
+"""
+keeps a QApplication and a hidden overlay running, so a capture costs neither starting python nor building the
+widgets. captures are requested over a local socket, see client.py
+
+    python -m pyqt_screenshot.daemon --flags 0x1ff
+    python -m pyqt_screenshot.client --result path --file shot.png
+
+one capture runs at a time, the requests arriving meanwhile wait for it
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+from PyQt5.QtWidgets import QApplication
+
+from pyqt_screenshot import constant
+from pyqt_screenshot.client import socket_path
+from pyqt_screenshot.encoder import encoder_pool, encode_data, encode_image
+from pyqt_screenshot.shared import publish_shared, publish_image
+from pyqt_screenshot.screenshot import Screenshot
+
+
+class CaptureDaemon(QObject):
+    """ Serves the capture requests of a local socket with one resident Screenshot """
+    # connection, reply, data. emitted in the encoder pool, queued to the gui thread
+    replyReady = pyqtSignal(object, object, object)
+
+    def __init__(self, flags=constant.DEFAULT, path=None, parent=None):
+        """
+        :param flags: the flags of the requests that do not give any
+        :param path: the socket to listen on, client.socket_path() by default
+        """
+        super().__init__(parent)
+        self.flags = flags
+        self.path = path or socket_path()
+        self.requests = deque()  # (connection, request) waiting for the overlay
+        self.current = None  # the (connection, request) being captured
+        self.image = None  # the image saved by the current capture
+        self.replyReady.connect(self.sendReply)
+
+        self.overlay = Screenshot(flags, hidden=True)
+        self.overlay.getToolBar()
+        self.overlay.getPenSetBar()
+        self.overlay.getTextInput()
+        self.overlay.screen_shot_grabed.connect(self.imageGrabbed)
+        self.overlay.widget_closed.connect(self.captureFinished)
+
+        self.server = QLocalServer(self)
+        QLocalServer.removeServer(self.path)
+        if not self.server.listen(self.path):
+            raise IOError('can not listen on {0}: {1}'.format(self.path, self.server.errorString()))
+        self.server.newConnection.connect(self.acceptConnections)
+
+    def acceptConnections(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self.readRequest(connection))
+
+    def readRequest(self, connection):
+        if not connection.canReadLine():
+            return
+        connection.readyRead.disconnect()
+        try:
+            request = json.loads(bytes(connection.readLine()).decode('utf-8'))
+        except ValueError as e:
+            self.sendReply(connection, {'ok': False, 'error': 'bad request: {0}'.format(e)}, None)
+            return
+        self.requests.append((connection, request))
+        self.nextCapture()
+
+    def nextCapture(self):
+        if self.current is not None or not self.requests:
+            return
+        self.current = self.requests.popleft()
+        connection, request = self.current
+        self.image = None
+        # the daemon outlives its captures and keeps owning the clipboard, it is only set when asked for
+        self.overlay.copyToClipboard = bool(request.get('clipboard'))
+        self.overlay.reset(request.get('flags', self.flags))
+        self.overlay.activateWindow()
+
+    def imageGrabbed(self, image):
+        self.image = image
+
+    def captureFinished(self):
+        if self.current is None:
+            return
+        connection, request = self.current
+        self.current = None
+        if self.image is None:
+            self.sendReply(connection, {'ok': False, 'error': 'canceled'}, None)
+        else:
+            encoder_pool().submit(self.encodeReply, connection, request, self.image)
+            self.image = None
+        # the overlay is still closing, the next capture shows it again afterwards
+        QTimer.singleShot(0, self.nextCapture)
+
+    def encodeReply(self, connection, request, image):
+        """ called in the encoder pool """
+        data = None
+        try:
+            picType = request.get('picType', 'png')
+            profile = request.get('profile', self.overlay.encoderProfile)
+            if request.get('result', 'path') == 'path':
+                fileName = request.get('fileName') or os.path.join(
+                    tempfile.gettempdir(), time.strftime('screenshot-%Y%m%d-%H%M%S.') + picType)
+                result = encode_image(image, fileName, picType, profile)
+                reply = {'ok': True, 'path': result.path, 'size': result.size}
+            elif request['result'] == 'raw':
+                reply = {'ok': True, 'shm': publish_image(image), 'size': image.sizeInBytes()}
+            else:
+                data, trials = encode_data(image, picType, profile)
+                reply = {'ok': True, 'size': len(data)}
+                if request['result'] == 'shm':
+                    reply['shm'] = publish_shared(data)
+                    data = None
+        except Exception as e:
+            reply, data = {'ok': False, 'error': str(e)}, None
+        self.replyReady.emit(connection, reply, data)
+
+    def sendReply(self, connection, reply, data):
+        if connection.state() != QLocalSocket.ConnectedState:
+            connection.deleteLater()
+            return
+        connection.write(json.dumps(reply).encode('utf-8') + b'\n')
+        if data:
+            connection.write(data)
+        connection.disconnected.connect(connection.deleteLater)
+        connection.disconnectFromServer()
+
+    def close(self):
+        self.server.close()
+        self.overlay.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='keep an overlay ready for the captures of the client')
+    parser.add_argument('--flags', type=lambda value: int(value, 0), default=constant.DEFAULT,
+                        help='the flags of the requests that do not give any, see constant.py')
+    parser.add_argument('--socket', help='the socket to listen on')
+    args = parser.parse_args(argv)
+
+    app = QApplication(sys.argv)
+    # closing the overlay ends a capture, not the daemon
+    app.setQuitOnLastWindowClosed(False)
+    daemon = CaptureDaemon(args.flags, args.socket)
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+the edges of a grab, for suggesting the rectangle under the cursor and snapping the selected area to it.
+needs numpy
+
+edges are kept as boundaries between pixels, a vertical boundary b is the left edge of column b. for every
+pixel the nearest boundary in each direction is precomputed, so every lookup is a few array reads
+"""
+import numpy
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QImage
+
+from pyqt_screenshot.arrays import image_to_array
+from pyqt_screenshot.coordinates import to_device
+from pyqt_screenshot.constant import EDGE_THRESHOLD, EDGE_MIN_LENGTH
+
+
+def _long_runs(mask, length):
+    """
+    :param mask: numpy.ndarray of bool
+    :return: numpy.ndarray of bool, the parts of mask in runs of at least length along the first axis
+    """
+    count = mask.shape[0]
+    if count < length:
+        return numpy.zeros_like(mask)
+    dtype = numpy.int16 if count < numpy.iinfo(numpy.int16).max else numpy.int32
+    sums = numpy.zeros((count + 1,) + mask.shape[1:], dtype)
+    numpy.cumsum(mask, axis=0, out=sums[1:])
+    full = (sums[length:] - sums[:-length]) == length  # the run of length starting there is all set
+    starts = numpy.zeros((full.shape[0] + 1,) + mask.shape[1:], dtype)
+    numpy.cumsum(full, axis=0, out=starts[1:])
+    index = numpy.arange(count)
+    # a position is kept if a full run starts between length - 1 before it and itself
+    last = numpy.minimum(index + 1, full.shape[0])
+    first = numpy.maximum(index - length + 1, 0)
+    return starts[last] > starts[first]
+
+
+def _nearest(boundaries):
+    """
+    :param boundaries: numpy.ndarray of bool, (lines, positions), the first and the last position set
+    :return: (previous, next) numpy.ndarray, the nearest boundary at or before every position and at or after it
+    """
+    positions = boundaries.shape[1]
+    dtype = numpy.int16 if positions < numpy.iinfo(numpy.int16).max else numpy.int32
+    index = numpy.arange(positions, dtype=dtype)
+    previous = numpy.maximum.accumulate(numpy.where(boundaries, index, 0).astype(dtype), axis=1)
+    following = numpy.minimum.accumulate(numpy.where(boundaries, index, positions - 1).astype(dtype)[:, ::-1],
+                                         axis=1)[:, ::-1]
+    return previous, numpy.ascontiguousarray(following)
+
+
+class EdgeMap:
+    """ The horizontal and vertical edges of an image, with the nearest one of every pixel in each direction """
+
+    def __init__(self, image, scale, threshold=EDGE_THRESHOLD, minLength=EDGE_MIN_LENGTH):
+        """
+        :type image: QImage
+        :param image: the grab, in device pixels
+        :param scale: the device pixel ratio, lookups take and give logical pixels
+        :param threshold: the difference of brightness between two pixels that makes an edge
+        :param minLength: the shortest edge kept, in device pixels. text is mostly shorter
+        """
+        self.scale = scale
+        pixels = image_to_array(image.convertToFormat(QImage.Format_RGB32), rgb=True)
+        gray = (pixels[..., 0] * numpy.uint16(77) + pixels[..., 1] * numpy.uint16(150) +
+                pixels[..., 2] * numpy.uint16(29)) >> 8
+        gray = gray.astype(numpy.int16)
+        self.height, self.width = gray.shape
+
+        columns = numpy.ones((self.height, self.width + 1), numpy.bool_)
+        columns[:, 1:-1] = _long_runs(numpy.abs(gray[:, 1:] - gray[:, :-1]) > threshold, minLength)
+        rows = numpy.ones((self.height + 1, self.width), numpy.bool_)
+        rows[1:-1] = _long_runs(numpy.ascontiguousarray((numpy.abs(gray[1:] - gray[:-1]) > threshold).T),
+                                minLength).T
+
+        # [row, boundary] and, transposed, [column, boundary]
+        self.leftOf, self.rightOf = _nearest(columns)
+        self.above, self.below = _nearest(numpy.ascontiguousarray(rows.T))
+
+    def devicePixel(self, x, y):
+        """ :return: (column, row) of the device pixel the logical point x, y starts in, inside the image """
+        return (min(max(to_device(x, self.scale), 0), self.width - 1),
+                min(max(to_device(y, self.scale), 0), self.height - 1))
+
+    def logical(self, boundary):
+        return to_device(boundary, 1 / self.scale)
+
+    def snapX(self, x, y, distance):
+        """
+        :param x: a vertical boundary, in logical pixels
+        :param y: the row it is snapped on, in logical pixels
+        :param distance: the farthest it moves, in logical pixels
+        :return: the nearest vertical edge, x if there is none close enough
+        """
+        column, row = self.devicePixel(x, y)
+        boundary = min(max(to_device(x, self.scale), 0), self.width)
+        return self.snap(x, boundary, self.leftOf[row, boundary], self.rightOf[row, boundary], distance)
+
+    def snapY(self, y, x, distance):
+        """ like snapX(), for horizontal boundaries, snapped on the column x """
+        column, row = self.devicePixel(x, y)
+        boundary = min(max(to_device(y, self.scale), 0), self.height)
+        return self.snap(y, boundary, self.above[column, boundary], self.below[column, boundary], distance)
+
+    def snap(self, value, boundary, before, after, distance):
+        nearest = before if boundary - before <= after - boundary else after
+        if abs(nearest - boundary) > distance * self.scale:
+            return value
+        return self.logical(int(nearest))
+
+    def enclosingRect(self, x, y):
+        """ :return: QRect, the rectangle of edges around the logical point x, y, in logical pixels """
+        column, row = self.devicePixel(x, y)
+        left = self.logical(int(self.leftOf[row, column]))
+        right = self.logical(int(self.rightOf[row, column + 1]))
+        top = self.logical(int(self.above[column, row]))
+        bottom = self.logical(int(self.below[column, row + 1]))
+        return QRect(left, top, right - left, bottom - top)
@@ -0,0 +1,141 @@
+import os
+import time
+import threading
+from collections import namedtuple, Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage, QImageWriter
+
+# the options a QImageWriter is set up with
+EncoderSetting = namedtuple('EncoderSetting', ['quality', 'optimized', 'progressive'])
+
+# what an encoding produced: the absolute path of the file, its size in bytes, the seconds it
+# took to encode and write it, the profile used and one (setting, size, seconds) per trial
+EncodeResult = namedtuple('EncodeResult', ['path', 'size', 'duration', 'profile', 'trials'])
+
+# Qt maps the quality of png to the zlib level (100 - quality) * 9 / 91, so 80 is level 1 and 0 is level 9.
+# jpeg keeps its quality in every profile, only the way it is written changes.
+# a profile with more than one setting tries all of them at once and keeps the smallest file
+PROFILES = {
+    'fastest': {
+        'png': [EncoderSetting(80, False, False)],
+        'jpg': [EncoderSetting(85, False, False)],
+    },
+    'balanced': {
+        'png': [EncoderSetting(40, False, False)],
+        'jpg': [EncoderSetting(85, True, False)],
+    },
+    'smallest': {
+        'png': [EncoderSetting(0, False, False), EncoderSetting(10, False, False), EncoderSetting(30, False, False)],
+        'jpg': [EncoderSetting(85, True, False), EncoderSetting(85, True, True), EncoderSetting(85, False, True)],
+    },
+}
+
+DEFAULT_SETTING = EncoderSetting(-1, False, False)
+
+_pool = None
+_trial_pool = None
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def encoder_pool():
+    """ :return: ThreadPoolExecutor, shared by everything that encodes images in the background """
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(thread_name_prefix='pyqt-screenshot-encode')
+    return _pool
+
+
+def trial_pool():
+    """ the trials of one encoding run here, a job in encoder_pool() must not wait for its own pool """
+    global _trial_pool
+    if _trial_pool is None:
+        _trial_pool = ThreadPoolExecutor(thread_name_prefix='pyqt-screenshot-trial')
+    return _trial_pool
+
+
+def profile_settings(profile, picType):
+    """ :return: [EncoderSetting] tried for picType by profile """
+    picType = picType.lower()
+    if picType == 'jpeg':
+        picType = 'jpg'
+    if profile not in PROFILES:
+        raise ValueError('unknown encoder profile {0}'.format(profile))
+    return PROFILES[profile].get(picType, [DEFAULT_SETTING])
+
+
+def encode_bytes(image, picType, setting):
+    """
+    :type image: QImage
+    :type setting: EncoderSetting
+    :return: (bytes, seconds)
+    """
+    start = time.perf_counter()
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    writer = QImageWriter(buffer, picType.encode())
+    writer.setQuality(setting.quality)
+    writer.setOptimizedWrite(setting.optimized)
+    writer.setProgressiveScanWrite(setting.progressive)
+    if not writer.write(image):
+        raise IOError('can not encode {0}: {1}'.format(picType, writer.errorString()))
+    buffer.close()
+    return bytes(data), time.perf_counter() - start
+
+
+def encode_data(image, picType='png', profile='balanced'):
+    """
+    encode image with every setting of profile, in the calling thread
+    :type image: QImage
+    :param profile: one of PROFILES
+    :return: (bytes, trials) the smallest encoding and one (setting, size, seconds) per setting
+    """
+    settings = profile_settings(profile, picType)
+    if len(settings) == 1:
+        encoded = [encode_bytes(image, picType, settings[0])]
+    else:
+        encoded = list(trial_pool().map(lambda setting: encode_bytes(image, picType, setting), settings))
+
+    data = min(encoded, key=lambda trial: len(trial[0]))[0]
+    return data, [(setting, len(trial[0]), trial[1]) for setting, trial in zip(settings, encoded)]
+
+
+def encode_image(image, fileName, picType='png', profile='balanced'):
+    """
+    encode image and write it to fileName, in the calling thread
+    :type image: QImage
+    :param profile: one of PROFILES
+    :return: EncodeResult
+    """
+    start = time.perf_counter()
+    data, trials = encode_data(image, picType, profile)
+    with open(fileName, 'wb') as f:
+        f.write(data)
+
+    result = EncodeResult(os.path.abspath(fileName), len(data), time.perf_counter() - start, profile, trials)
+    with _stats_lock:
+        stats = _stats.setdefault(profile, Counter())
+        stats['images'] += 1
+        stats['bytes'] += result.size
+        stats['seconds'] += result.duration
+    return result
+
+
+def encode_async(image, fileName, picType='png', profile='balanced'):
+    """
+    encode image in the encoder pool. QImage is safe to use outside the gui thread, QPixmap is not,
+    so convert pixmaps before calling this
+    :type image: QImage
+    :return: concurrent.futures.Future resolving to an EncodeResult
+    """
+    # a shallow copy, if the caller paints into image later it gets detached instead of changed
+    return encoder_pool().submit(encode_image, QImage(image), fileName, picType, profile)
+
+
+def encoder_stats():
+    """ :return: {profile: Counter} with the images encoded, their bytes and the seconds spent """
+    with _stats_lock:
+        return {profile: Counter(stats) for profile, stats in _stats.items()}
@@ -0,0 +1,101 @@
+from PyQt5.QtCore import QRect
+from PyQt5.QtWidgets import QUndoCommand
+
+from pyqt_screenshot.constant import *
+
+# ids of the commands that merge with the one pushed before them, see QUndoCommand.id()
+MODIFY_ANNOTATION_ID = 1
+CLEAR_SELECTION_ID = 2
+
+
+class AddAnnotationCommand(QUndoCommand):
+    """ Add an annotation to drawListResult """
+
+    def __init__(self, screenshot, step, index=None):
+        """
+        :type screenshot: Screenshot
+        :type step: Annotation
+        :param index: where step goes in drawListResult, the end by default
+        """
+        super().__init__('add annotation')
+        self.screenshot = screenshot
+        self.step = step
+        self.index = len(screenshot.drawListResult) if index is None else index
+
+    def redo(self):
+        self.screenshot.insertAnnotation(self.index, self.step)
+
+    def undo(self):
+        self.screenshot.removeAnnotation(self.index)
+
+
+class RemoveAnnotationCommand(QUndoCommand):
+    """ Remove an annotation from drawListResult """
+
+    def __init__(self, screenshot, index):
+        super().__init__('remove annotation')
+        self.screenshot = screenshot
+        self.index = index
+        self.step = screenshot.drawListResult[index]
+
+    def redo(self):
+        self.screenshot.removeAnnotation(self.index)
+
+    def undo(self):
+        self.screenshot.insertAnnotation(self.index, self.step)
+
+
+class ModifyAnnotationCommand(QUndoCommand):
+    """ Replace an annotation by a changed copy of it """
+
+    def __init__(self, screenshot, index, step, merge=False):
+        """
+        :param step: Annotation, the new version of drawListResult[index]
+        :param merge: merge with the command pushed before, if it modified the same annotation.
+                      a drag then takes one undo step, not one per mouse move
+        """
+        super().__init__('modify annotation')
+        self.screenshot = screenshot
+        self.index = index
+        self.old = screenshot.drawListResult[index]
+        self.new = step
+        self.merge = merge
+
+    def id(self):
+        return MODIFY_ANNOTATION_ID
+
+    def mergeWith(self, other):
+        if not other.merge or other.index != self.index or other.old is not self.new:
+            return False
+        self.new = other.new
+        return True
+
+    def redo(self):
+        self.screenshot.replaceAnnotation(self.index, self.new)
+
+    def undo(self):
+        self.screenshot.replaceAnnotation(self.index, self.old)
+
+
+class ClearSelectionCommand(QUndoCommand):
+    """ Drop the selected area, the annotations stay """
+
+    def __init__(self, screenshot):
+        super().__init__('clear selection')
+        self.screenshot = screenshot
+        self.area = QRect(screenshot.selected_area)
+        self.action = screenshot.action
+
+    def id(self):
+        return CLEAR_SELECTION_ID
+
+    def mergeWith(self, other):
+        # Qt only offers the clear pushed right after this one. if it had no area to clear it changed nothing
+        # and is folded in, an area selected in between keeps its own undo step
+        return other.area.isNull()
+
+    def redo(self):
+        self.screenshot.setSelection(QRect(), ACTION_SELECT)
+
+    def undo(self):
+        self.screenshot.setSelection(self.area, self.action)
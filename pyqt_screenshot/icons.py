@@ -0,0 +1,16 @@
+from PyQt5.QtGui import QIcon
+
+_registered = False
+
+
+def icon(name):
+    """
+    :param name: the name of a png in resource/icon, without the extension
+    :return: QIcon, the image is decoded the first time the icon is painted
+    """
+    global _registered
+    if not _registered:
+        # the compiled qrc data is only imported once a widget needs an icon
+        import resource.resource
+        _registered = True
+    return QIcon(':/resource/icon/{0}.png'.format(name))
@@ -0,0 +1,127 @@
+from PyQt5.QtCore import QRectF, QPointF, Qt
+from PyQt5.QtGui import QColor, QPen, QBrush, QImage, QPainter
+from PyQt5.QtWidgets import QGraphicsItem
+
+from pyqt_screenshot.constant import *
+from pyqt_screenshot.coordinates import to_device
+
+
+class Magnifier(QGraphicsItem):
+    """ A single scene item showing the zoomed pixels around the cursor """
+
+    cursorSize = 24
+    infoHeight = 40
+
+    def __init__(self, watchSize=MAGNIFIER_WATCH_SIZE, zoom=MAGNIFIER_ZOOM, parent=None):
+        super().__init__(parent)
+
+        self.watchSize = watchSize
+        self.zoom = zoom
+
+        self.sourceImage = QImage()  # the whole grab, see setSource()
+        self.scale = 1
+        self.watchArea = QRectF()  # the watched area in the pixels of sourceImage, on whole pixels
+        self.pointRgb = (0, 0, 0)
+        self.selectionSize = (0, 0)
+
+        self.framePen = QPen(QColor(255, 255, 255), 2)
+        self.crossPen = QPen(QColor(0, 255, 255), 2)
+        self.textPen = QPen(QColor(255, 255, 255), 2)
+        self.infoBrush = QBrush(Qt.black)
+
+        self.setAcceptedMouseButtons(Qt.NoButton)
+
+    def setSource(self, image):
+        """
+        :type image: QImage
+        :param image: the grabbed screen, sampled by every later moveTo(). it is shared, not copied
+        """
+        self.sourceImage = image
+        self.scale = image.devicePixelRatio()
+        self.update()
+
+    def setWatchSize(self, watchSize):
+        self.prepareGeometryChange()
+        self.watchSize = watchSize
+
+    def setZoom(self, zoom):
+        self.prepareGeometryChange()
+        self.zoom = zoom
+
+    def magnifierSize(self):
+        return self.watchSize * self.zoom
+
+    def boundingRect(self):
+        margin = self.framePen.widthF()
+        size = self.magnifierSize()
+        return QRectF(0, 0, size, size + self.infoHeight).adjusted(-margin, -margin, margin, margin)
+
+    def moveTo(self, point, bounds):
+        """
+        :type point: QPointF
+        :param point: the cursor position, in scene coordinates
+        :type bounds: QRectF
+        :param bounds: the scene area the magnifier has to stay in
+        """
+        # the pixel under the cursor and the watched area around it, in the pixels of the source image,
+        # rounded the way the selected area is cropped
+        width, height = self.sourceImage.width(), self.sourceImage.height()
+        px = min(max(to_device(point.x(), self.scale), 0), width - 1)
+        py = min(max(to_device(point.y(), self.scale), 0), height - 1)
+        watch = to_device(self.watchSize, self.scale)
+        x = min(max(px - watch // 2, 0), max(width - watch, 0))
+        y = min(max(py - watch // 2, 0), max(height - watch, 0))
+        watchArea = QRectF(x, y, watch, watch)
+
+        pointRgb = (0, 0, 0)
+        if width and height:  # px and py are clamped into the image, unless it is empty
+            color = QColor(self.sourceImage.pixel(px, py))
+            pointRgb = (color.red(), color.green(), color.blue())
+
+        # the magnifier itself sits on the bottom right of the cursor if there is enough space
+        size = self.magnifierSize()
+        pos = QPointF(point.x() + self.cursorSize, point.y() + self.cursorSize)
+        if pos.x() + size >= bounds.right():
+            pos.setX(point.x() - size - self.cursorSize / 2)
+        if pos.y() + size + self.infoHeight >= bounds.bottom():
+            pos.setY(point.y() - size - self.cursorSize / 2 - self.infoHeight)
+
+        if watchArea != self.watchArea or pointRgb != self.pointRgb:
+            self.watchArea = watchArea
+            self.pointRgb = pointRgb
+            self.update()
+        if pos != self.pos():
+            self.setPos(pos)
+
+    def setSelectionSize(self, width, height):
+        if (width, height) != self.selectionSize:
+            self.selectionSize = (width, height)
+            self.update()
+
+    def paint(self, painter, option, widget=None):
+        """
+        :type painter: QPainter
+        """
+        size = self.magnifierSize()
+        area = QRectF(0, 0, size, size)
+
+        # nearest neighbour scaling straight from the cached image, no intermediate pixmap
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        if not self.sourceImage.isNull():
+            painter.drawImage(area, self.sourceImage, self.watchArea)
+
+        painter.setPen(self.framePen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(area)
+        painter.setPen(self.crossPen)
+        painter.drawLine(QPointF(area.center().x(), area.top()), QPointF(area.center().x(), area.bottom()))
+        painter.drawLine(QPointF(area.left(), area.center().y()), QPointF(area.right(), area.center().y()))
+
+        # draw information
+        info = QRectF(0, size, size, self.infoHeight)
+        painter.fillRect(info, self.infoBrush)
+        painter.setPen(self.textPen)
+        painter.drawText(info.adjusted(0, 2, 0, 0), Qt.AlignLeft | Qt.AlignTop,
+                         ' Rgb: ({0}, {1}, {2})'.format(*self.pointRgb))
+        painter.drawText(info.adjusted(0, 0, 0, -2), Qt.AlignLeft | Qt.AlignBottom,
+                         ' Size: {0} x {1}'.format(*self.selectionSize))
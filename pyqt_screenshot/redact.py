@@ -0,0 +1,61 @@
+from math import ceil
+from threading import Lock
+
+from PyQt5.QtCore import Qt
+
+from pyqt_screenshot.coordinates import to_device
+
+REDACT_MODES = ('pixelate', 'blur')
+
+
+def redact_image(image, mode, blockSize):
+    """
+    pixelate or blur a whole image. both go through the scaling of QImage, which averages the pixels of a
+    block with simd and does not need numpy
+    :type image: QImage
+    :param mode: one of REDACT_MODES
+    :param blockSize: the size of the blocks averaged, in logical pixels
+    :return: QImage of the same size and device pixel ratio
+    """
+    if mode not in REDACT_MODES:
+        raise ValueError('unknown redaction mode {0}'.format(mode))
+    if image.isNull():
+        return image
+    scale = image.devicePixelRatio()
+    block = max(1, to_device(blockSize, scale))
+    width, height = image.width(), image.height()
+
+    small = image.scaled(max(1, ceil(width / block)), max(1, ceil(height / block)), Qt.IgnoreAspectRatio,
+                         Qt.SmoothTransformation)
+    result = small.scaled(width, height, Qt.IgnoreAspectRatio,
+                          Qt.FastTransformation if mode == 'pixelate' else Qt.SmoothTransformation)
+    result.setDevicePixelRatio(scale)
+    return result
+
+
+class Effect:
+    """
+    A redaction of the whole grab, computed the first time it is painted and shared by the annotations.
+    it is computed once, whether the encoder pool or the gui thread asks for it first
+    """
+
+    __slots__ = ('source', 'mode', 'blockSize', 'cache', 'lock')
+
+    def __init__(self, source, mode, blockSize):
+        """
+        :type source: QImage
+        :param source: the grab, in device pixels
+        """
+        self.source = source
+        self.mode = mode
+        self.blockSize = blockSize
+        self.cache = None
+        self.lock = Lock()
+
+    def image(self):
+        """ :return: QImage, the redacted grab """
+        if self.cache is None:
+            with self.lock:
+                if self.cache is None:
+                    self.cache = redact_image(self.source, self.mode, self.blockSize)
+        return self.cache
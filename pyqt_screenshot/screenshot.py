@@ -1,27 +1,117 @@
 #!/usr/bin/python3
-from PyQt5.QtCore import QRect, QPoint, QRectF, QSize, QLineF, QPointF, QEventLoop
+from PyQt5.QtCore import QRect, QPoint, QRectF, QSize, QSizeF, QLineF, QPointF, QEventLoop, QTimer, QElapsedTimer
 from PyQt5.QtGui import QColor, QPainterPath, QKeySequence, QGuiApplication, QPixmap, QPen, QBrush, QImage, QPainter, \
-    QPolygonF, QClipboard, QCursor, QMouseEvent
-from PyQt5.QtWidgets import QGraphicsView, QApplication, QGraphicsScene, QShortcut, QFileDialog, QDialog
+    QPolygonF, QClipboard, QCursor, QMouseEvent, QRegion
+from PyQt5.QtWidgets import QGraphicsView, QApplication, QGraphicsScene, QShortcut, QFileDialog, QDialog, \
+    QGraphicsItem, QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsSimpleTextItem, QUndoStack
 
 from pyqt_screenshot.toolbar import *
 from pyqt_screenshot.colorbar import *
 from pyqt_screenshot.textinput import *
+from pyqt_screenshot.magnifier import Magnifier
+from pyqt_screenshot.capture import cursor_screen, grab_screen, grab_virtual_desktop
+from pyqt_screenshot.coordinates import crop_rect, logical_point
+from pyqt_screenshot.compositor import render_annotations
+from pyqt_screenshot.annotation import StylePool, RectAnnotation, EllipseAnnotation, ArrowAnnotation, \
+    LineAnnotation, TextAnnotation, RedactAnnotation, StrokeItem
+from pyqt_screenshot.history import AddAnnotationCommand, RemoveAnnotationCommand, ModifyAnnotationCommand, \
+    ClearSelectionCommand
+from pyqt_screenshot.spatial import GridIndex
 
 from math import *
+from collections import Counter
 
 qtApp = None
 
 
+def find_edges(image, scale):
+    """
+    run in the encoder pool, numpy is imported there and not on the gui thread
+    :return: edges.EdgeMap of image, None without numpy
+    """
+    try:
+        from pyqt_screenshot.edges import EdgeMap
+    except ImportError:
+        return None
+    return EdgeMap(image, scale)
+
+
+class ImageItem(QGraphicsItem):
+    """
+    Shows an image in logical pixels. only the exposed part is drawn, the pixels a session maps from its file
+    are read where they are shown and never copied into a pixmap
+    """
+
+    def __init__(self, image):
+        """ :type image: QImage """
+        super().__init__()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        self.image = image
+
+    def setImage(self, image):
+        self.prepareGeometryChange()
+        self.image = image
+        self.update()
+
+    def boundingRect(self):
+        return QRectF(QPointF(0, 0), QSizeF(self.image.size()) / self.image.devicePixelRatio())
+
+    def paint(self, painter, option, widget=None):
+        target = option.exposedRect & self.boundingRect()
+        scale = self.image.devicePixelRatio()
+        painter.drawImage(target, self.image, QRectF(target.topLeft() * scale, target.size() * scale))
+
+
+class ScreenView(QGraphicsView):
+    """ Shows the overlay scene of a Screenshot on one more screen, the input goes to the Screenshot """
+
+    def __init__(self, owner, screen):
+        """
+        :type owner: Screenshot
+        :type screen: QScreen
+        """
+        super().__init__(owner.graphics_scene)
+        self.owner = owner
+
+        self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
+        self.setMouseTracking(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setContentsMargins(0, 0, 0, 0)
+        self.setStyleSheet("QGraphicsView { border-style: none; }")
+        self.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
+        self.setSceneRect(owner.screenSceneRect(screen))
+
+        self.show()
+        self.windowHandle().setScreen(screen)
+        self.setGeometry(screen.geometry())
+        self.showFullScreen()
+
+        owner.installShortcuts(self)
+
+    def mousePressEvent(self, event):
+        self.owner.mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        self.owner.mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self.owner.mouseReleaseEvent(event)
+
+
 class Screenshot(QGraphicsView):
     """ Main Class """
 
     screen_shot_grabed = pyqtSignal(QImage)
+    screen_shot_saved = pyqtSignal(str, int, float)  # path, size in bytes, seconds spent encoding
+    screen_shot_shared = pyqtSignal(str)  # the name of the shared memory block, with SHARED_MEMORY
     widget_closed = pyqtSignal()
 
-    def __init__(self, flags=constant.DEFAULT, parent=None):
+    def __init__(self, flags=constant.DEFAULT, parent=None, session=None, hidden=False):
         """
         flags: binary flags. see the flags in the constant.py
+        session: a Session to edit again instead of grabbing the screens
+        hidden: only build the overlay, it is shown by reset()
         """
         super().__init__(parent)
 
@@ -29,15 +119,30 @@ class Screenshot(QGraphicsView):
         self.penColorNow = QColor(PENCOLOR)
         self.penSizeNow = PENSIZE
         self.fontNow = QFont('Sans')
+        self.redactMode = REDACT_MODE  # see redact.REDACT_MODES
+        self.redactBlockSize = REDACT_BLOCK_SIZE
         self.clipboard = QApplication.clipboard()
 
-        self.drawListResult = []  # draw list that sure to be drew, [action, coord]
+        self.drawListResult = []  # draw list that sure to be drew, [Annotation]
         self.drawListProcess = None  # the process to the result
+        self.stylePool = StylePool()  # the pens, brushes and fonts shared by the annotations
+        self.history = QUndoStack(self)  # the commands changing drawListResult and the selection
+        self.history.setUndoLimit(UNDO_LIMIT)
         self.selected_area = QRect()  # a QRect instance which stands for the selected area
         self.selectedAreaRaw = QRect()
         self.mousePosition = MousePosition.OUTSIDE_AREA  # mouse position
         self.screenPixel = None
+        self.screenImage = None  # the grab as an image, for the magnifier and the crops
         self.textRect = None
+        self.edgeFuture = None  # the EdgeMap of the grab, computed in the encoder pool, see requestEdges()
+        self.suggestedArea = QRect()  # the rectangle of edges under the cursor, selected by a click
+
+        # the grab covers every screen with VIRTUAL_DESKTOP, one window is shown on each of them.
+        # scene coordinates are logical pixels relative to the top left of desktopGeometry
+        self.virtualDesktop = bool(flags & constant.VIRTUAL_DESKTOP)
+        self.desktopGeometry = QRect()
+        self.screenViews = []  # the windows on the screens other than this one
+        self.session = session
 
         self.mousePressed = False
         self.action = ACTION_SELECT
@@ -45,15 +150,50 @@ class Screenshot(QGraphicsView):
 
         self.startX, self.startY = 0, 0  # the point where you start
         self.endX, self.endY = 0, 0  # the point where you end
-        self.pointPath = QPainterPath()  # the point mouse passes, used by draw free line
+        self.strokeItem = None  # the free pen stroke being drawn, a StrokeItem
         self.items_to_remove = []  # the items that should not draw on screenshot picture
         self.textPosition = None
 
+        # scene items, created once and then only moved around
+        self.itemStats = Counter()  # how many scene items were created, by kind
+        self.annotationItems = []  # [Annotation, item] pairs mirroring drawListResult
+        self.annotationIndex = GridIndex(SPATIAL_CELL_SIZE)  # the bounds of the steps in drawListResult
+        self.annotationOrder = {}  # Annotation -> a number growing with its position in drawListResult
+        self.pickedStep = None  # the annotation picked with ctrl+click, dragged to move it, removed with del
+        self.pickedIndex = 0
+        self.movingPicked = False
+        self.pickedMoved = False
+        self.processItem = None
+
+        # redraw scheduling, the overlay is rendered at most maxFps times per second
+        self.maxFps = MAX_FPS
+        self.frameStats = Counter()  # requested and rendered frames, dropped mouse moves
+        self.pendingMove = None  # the latest (pos, globalPos) not rendered yet
+        self.lastFrame = QElapsedTimer()
+        self.redrawTimer = QTimer(self)
+        self.redrawTimer.setSingleShot(True)
+        self.redrawTimer.setTimerType(Qt.PreciseTimer)
+        self.redrawTimer.timeout.connect(self.renderFrame)
+
+        # only the parts of the overlay that changed are repainted, see updateViewport()
+        self.dirtyRegion = QRegion()  # in scene coordinates
+        self.fullRepaint = True
+        self.drawnSelection = QRectF()  # the selected area as it is on the screen now
+
         # result
         self.target_img = None
+        self.saveFuture = None  # the background encoding started by saveScreenshot()
+        self.sessionFuture = None  # the background writing started by saveSession()
+        self.sharedName = None  # the shared memory block the result was published to, see shared.open_raw()
+        self.encoderProfile = ENCODER_PROFILE
+        self.tileStore = None  # a store.TileStore the saved images go to instead of files
+        self.copyToClipboard = True  # saving to the clipboard copies the image, the daemon only does it on request
+        # hand the copied image to a holder process, for the processes exiting after the capture, see clipboard.py
+        self.holdClipboard = False
 
         # Init window
         self.getscreenshot()
+        self.stylePool.setSource(self.screenImage)
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
 
         self.setMouseTracking(True)
@@ -61,51 +201,286 @@ class Screenshot(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setContentsMargins(0, 0, 0, 0)
         self.setStyleSheet("QGraphicsView { border-style: none; }")
+        self.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
 
-        self.tooBar = MyToolBar(flags, self)
-        self.tooBar.trigger.connect(self.changeAction)
-
+        # the widgets around the selected area are built the first time they are shown, see getToolBar(),
+        # getPenSetBar() and getTextInput()
+        self.flags = flags
+        self.tooBar = None
         self.penSetBar = None
-        if flags & constant.RECT or flags & constant.ELLIPSE or flags & constant.LINE or flags & constant.FREEPEN \
-                or flags & constant.ARROW or flags & constant.TEXT:
-            self.penSetBar = PenSetWidget(self)
-            self.penSetBar.penSizeTrigger.connect(self.changePenSize)
-            self.penSetBar.penColorTrigger.connect(self.changePenColor)
-            self.penSetBar.fontChangeTrigger.connect(self.changeFont)
+        self.textInput = None
 
-        self.textInput = TextInput(self)
-        self.textInput.inputChanged.connect(self.textChange)
-        self.textInput.cancelPressed.connect(self.cancelInput)
-        self.textInput.okPressed.connect(self.okInput)
+        self.graphics_scene = QGraphicsScene(0, 0, self.desktopGeometry.width(), self.desktopGeometry.height())
+        self.initOverlayItems()
+        self.setScene(self.graphics_scene)
+        self.scale = self.get_scale()
 
-        self.graphics_scene = QGraphicsScene(0, 0, self.screenPixel.width(), self.screenPixel.height())
+        self.installShortcuts(self)
 
+        if not hidden:
+            self.showOverlay()
+
+    def showOverlay(self):
+        """ show the overlay full screen on the screen under the cursor """
+        screen = cursor_screen()
         self.show()
-        self.setScene(self.graphics_scene)
-        self.windowHandle().setScreen(QGuiApplication.screenAt(QCursor.pos()))
-        self.scale = self.get_scale()
+        self.setSceneRect(self.screenSceneRect(screen))
+        self.windowHandle().setScreen(screen)
         # self.setFixedSize(self.screenPixel.width(), self.screenPixel.height())
-        self.setGeometry(QGuiApplication.screenAt(QCursor.pos()).geometry())
+        self.setGeometry(screen.geometry())
         self.showFullScreen()
+        if self.virtualDesktop:
+            self.screenViews = [ScreenView(self, other) for other in QGuiApplication.screens()
+                                if other != screen]
+        if self.session is not None:
+            self.restoreSession()
         self.redraw()
 
-        QShortcut(QKeySequence('ctrl+s'), self).activated.connect(self.saveScreenshot)
-        QShortcut(QKeySequence('esc'), self).activated.connect(self.close)
+    def reset(self, flags=None, session=None):
+        """
+        grab the screens again and start over, the scene items and the widgets built so far are kept.
+        a resident overlay is reused this way instead of being built for every capture
+        :param flags: the flags of the next capture, the ones it was built with by default
+        :param session: a Session to edit again instead of grabbing the screens
+        """
+        self.redrawTimer.stop()
+        for view in self.screenViews:
+            view.close()
+        self.screenViews = []
+
+        if flags is not None and flags != self.flags:
+            # the buttons depend on the flags
+            for widget in (self.tooBar, self.penSetBar):
+                if widget is not None:
+                    widget.close()
+                    widget.deleteLater()
+            self.tooBar = None
+            self.penSetBar = None
+            self.flags = flags
+            self.virtualDesktop = bool(flags & constant.VIRTUAL_DESKTOP)
+        if self.textInput is not None:
+            self.textInput.hide()
+            self.textInput.clearText()
+
+        # forget the last capture
+        self.history.clear()
+        self.drawListResult = []
+        self.updateAnnotationItems()
+        self.drawListProcess = None
+        self.removeSceneItem(self.processItem)
+        self.processItem = None
+        self.removeSceneItem(self.strokeItem)
+        self.strokeItem = None
+        self.pickedStep = None
+        self.movingPicked = False
+        self.setSelection(QRect(), ACTION_SELECT)
+        self.mousePressed = False
+        self.mousePosition = MousePosition.OUTSIDE_AREA
+        self.mousePoint = QCursor.pos()
+        self.pendingMove = None
+        self.textPosition = None
+        self.textRect = None
+        self.target_img = None
+        self.saveFuture = None
+        self.releaseShared()
+
+        self.session = session
+        self.getscreenshot()
+        self.stylePool.setSource(self.screenImage)
+        self.graphics_scene.setSceneRect(0, 0, self.desktopGeometry.width(), self.desktopGeometry.height())
+        self.backgroundItem.setImage(self.screenImage)
+        self.magnifier.setSource(self.screenImage)
+        self.scale = self.get_scale()
+        self.edgeFuture = None
+        self.suggestedArea = QRect()
+        self.drawnSelection = QRectF()
+        self.fullRepaint = True
+        self.showOverlay()
+
+    def installShortcuts(self, widget):
+        """ :param widget: this window or the ScreenView of another screen, the keys work whichever has the focus """
+        for keys, slot in (('ctrl+s', self.saveScreenshot),
+                           ('ctrl+shift+s', self.saveSessionOperation),
+                           ('ctrl+z', self.undoOperation),
+                           ('ctrl+y', self.redoOperation),
+                           ('del', self.deletePickedAnnotation),
+                           ('esc', self.close)):
+            QShortcut(QKeySequence(keys), widget).activated.connect(slot)
 
     @staticmethod
-    def take_screenshot(flags):
+    def _runOverlay(flags, session=None):
+        """
+        show an overlay and wait until it is closed, for the entry points below. the process usually exits after
+        them, so the clipboard is handed to a holder
+        :return: (Screenshot, [QImage]) the closed overlay and the images it saved
+        """
         loop = QEventLoop()
-        screen_shot = Screenshot(flags)
+        images = []
+        screen_shot = Screenshot(flags, session=session)
+        screen_shot.holdClipboard = True
+        screen_shot.screen_shot_grabed.connect(images.append)
         screen_shot.show()
         screen_shot.widget_closed.connect(loop.quit)
 
         loop.exec()
-        img = screen_shot.target_img
-        return img
+        return screen_shot, images
+
+    @staticmethod
+    def take_screenshot(flags):
+        screen_shot, images = Screenshot._runOverlay(flags)
+        return screen_shot.target_img
+
+    @staticmethod
+    def take_shared(flags):
+        """
+        like take_screenshot(), but publish the raw pixels to shared memory instead of returning them
+        :return: the name of the block for shared.open_raw(), None if nothing was saved
+        """
+        screen_shot, images = Screenshot._runOverlay(flags | constant.SHARED_MEMORY)
+        return screen_shot.sharedName
+
+    @staticmethod
+    def take_array(flags, rgb=False):
+        """
+        like take_screenshot(), needs numpy
+        :return: numpy.ndarray over the pixels of the saved image, see arrays.image_to_array(). None if nothing
+                 was saved
+        """
+        from pyqt_screenshot.arrays import image_to_array
+
+        screen_shot, images = Screenshot._runOverlay(flags)
+        return image_to_array(images[-1], rgb) if images else None
+
+    @staticmethod
+    def open_session(fileName, flags):
+        """ like take_screenshot(), but edit the session saved in fileName instead of a new grab """
+        from pyqt_screenshot.session import load_session
+
+        screen_shot, images = Screenshot._runOverlay(flags, load_session(fileName))
+        return screen_shot.target_img
+
+    def getToolBar(self):
+        if self.tooBar is None:
+            self.tooBar = MyToolBar(self.flags, self)
+            self.tooBar.trigger.connect(self.changeAction)
+        return self.tooBar
+
+    def getPenSetBar(self):
+        """ :return: PenSetWidget, None if no drawing tool is enabled """
+        if self.penSetBar is None and self.flags & (constant.RECT | constant.ELLIPSE | constant.LINE |
+                                                    constant.FREEPEN | constant.ARROW | constant.TEXT |
+                                                    constant.REDACT):
+            self.penSetBar = PenSetWidget(self)
+            self.penSetBar.penSizeTrigger.connect(self.changePenSize)
+            self.penSetBar.penColorTrigger.connect(self.changePenColor)
+            self.penSetBar.fontChangeTrigger.connect(self.changeFont)
+            self.penSetBar.redactModeTrigger.connect(self.changeRedactMode)
+            self.penSetBar.redactBlockSizeTrigger.connect(self.changeRedactBlockSize)
+        return self.penSetBar
+
+    def getTextInput(self):
+        if self.textInput is None:
+            self.textInput = TextInput(self)
+            self.textInput.inputChanged.connect(self.textChange)
+            self.textInput.cancelPressed.connect(self.cancelInput)
+            self.textInput.okPressed.connect(self.okInput)
+        return self.textInput
 
     def getscreenshot(self):
-        screen = QGuiApplication.screenAt(QCursor.pos())
-        self.screenPixel = screen.grabWindow(0)
+        if self.session is not None:
+            # the saved grab is shown from the top left of the screen under the cursor
+            # shown through the mapped image, the pixels are only read where they are painted
+            self.screenImage = self.session.image()
+            self.screenPixel = None
+            self.desktopGeometry = QRect(cursor_screen().geometry().topLeft(), self.session.geometry.size())
+            if self.desktopGeometry.isEmpty():
+                self.desktopGeometry.setSize(self.screenImage.size() / self.screenImage.devicePixelRatio())
+        elif self.virtualDesktop:
+            self.screenPixel, self.desktopGeometry = grab_virtual_desktop()
+        else:
+            screen = cursor_screen()
+            self.screenPixel = grab_screen(screen)
+            self.desktopGeometry = screen.geometry()
+        if self.session is None:
+            self.screenImage = self.screenPixel.toImage()
+
+    def requestEdges(self):
+        """
+        find the edges of the grab in the encoder pool, once per grab. started by the first mouse move over an
+        overlay without a selection, so captures that never need them pay nothing. nothing is suggested or
+        snapped without numpy
+        """
+        if self.edgeFuture is None:
+            from pyqt_screenshot.encoder import encoder_pool
+
+            self.edgeFuture = encoder_pool().submit(find_edges, QImage(self.screenImage), self.scale)
+
+    def edges(self, wait=False):
+        """
+        :param wait: wait for the edges requested by requestEdges()
+        :return: EdgeMap, None while it is computed or if it can not be
+        """
+        if self.edgeFuture is None or not (wait or self.edgeFuture.done()) or \
+                self.edgeFuture.exception() is not None:
+            return None
+        return self.edgeFuture.result()
+
+    def dragArea(self, start, end):
+        """
+        :type start: QPoint
+        :param start: where the selection was started
+        :type end: QPoint
+        :param end: the mouse position, the selection is dragged to it in any direction
+        :return: QRect, the area from start to end, both included, with every side snapped
+        """
+        return self.snapArea(QRect(start, end).normalized())
+
+    def snapArea(self, area, position=None):
+        """
+        :type area: QRect
+        :param position: MousePosition, the sides of area being dragged, all of them by default
+        :return: QRect, area normalized, with the dragged sides moved to the edges within ERRORRANGE of them.
+                 the left and top sides are the first pixels inside area, the right and bottom ones the last.
+                 each side is snapped to the edges crossing its middle
+        """
+        area = area.normalized()
+        edges = self.edges()
+        if edges is None:
+            return area
+        center = area.center()
+        left, top, right, bottom = area.left(), area.top(), area.right(), area.bottom()
+        if position in (None, MousePosition.ON_THE_LEFT_SIDE, MousePosition.ON_THE_TOP_LEFT_CORNER,
+                        MousePosition.ON_THE_BOTTOM_LEFT_CORNER):
+            left = edges.snapX(area.left(), center.y(), ERRORRANGE)
+        if position in (None, MousePosition.ON_THE_RIGHT_SIDE, MousePosition.ON_THE_TOP_RIGHT_CORNER,
+                        MousePosition.ON_THE_BOTTOM_RIGHT_CORNER):
+            right = edges.snapX(area.right() + 1, center.y(), ERRORRANGE) - 1
+        if position in (None, MousePosition.ON_THE_UP_SIDE, MousePosition.ON_THE_TOP_LEFT_CORNER,
+                        MousePosition.ON_THE_TOP_RIGHT_CORNER):
+            top = edges.snapY(area.top(), center.x(), ERRORRANGE)
+        if position in (None, MousePosition.ON_THE_DOWN_SIDE, MousePosition.ON_THE_BOTTOM_LEFT_CORNER,
+                        MousePosition.ON_THE_BOTTOM_RIGHT_CORNER):
+            bottom = edges.snapY(area.bottom() + 1, center.x(), ERRORRANGE) - 1
+        return QRect(QPoint(left, top), QPoint(right, bottom)).normalized()
+
+    def screenSceneRect(self, screen):
+        """ :return: QRectF, the part of the scene shown on screen """
+        return QRectF(screen.geometry().translated(-self.desktopGeometry.topLeft()))
+
+    def scenePoint(self, event):
+        """
+        :type event: QMouseEvent
+        :return: QPoint, the position of the event in the scene, whichever window it came from
+        """
+        return event.globalPos() - self.desktopGeometry.topLeft()
+
+    def sceneToGlobal(self, point):
+        return QPoint(point) + self.desktopGeometry.topLeft()
+
+    def setOverlayCursor(self, cursor):
+        self.setCursor(cursor)
+        for view in self.screenViews:
+            view.setCursor(cursor)
 
     def mousePressEvent(self, event):
         """
@@ -116,17 +491,30 @@ class Screenshot(QGraphicsView):
         if event.button() != Qt.LeftButton:
             return
 
+        self.flushMouseMove()
+        point = self.scenePoint(event)
+
         if self.action is None:
             self.action = ACTION_SELECT
 
-        self.startX, self.startY = event.x(), event.y()
+        self.startX, self.startY = point.x(), point.y()
+
+        # ctrl+click picks the annotation under the mouse, dragging moves it
+        self.pickedStep = None
+        if event.modifiers() & Qt.ControlModifier and self.selected_area != QRect():
+            self.pickedStep = self.annotationAt(point)
+            if self.pickedStep is not None:
+                self.pickedIndex = self.drawListResult.index(self.pickedStep)
+                self.mousePressed = True
+                self.movingPicked = True
+                self.pickedMoved = False
+                self.redraw()
+                return
 
         if self.action == ACTION_SELECT:
             if self.mousePosition == MousePosition.OUTSIDE_AREA:
                 self.mousePressed = True
-                self.selected_area = QRect()
-                self.selected_area.setTopLeft(QPoint(event.x(), event.y()))
-                self.selected_area.setBottomRight(QPoint(event.x(), event.y()))
+                self.selected_area = QRect(point, point)
                 self.redraw()
             elif self.mousePosition == MousePosition.INSIDE_AREA:
                 self.mousePressed = True
@@ -134,20 +522,20 @@ class Screenshot(QGraphicsView):
                 pass
         elif self.action == ACTION_MOVE_SELECTED:
             if self.mousePosition == MousePosition.OUTSIDE_AREA:
+                self.history.push(ClearSelectionCommand(self))
                 self.action = ACTION_SELECT
                 self.selected_area = QRect()
-                self.selected_area.setTopLeft(QPoint(event.x(), event.y()))
-                self.selected_area.setBottomRight(QPoint(event.x(), event.y()))
+                self.selected_area.setTopLeft(QPoint(point.x(), point.y()))
+                self.selected_area.setBottomRight(QPoint(point.x(), point.y()))
                 self.redraw()
             self.mousePressed = True
         elif self.action in DRAW_ACTION:
             self.mousePressed = True
             if self.action == ACTION_FREEPEN:
-                self.pointPath = QPainterPath()
-                self.pointPath.moveTo(QPoint(event.x(), event.y()))
+                self.startFreeLine(point.x(), point.y())
             elif self.action == ACTION_TEXT:
                 if self.textPosition is None:
-                    self.textPosition = QPoint(event.x(), event.y())
+                    self.textPosition = QPoint(point.x(), point.y())
                     self.textRect = None
                     self.redraw()
 
@@ -157,114 +545,149 @@ class Screenshot(QGraphicsView):
         :param event:
         :return:
         """
-        self.mousePoint = QPoint(event.globalPos().x(), event.globalPos().y())
+        # only the latest position is kept until the next frame, except for the free pen,
+        # which needs every point of the stroke
+        if self.pendingMove is not None:
+            self.frameStats['moves_dropped'] += 1
+        point = self.scenePoint(event)
+        self.pendingMove = (point, QPoint(event.globalPos()))
+        if self.mousePressed and self.action == ACTION_FREEPEN and not self.movingPicked:
+            self.freePenTo(point.x(), point.y())
+        self.scheduleRedraw()
+
+    def flushMouseMove(self):
+        """ apply the latest coalesced mouse move, if there is one """
+        if self.pendingMove is None:
+            return
+        pos, globalPos = self.pendingMove
+        self.pendingMove = None
+        self.handleMouseMove(pos, globalPos)
+
+    def handleMouseMove(self, pos, globalPos):
+        """
+        :type pos: QPoint
+        :param pos: the mouse position in the scene
+        :type globalPos: QPoint
+        :param globalPos: the mouse position on the screen
+        """
+        self.mousePoint = QPoint(globalPos)
 
         if self.action is None:
             self.action = ACTION_SELECT
 
         if not self.mousePressed:
-            point = QPoint(event.x(), event.y())
+            point = QPoint(pos.x(), pos.y())
             self.detect_mouse_position(point)
             self.setCursorStyle()
-            self.redraw()
+            if QGuiApplication.keyboardModifiers() & Qt.ControlModifier and self.annotationAt(point) is not None:
+                self.setOverlayCursor(Qt.SizeAllCursor)
+            if self.action == ACTION_SELECT and self.selected_area == QRect():
+                self.requestEdges()
+                edges = self.edges()
+                if edges is not None:
+                    self.suggestedArea = edges.enclosingRect(point.x(), point.y())
         else:
-            self.endX, self.endY = event.x(), event.y()
+            self.endX, self.endY = pos.x(), pos.y()
 
             # if self.mousePosition != OUTSIDE_AREA:
             #    self.action = ACTION_MOVE_SELECTED
 
-            if self.action == ACTION_SELECT:
-                self.selected_area.setBottomRight(QPoint(event.x(), event.y()))
-                self.redraw()
+            if self.movingPicked:
+                self.movePickedAnnotation(pos.x() - self.startX, pos.y() - self.startY)
+                self.startX, self.startY = pos.x(), pos.y()
+            elif self.action == ACTION_SELECT:
+                self.selected_area = self.dragArea(QPoint(self.startX, self.startY), pos)
             elif self.action == ACTION_MOVE_SELECTED:
                 self.selected_area = QRect(self.selectedAreaRaw)
 
                 if self.mousePosition == MousePosition.INSIDE_AREA:
-                    move_to_x = event.x() - self.startX + self.selected_area.left()
-                    move_to_y = event.y() - self.startY + self.selected_area.top()
-                    if 0 <= move_to_x <= self.screenPixel.width() - 1 - self.selected_area.width():
+                    move_to_x = pos.x() - self.startX + self.selected_area.left()
+                    move_to_y = pos.y() - self.startY + self.selected_area.top()
+                    if 0 <= move_to_x <= self.graphics_scene.width() - 1 - self.selected_area.width():
                         self.selected_area.moveLeft(move_to_x)
-                    if 0 <= move_to_y <= self.screenPixel.height() - 1 - self.selected_area.height():
+                    if 0 <= move_to_y <= self.graphics_scene.height() - 1 - self.selected_area.height():
                         self.selected_area.moveTop(move_to_y)
                     self.selected_area = self.selected_area.normalized()
                     self.selectedAreaRaw = QRect(self.selected_area)
-                    self.startX, self.startY = event.x(), event.y()
-                    self.redraw()
+                    self.startX, self.startY = pos.x(), pos.y()
                 elif self.mousePosition == MousePosition.ON_THE_LEFT_SIDE:
-                    move_to_x = event.x() - self.startX + self.selected_area.left()
+                    move_to_x = pos.x() - self.startX + self.selected_area.left()
                     if move_to_x <= self.selected_area.right():
                         self.selected_area.setLeft(move_to_x)
                         self.selected_area = self.selected_area.normalized()
-                        self.redraw()
                 elif self.mousePosition == MousePosition.ON_THE_RIGHT_SIDE:
-                    move_to_x = event.x() - self.startX + self.selected_area.right()
+                    move_to_x = pos.x() - self.startX + self.selected_area.right()
                     self.selected_area.setRight(move_to_x)
                     self.selected_area = self.selected_area.normalized()
-                    self.redraw()
                 elif self.mousePosition == MousePosition.ON_THE_UP_SIDE:
-                    move_to_y = event.y() - self.startY + self.selected_area.top()
+                    move_to_y = pos.y() - self.startY + self.selected_area.top()
                     self.selected_area.setTop(move_to_y)
                     self.selected_area = self.selected_area.normalized()
-                    self.redraw()
                 elif self.mousePosition == MousePosition.ON_THE_DOWN_SIDE:
-                    move_to_y = event.y() - self.startY + self.selected_area.bottom()
+                    move_to_y = pos.y() - self.startY + self.selected_area.bottom()
                     self.selected_area.setBottom(move_to_y)
                     self.selected_area = self.selected_area.normalized()
-                    self.redraw()
                 elif self.mousePosition == MousePosition.ON_THE_TOP_LEFT_CORNER:
-                    move_to_x = event.x() - self.startX + self.selected_area.left()
-                    move_to_y = event.y() - self.startY + self.selected_area.top()
+                    move_to_x = pos.x() - self.startX + self.selected_area.left()
+                    move_to_y = pos.y() - self.startY + self.selected_area.top()
                     self.selected_area.setTopLeft(QPoint(move_to_x, move_to_y))
                     self.selected_area = self.selected_area.normalized()
-                    self.redraw()
                 elif self.mousePosition == MousePosition.ON_THE_BOTTOM_RIGHT_CORNER:
-                    move_to_x = event.x() - self.startX + self.selected_area.right()
-                    move_to_y = event.y() - self.startY + self.selected_area.bottom()
+                    move_to_x = pos.x() - self.startX + self.selected_area.right()
+                    move_to_y = pos.y() - self.startY + self.selected_area.bottom()
                     self.selected_area.setBottomRight(QPoint(move_to_x, move_to_y))
                     self.selected_area = self.selected_area.normalized()
-                    self.redraw()
                 elif self.mousePosition == MousePosition.ON_THE_TOP_RIGHT_CORNER:
-                    move_to_x = event.x() - self.startX + self.selected_area.right()
-                    move_to_y = event.y() - self.startY + self.selected_area.top()
+                    move_to_x = pos.x() - self.startX + self.selected_area.right()
+                    move_to_y = pos.y() - self.startY + self.selected_area.top()
                     self.selected_area.setTopRight(QPoint(move_to_x, move_to_y))
                     self.selected_area = self.selected_area.normalized()
-                    self.redraw()
                 elif self.mousePosition == MousePosition.ON_THE_BOTTOM_LEFT_CORNER:
-                    move_to_x = event.x() - self.startX + self.selected_area.left()
-                    move_to_y = event.y() - self.startY + self.selected_area.bottom()
+                    move_to_x = pos.x() - self.startX + self.selected_area.left()
+                    move_to_y = pos.y() - self.startY + self.selected_area.bottom()
                     self.selected_area.setBottomLeft(QPoint(move_to_x, move_to_y))
-                    self.redraw()
                 else:
                     pass
+                if self.mousePosition != MousePosition.INSIDE_AREA:
+                    self.selected_area = self.snapArea(self.selected_area, self.mousePosition)
             elif self.action == ACTION_RECT:
-                self.drawRect(self.startX, self.startY, event.x(), event.y(), False)
-                self.redraw()
-                pass
+                self.drawRect(self.startX, self.startY, pos.x(), pos.y(), False)
             elif self.action == ACTION_ELLIPSE:
-                self.drawEllipse(self.startX, self.startY, event.x(), event.y(), False)
-                self.redraw()
+                self.drawEllipse(self.startX, self.startY, pos.x(), pos.y(), False)
             elif self.action == ACTION_ARROW:
-                self.drawArrow(self.startX, self.startY, event.x(), event.y(), False)
-                self.redraw()
+                self.drawArrow(self.startX, self.startY, pos.x(), pos.y(), False)
             elif self.action == ACTION_LINE:
-                self.drawLine(self.startX, self.startY, event.x(), event.y(), False)
-                self.redraw()
-            elif self.action == ACTION_FREEPEN:
-                y1, y2 = event.x(), event.y()
-                rect = self.selected_area.normalized()
-                if y1 <= rect.left():
-                    y1 = rect.left()
-                elif y1 >= rect.right():
-                    y1 = rect.right()
-
-                if y2 <= rect.top():
-                    y2 = rect.top()
-                elif y2 >= rect.bottom():
-                    y2 = rect.bottom()
-
-                self.pointPath.lineTo(y1, y2)
-                self.drawFreeLine(self.pointPath, False)
-                self.redraw()
+                self.drawLine(self.startX, self.startY, pos.x(), pos.y(), False)
+            elif self.action == ACTION_REDACT:
+                self.drawRedact(self.startX, self.startY, pos.x(), pos.y(), False)
+
+    def startFreeLine(self, x, y):
+        self.removeSceneItem(self.strokeItem)
+        bounds = QRectF(self.selected_area.normalized()).united(QRectF(x, y, 1, 1))
+        self.strokeItem = self.addSceneItem(StrokeItem(x, y, self.penStyle(), bounds), Z_PROCESS, 'process')
+
+    def freePenTo(self, x, y, force=False):
+        """
+        extend the free pen stroke to (x, y), kept inside the selected area.
+        the stroke item grows in place, only the new segment is repainted
+        """
+        if self.strokeItem is None:
+            return
+
+        rect = self.selected_area.normalized()
+        if x <= rect.left():
+            x = rect.left()
+        elif x >= rect.right():
+            x = rect.right()
+
+        if y <= rect.top():
+            y = rect.top()
+        elif y >= rect.bottom():
+            y = rect.bottom()
+
+        segment = self.strokeItem.addPoint(x, y, force)
+        if segment is not None:
+            self.markDirty(segment)
 
     def mouseReleaseEvent(self, event):
         """
@@ -275,12 +698,24 @@ class Screenshot(QGraphicsView):
         if event.button() != Qt.LeftButton:
             return
 
+        self.flushMouseMove()
+        point = self.scenePoint(event)
+
         if self.mousePressed:
             self.mousePressed = False
-            self.endX, self.endY = event.x(), event.y()
+            self.endX, self.endY = point.x(), point.y()
 
-            if self.action == ACTION_SELECT:
-                self.selected_area.setBottomRight(QPoint(event.x(), event.y()))
+            if self.movingPicked:
+                self.movePickedAnnotation(point.x() - self.startX, point.y() - self.startY)
+                self.movingPicked = False
+                self.redraw()
+            elif self.action == ACTION_SELECT:
+                if point == QPoint(self.startX, self.startY) and not self.suggestedArea.isEmpty():
+                    # a click without dragging selects the suggested rectangle
+                    self.selected_area = QRect(self.suggestedArea)
+                else:
+                    self.selected_area = self.dragArea(QPoint(self.startX, self.startY), point)
+                self.suggestedArea = QRect()
                 self.selectedAreaRaw = QRect(self.selected_area)
                 self.action = ACTION_MOVE_SELECTED
                 self.redraw()
@@ -289,19 +724,23 @@ class Screenshot(QGraphicsView):
                 self.redraw()
                 # self.action = None
             elif self.action == ACTION_RECT:
-                self.drawRect(self.startX, self.startY, event.x(), event.y(), True)
+                self.drawRect(self.startX, self.startY, point.x(), point.y(), True)
                 self.redraw()
             elif self.action == ACTION_ELLIPSE:
-                self.drawEllipse(self.startX, self.startY, event.x(), event.y(), True)
+                self.drawEllipse(self.startX, self.startY, point.x(), point.y(), True)
                 self.redraw()
             elif self.action == ACTION_ARROW:
-                self.drawArrow(self.startX, self.startY, event.x(), event.y(), True)
+                self.drawArrow(self.startX, self.startY, point.x(), point.y(), True)
                 self.redraw()
             elif self.action == ACTION_LINE:
-                self.drawLine(self.startX, self.startY, event.x(), event.y(), True)
+                self.drawLine(self.startX, self.startY, point.x(), point.y(), True)
+                self.redraw()
+            elif self.action == ACTION_REDACT:
+                self.drawRedact(self.startX, self.startY, point.x(), point.y(), True)
                 self.redraw()
             elif self.action == ACTION_FREEPEN:
-                self.drawFreeLine(self.pointPath, True)
+                self.freePenTo(point.x(), point.y(), True)
+                self.drawFreeLine()
                 self.redraw()
 
     def detect_mouse_position(self, point):
@@ -345,338 +784,572 @@ class Screenshot(QGraphicsView):
 
     def setCursorStyle(self):
         if self.action in DRAW_ACTION:
-            self.setCursor(Qt.CrossCursor)
+            self.setOverlayCursor(Qt.CrossCursor)
             return
 
         if self.mousePosition == MousePosition.ON_THE_LEFT_SIDE or \
                 self.mousePosition == MousePosition.ON_THE_RIGHT_SIDE:
 
-            self.setCursor(Qt.SizeHorCursor)
+            self.setOverlayCursor(Qt.SizeHorCursor)
         elif self.mousePosition == MousePosition.ON_THE_UP_SIDE or \
                 self.mousePosition == MousePosition.ON_THE_DOWN_SIDE:
 
-            self.setCursor(Qt.SizeVerCursor)
+            self.setOverlayCursor(Qt.SizeVerCursor)
         elif self.mousePosition == MousePosition.ON_THE_TOP_LEFT_CORNER or \
                 self.mousePosition == MousePosition.ON_THE_BOTTOM_RIGHT_CORNER:
 
-            self.setCursor(Qt.SizeFDiagCursor)
+            self.setOverlayCursor(Qt.SizeFDiagCursor)
         elif self.mousePosition == MousePosition.ON_THE_TOP_RIGHT_CORNER or \
                 self.mousePosition == MousePosition.ON_THE_BOTTOM_LEFT_CORNER:
 
-            self.setCursor(Qt.SizeBDiagCursor)
+            self.setOverlayCursor(Qt.SizeBDiagCursor)
         elif self.mousePosition == MousePosition.OUTSIDE_AREA:
-            self.setCursor(Qt.ArrowCursor)
+            self.setOverlayCursor(Qt.ArrowCursor)
         elif self.mousePosition == MousePosition.INSIDE_AREA:
-            self.setCursor(Qt.OpenHandCursor)
+            self.setOverlayCursor(Qt.OpenHandCursor)
         else:
-            self.setCursor(Qt.ArrowCursor)
+            self.setOverlayCursor(Qt.ArrowCursor)
             pass
 
     def drawMagnifier(self):
-        # First, calculate the magnifier position due to the mouse position
-        watch_area_width = 16
-        watch_area_height = 16
-
-        cursor_pos = self.mousePoint
-
-        watch_area = QRect(QPoint(cursor_pos.x() - watch_area_width / 2, cursor_pos.y() - watch_area_height / 2),
-                          QPoint(cursor_pos.x() + watch_area_width / 2, cursor_pos.y() + watch_area_height / 2))
-        if watch_area.left() < 0:
-            watch_area.moveLeft(0)
-            watch_area.moveRight(watch_area_width)
-        if self.mousePoint.x() + watch_area_width / 2 >= self.screenPixel.width():
-            watch_area.moveRight(self.screenPixel.width() - 1)
-            watch_area.moveLeft(watch_area.right() - watch_area_width)
-        if self.mousePoint.y() - watch_area_height / 2 < 0:
-            watch_area.moveTop(0)
-            watch_area.moveBottom(watch_area_height)
-        if self.mousePoint.y() + watch_area_height / 2 >= self.screenPixel.height():
-            watch_area.moveBottom(self.screenPixel.height() - 1)
-            watch_area.moveTop(watch_area.bottom() - watch_area_height)
-
-        # tricks to solve the hidpi impact on QCursor.pos()
-        watch_area.setTopLeft(QPoint(watch_area.topLeft().x() * self.scale, watch_area.topLeft().y() * self.scale))
-        watch_area.setBottomRight(
-            QPoint(watch_area.bottomRight().x() * self.scale, watch_area.bottomRight().y() * self.scale))
-        watch_area_pixmap = self.screenPixel.copy(watch_area)
-
-        # second, calculate the magnifier area
-        magnifier_area_width = watch_area_width * 10
-        magnifier_area_height = watch_area_height * 10
-        font_area_height = 40
-
-        cursor_size = 24
-        magnifier_area = QRectF(QPoint(QCursor.pos().x() + cursor_size, QCursor.pos().y() + cursor_size),
-                               QPoint(QCursor.pos().x() + cursor_size + magnifier_area_width,
-                                      QCursor.pos().y() + cursor_size + magnifier_area_height))
-        if magnifier_area.right() >= self.screenPixel.width():
-            magnifier_area.moveLeft(QCursor.pos().x() - magnifier_area_width - cursor_size / 2)
-        if magnifier_area.bottom() + font_area_height >= self.screenPixel.height():
-            magnifier_area.moveTop(QCursor.pos().y() - magnifier_area_height - cursor_size / 2 - font_area_height)
-
-        # third, draw the watch area to magnifier area
-        watch_area_scaled = watch_area_pixmap.scaled(
-            QSize(magnifier_area_width * self.scale, magnifier_area_height * self.scale))
-        magnifier_pixmap = self.graphics_scene.addPixmap(watch_area_scaled)
-        magnifier_pixmap.setOffset(magnifier_area.topLeft())
-
-        # then draw lines and text
-        self.graphics_scene.addRect(QRectF(magnifier_area), QPen(QColor(255, 255, 255), 2))
-        self.graphics_scene.addLine(QLineF(QPointF(magnifier_area.center().x(), magnifier_area.top()),
-                                           QPointF(magnifier_area.center().x(), magnifier_area.bottom())),
-                                    QPen(QColor(0, 255, 255), 2))
-        self.graphics_scene.addLine(QLineF(QPointF(magnifier_area.left(), magnifier_area.center().y()),
-                                           QPointF(magnifier_area.right(), magnifier_area.center().y())),
-                                    QPen(QColor(0, 255, 255), 2))
-
-        # get the rgb of mouse point
-        point_rgb = QColor(self.screenPixel.toImage().pixel(self.mousePoint))
-
-        # draw information
-        self.graphics_scene.addRect(QRectF(magnifier_area.bottomLeft(),
-                                           magnifier_area.bottomRight() + QPoint(0, font_area_height + 30)),
-                                    Qt.black,
-                                    QBrush(Qt.black))
-        rgb_info = self.graphics_scene.addSimpleText(
-            ' Rgb: ({0}, {1}, {2})'.format(point_rgb.red(), point_rgb.green(), point_rgb.blue()))
-        rgb_info.setPos(magnifier_area.bottomLeft() + QPoint(0, 5))
-        rgb_info.setPen(QPen(QColor(255, 255, 255), 2))
-
         rect = self.selected_area.normalized()
-        size_info = self.graphics_scene.addSimpleText(
-            ' Size: {0} x {1}'.format(rect.width() * self.scale, rect.height() * self.scale))
-        size_info.setPos(magnifier_area.bottomLeft() + QPoint(0, 15) + QPoint(0, font_area_height / 2))
-        size_info.setPen(QPen(QColor(255, 255, 255), 2))
+        self.magnifier.moveTo(QPointF(self.mousePoint - self.desktopGeometry.topLeft()),
+                              self.graphics_scene.sceneRect())
+        size = self.deviceSelection().size()
+        self.magnifier.setSelectionSize(size.width(), size.height())
+        self.magnifier.show()
 
     def get_scale(self):
-        return self.devicePixelRatio()
+        return self.screenImage.devicePixelRatio()
+
+    def deviceSelection(self):
+        """ :return: QRect, the selected area in the device pixels of the grab, the area that is saved """
+        return crop_rect(self.selected_area, QRect(QPoint(0, 0), self.desktopGeometry.size()), self.scale)
+
+    def screenArray(self, rect=None, rgb=False):
+        """
+        the grab as numpy.ndarray sharing its pixels, needs numpy
+        :type rect: QRect
+        :param rect: an area in logical pixels, the selected area by default
+        :return: numpy.ndarray, the part of the grab inside rect in device pixels, see arrays.region_array()
+        """
+        from pyqt_screenshot.arrays import region_array
+
+        area = self.selected_area if rect is None else rect
+        return region_array(self.screenImage, crop_rect(area, QRect(QPoint(0, 0), self.desktopGeometry.size()),
+                                                        self.scale), rgb)
 
     def saveScreenshot(self, clipboard=False, fileName='screenshot.png', picType='png'):
-        fullWindow = QRect(0, 0, self.width() - 1, self.height() - 1)
-        selected = QRect(self.selected_area)
-        if selected.left() < 0:
-            selected.setLeft(0)
-        if selected.right() >= self.width():
-            selected.setRight(self.width() - 1)
-        if selected.top() < 0:
-            selected.setTop(0)
-        if selected.bottom() >= self.height():
-            selected.setBottom(self.height() - 1)
-
-        source = (fullWindow & selected)
-        source.setTopLeft(QPoint(source.topLeft().x() * self.scale, source.topLeft().y() * self.scale))
-        source.setBottomRight(QPoint(source.bottomRight().x() * self.scale, source.bottomRight().y() * self.scale))
-        image = self.screenPixel.copy(source)
+        # the encoder pool, the clipboard holder and shared memory are only imported once something is saved,
+        # importing them all with this module slowed down the hotkey to overlay time
+        from pyqt_screenshot.encoder import encode_async, encoder_pool
+        from pyqt_screenshot.clipboard import hold_clipboard, needs_holder
+        from pyqt_screenshot.shared import publish_image
+
+        source = self.deviceSelection()
+        # the only copy of the pixels, the crop outlives the grab in the clipboard and the encoder pool
+        image = self.screenImage.copy(source)
+        render_annotations(image, self.drawListResult, logical_point(source.topLeft(), self.scale), self.scale)
 
         if clipboard:
-            QGuiApplication.clipboard().setImage(QImage(image), QClipboard.Clipboard)
+            self.saveFuture = None
+            if self.copyToClipboard:
+                QGuiApplication.clipboard().setImage(image, QClipboard.Clipboard)
+                # the clipboard of x11 and wayland loses the image when this process exits, a holder takes it over
+                if self.holdClipboard and needs_holder():
+                    self.saveFuture = encoder_pool().submit(hold_clipboard, QImage(image))
+        elif self.tileStore is not None:
+            # only the tiles the store does not have yet are written, fileName is not used
+            self.saveFuture = encoder_pool().submit(self.tileStore.put, QImage(image))
+            self.saveFuture.add_done_callback(self.encodeFinished)
         else:
-            image.save(fileName, picType, 10)
-        self.target_img = image
+            # encoding and writing happen in the encoder pool, the overlay does not wait for them
+            self.saveFuture = encode_async(image, fileName, picType, self.encoderProfile)
+            self.saveFuture.add_done_callback(self.encodeFinished)
+        if self.flags & constant.SHARED_MEMORY:
+            self.releaseShared()
+            self.sharedName = publish_image(image)
+            self.screen_shot_shared.emit(self.sharedName)
+        self.target_img = QPixmap.fromImage(image)
         self.screen_shot_grabed.emit(QImage(image))
+        return self.saveFuture
 
-    def redraw(self):
-        self.graphics_scene.clear()
+    def releaseShared(self):
+        """
+        free the block the last result was published to. a reader that did not come for it by the next save or
+        reset() will not, the blocks would stay until reboot otherwise
+        """
+        if self.sharedName is not None:
+            from pyqt_screenshot.shared import unlink_shared
 
-        # draw screenshot
-        self.graphics_scene.addPixmap(self.screenPixel)
+            unlink_shared(self.sharedName)
+            self.sharedName = None
+
+    def saveSession(self, fileName):
+        """
+        write the grab, the selected area and the annotations to fileName, in the encoder pool
+        :return: concurrent.futures.Future resolving to the absolute path of the file
+        """
+        from pyqt_screenshot.encoder import encoder_pool
+        from pyqt_screenshot.session import save_session
+
+        self.sessionFuture = encoder_pool().submit(save_session, fileName, self.screenImage,
+                                                   list(self.drawListResult), QRect(self.selected_area),
+                                                   QRect(self.desktopGeometry))
+        return self.sessionFuture
+
+    def restoreSession(self):
+        """ continue editing where the session was saved """
+        self.drawListResult = self.session.annotations(self.stylePool)
+        self.selected_area = QRect(self.session.selection)
+        self.selectedAreaRaw = QRect(self.selected_area)
+        if self.selected_area != QRect():
+            self.action = ACTION_MOVE_SELECTED
+
+    def encodeFinished(self, future):
+        """ called in the encoder pool, the signal is queued to the gui thread """
+        if future.exception() is None:
+            result = future.result()
+            self.screen_shot_saved.emit(result.path, result.size, result.duration)
+
+    def initOverlayItems(self):
+        """ create the overlay chrome once, redraw() only updates its geometry """
+        self.backgroundItem = self.addSceneItem(ImageItem(self.screenImage), Z_BACKGROUND, 'overlay')
+
+        # the picture mask, top, left, right and bottom of the selected area
+        mask = QBrush(QColor(0, 0, 0, 155))
+        self.maskItems = []
+        for i in range(4):
+            item = QGraphicsRectItem()
+            item.setPen(QPen(Qt.NoPen))
+            item.setBrush(mask)
+            self.maskItems.append(self.addSceneItem(item, Z_MASK, 'overlay'))
+
+        # the selected rectangle and its drag points
+        pen = QPen(QColor(0, 255, 255), 2)
+        brush = QBrush(QColor(0, 255, 255))
+        self.selectionItem = QGraphicsRectItem()
+        self.selectionItem.setPen(pen)
+        self.addSceneItem(self.selectionItem, Z_SELECTION, 'overlay')
+        self.handleItems = []
+        for i in range(8):
+            item = QGraphicsEllipseItem()
+            item.setPen(pen)
+            item.setBrush(brush)
+            self.handleItems.append(self.addSceneItem(item, Z_SELECTION, 'overlay'))
+
+        # the size information on the top left corner
+        self.sizeInfoBackground = QGraphicsRectItem()
+        self.sizeInfoBackground.setPen(QPen(Qt.white))
+        self.sizeInfoBackground.setBrush(QBrush(Qt.black))
+        self.addSceneItem(self.sizeInfoBackground, Z_INFO, 'overlay')
+        self.sizeInfoText = QGraphicsSimpleTextItem()
+        self.sizeInfoText.setPen(QPen(QColor(255, 255, 255), 2))
+        self.addSceneItem(self.sizeInfoText, Z_INFO, 'overlay')
+
+        self.magnifier = Magnifier()
+        self.magnifier.setSource(self.screenImage)
+        self.magnifier.hide()
+        self.addSceneItem(self.magnifier, Z_MAGNIFIER, 'overlay')
+
+        # the frame around the picked annotation
+        self.pickedItem = QGraphicsRectItem()
+        self.pickedItem.setPen(QPen(QColor(0, 255, 255), 1, Qt.DashLine))
+        self.pickedItem.hide()
+        self.addSceneItem(self.pickedItem, Z_SELECTION, 'overlay')
+
+        # the rectangle that a click selects
+        self.suggestionItem = QGraphicsRectItem()
+        self.suggestionItem.setPen(QPen(QColor(0, 255, 255), 1, Qt.DashLine))
+        self.suggestionItem.hide()
+        self.addSceneItem(self.suggestionItem, Z_SELECTION, 'overlay')
+
+        self.items_to_remove = [self.selectionItem] + self.handleItems + \
+                               [self.sizeInfoBackground, self.sizeInfoText, self.magnifier, self.pickedItem,
+                                self.suggestionItem]
+
+    def addSceneItem(self, item, z, kind):
+        """
+        :param item: QGraphicsItem, added to the scene if it is not there yet
+        :param kind: the key in self.itemStats this creation is counted in
+        """
+        item.setZValue(z)
+        if item.scene() is None:
+            self.graphics_scene.addItem(item)
+        self.itemStats[kind] += 1
+        self.markItemDirty(item)
+        return item
+
+    def removeSceneItem(self, item):
+        if item is not None and item.scene() is not None:
+            self.markItemDirty(item)
+            self.graphics_scene.removeItem(item)
+
+    def markDirty(self, rect):
+        """
+        :type rect: QRectF
+        :param rect: an area of the scene that has to be repainted with the next frame
+        """
+        if not rect.isEmpty():
+            self.dirtyRegion += rect.adjusted(-2, -2, 2, 2).toAlignedRect()
+
+    def markItemDirty(self, item):
+        if item.isVisible():
+            self.markDirty(item.sceneBoundingRect())
+
+    def markSelectionDirty(self, old, new):
+        """
+        :type old: QRectF
+        :type new: QRectF
+        :param old: the selected area on the screen now, null if there is none
+        :param new: the selected area to be shown
+        """
+        # the mask only changes where exactly one of both areas is
+        self.dirtyRegion += QRegion(old.toAlignedRect()).xored(QRegion(new.toAlignedRect()))
+
+        # the frame and the drag points are a band along the border
+        margin = 8
+        for rect in (old, new):
+            if not rect.isNull():
+                outer = rect.adjusted(-margin, -margin, margin, margin).toAlignedRect()
+                inner = rect.adjusted(margin, margin, -margin, -margin).toAlignedRect()
+                self.dirtyRegion += QRegion(outer).subtracted(QRegion(inner))
+
+    def updateViewport(self):
+        """ repaint the dirty parts of the scene collected since the last frame, on every window """
+        for view in [self] + self.screenViews:
+            viewport = view.viewport()
+            self.frameStats['viewport_pixels'] += viewport.width() * viewport.height()
+
+            if self.fullRepaint:
+                self.frameStats['repainted_pixels'] += viewport.width() * viewport.height()
+                viewport.update()
+                continue
+
+            offset = view.mapFromScene(QPointF(0, 0))
+            region = self.dirtyRegion.translated(offset) & QRegion(viewport.rect())
+            if region.isEmpty():
+                continue
+
+            self.frameStats['repainted_pixels'] += sum(rect.width() * rect.height() for rect in region.rects())
+            viewport.update(region)
+
+        self.fullRepaint = False
+        self.dirtyRegion = QRegion()
+
+    def setMaxFps(self, fps):
+        self.maxFps = max(1, fps)
+
+    def scheduleRedraw(self):
+        """ mark the overlay dirty, it is rendered by renderFrame() at most once per frame """
+        self.frameStats['requested'] += 1
+        if self.redrawTimer.isActive():
+            return
+
+        interval = 1000 / self.maxFps
+        elapsed = self.lastFrame.elapsed() if self.lastFrame.isValid() else interval
+        self.redrawTimer.start(int(max(0, interval - elapsed)))
+
+    def renderFrame(self):
+        self.flushMouseMove()
+        self.redraw()
+
+    def redraw(self):
+        self.redrawTimer.stop()
+        self.frameStats['rendered'] += 1
+        self.lastFrame.start()
 
         # prepare for drawing selected area
         rect = QRectF(self.selected_area)
         rect = rect.normalized()
 
-        top_left_point = rect.topLeft()
-        top_right_point = rect.topRight()
-        bottom_left_point = rect.bottomLeft()
-        bottom_right_point = rect.bottomRight()
-        top_middle_point = (top_left_point + top_right_point) / 2
-        left_middle_point = (top_left_point + bottom_left_point) / 2
-        bottom_middle_point = (bottom_left_point + bottom_right_point) / 2
-        right_middle_point = (top_right_point + bottom_right_point) / 2
+        # the items moved around below are repainted where they were and where they end up
+        floatingItems = [self.magnifier, self.sizeInfoBackground, self.sizeInfoText, self.suggestionItem]
+        for item in floatingItems:
+            self.markItemDirty(item)
 
         # draw the picture mask
-        mask = QColor(0, 0, 0, 155)
-
-        if self.selected_area == QRect():
-            self.graphics_scene.addRect(0, 0, self.screenPixel.width(), self.screenPixel.height(), QPen(Qt.NoPen), mask)
-        else:
-            self.graphics_scene.addRect(0, 0, self.screenPixel.width(), top_right_point.y(), QPen(Qt.NoPen), mask)
-            self.graphics_scene.addRect(0, top_left_point.y(), top_left_point.x(), rect.height(), QPen(Qt.NoPen), mask)
-            self.graphics_scene.addRect(top_right_point.x(), top_right_point.y(),
-                                        self.screenPixel.width() - top_right_point.x(),
-                                        rect.height(),
-                                        QPen(Qt.NoPen),
-                                        mask)
-            self.graphics_scene.addRect(0, bottom_left_point.y(),
-                                        self.screenPixel.width(), self.screenPixel.height() - bottom_left_point.y(),
-                                        QPen(Qt.NoPen), mask)
+        self.updateMask(rect)
 
         # draw the toolBar
         if self.action != ACTION_SELECT:
             spacing = 5
             # show the toolbar first, then move it to the correct position
             # because the width of it may be wrong if this is the first time it shows
-            self.tooBar.show()
+            self.getToolBar().show()
+            self.getPenSetBar()
 
             dest = QPointF(rect.bottomRight() - QPointF(self.tooBar.width(), 0) - QPointF(spacing, -spacing))
             if dest.x() < spacing:
                 dest.setX(spacing)
             pen_set_bar_height = self.penSetBar.height() if self.penSetBar is not None else 0
-            if dest.y() + self.tooBar.height() + pen_set_bar_height >= self.height():
+            if dest.y() + self.tooBar.height() + pen_set_bar_height >= self.graphics_scene.height():
                 if rect.top() - self.tooBar.height() - pen_set_bar_height < spacing:
                     dest.setY(rect.top() + spacing)
                 else:
                     dest.setY(rect.top() - self.tooBar.height() - pen_set_bar_height - spacing)
 
-            self.tooBar.move(dest.toPoint())
+            self.tooBar.move(self.sceneToGlobal(dest.toPoint()))
 
             if self.penSetBar is not None:
                 self.penSetBar.show()
-                self.penSetBar.move(dest.toPoint() + QPoint(0, self.tooBar.height() + spacing))
+                self.penSetBar.move(self.sceneToGlobal(dest.toPoint() + QPoint(0, self.tooBar.height() + spacing)))
 
                 if self.action == ACTION_TEXT:
                     self.penSetBar.showFontWidget()
+                elif self.action == ACTION_REDACT:
+                    self.penSetBar.showRedactWidget()
                 else:
                     self.penSetBar.showPenWidget()
         else:
-            self.tooBar.hide()
+            if self.tooBar is not None:
+                self.tooBar.hide()
 
             if self.penSetBar is not None:
                 self.penSetBar.hide()
 
         # draw the list
-        for step in self.drawListResult:
-            self.drawOneStep(step)
+        self.updateAnnotationItems()
 
+        self.removeSceneItem(self.processItem)
+        self.processItem = None
         if self.drawListProcess is not None:
-            self.drawOneStep(self.drawListProcess)
+            self.processItem = self.drawOneStep(self.drawListProcess)
+            if self.processItem is not None:
+                self.addSceneItem(self.processItem, Z_PROCESS, 'process')
             if self.action != ACTION_TEXT:
                 self.drawListProcess = None
 
-        if self.selected_area != QRect():
-            self.items_to_remove = []
-
-            # draw the selected rectangle
-            pen = QPen(QColor(0, 255, 255), 2)
-            self.items_to_remove.append(self.graphics_scene.addRect(rect, pen))
-
-            # draw the drag point
-            radius = QPoint(3, 3)
-            brush = QBrush(QColor(0, 255, 255))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(top_left_point - radius, top_left_point + radius), pen, brush))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(top_middle_point - radius, top_middle_point + radius), pen, brush))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(top_right_point - radius, top_right_point + radius), pen, brush))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(left_middle_point - radius, left_middle_point + radius), pen, brush))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(right_middle_point - radius, right_middle_point + radius), pen, brush))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(bottom_left_point - radius, bottom_left_point + radius), pen, brush))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(bottom_middle_point - radius, bottom_middle_point + radius), pen,
-                                               brush))
-            self.items_to_remove.append(
-                self.graphics_scene.addEllipse(QRectF(bottom_right_point - radius, bottom_right_point + radius), pen, brush))
+        # draw the selected rectangle
+        self.updateSelectionFrame(rect)
+        self.updatePickedFrame()
+        selection = rect if self.selected_area != QRect() else QRectF()
+        if selection != self.drawnSelection:
+            self.markSelectionDirty(self.drawnSelection, selection)
+            self.drawnSelection = selection
 
         # draw the textedit
         if self.textPosition is not None:
+            self.getTextInput()
             textSpacing = 50
             position = QPoint()
-            if self.textPosition.x() + self.textInput.width() >= self.screenPixel.width():
+            if self.textPosition.x() + self.textInput.width() >= self.graphics_scene.width():
                 position.setX(self.textPosition.x() - self.textInput.width())
             else:
                 position.setX(self.textPosition.x())
 
             if self.textRect is not None:
-                if self.textPosition.y() + self.textInput.height() + self.textRect.height() >= self.screenPixel.height():
-                    position.setY(self.textPosition.y() - self.textInput.height() - self.textRect.height())
+                textHeight = ceil(self.textRect.height())
+                if self.textPosition.y() + self.textInput.height() + textHeight >= self.graphics_scene.height():
+                    position.setY(self.textPosition.y() - self.textInput.height() - textHeight)
                 else:
-                    position.setY(self.textPosition.y() + self.textRect.height())
+                    position.setY(self.textPosition.y() + textHeight)
             else:
-                if self.textPosition.y() + self.textInput.height() >= self.screenPixel.height():
+                if self.textPosition.y() + self.textInput.height() >= self.graphics_scene.height():
                     position.setY(self.textPosition.y() - self.textInput.height())
                 else:
                     position.setY(self.textPosition.y())
 
-            self.textInput.move(position)
+            self.textInput.move(self.sceneToGlobal(position))
             self.textInput.show()
             # self.textInput.getFocus()
 
+        if self.action == ACTION_SELECT and not self.mousePressed and self.selected_area == QRect() and \
+                not self.suggestedArea.isEmpty():
+            self.suggestionItem.setRect(QRectF(self.suggestedArea))
+            self.suggestionItem.show()
+        else:
+            self.suggestionItem.hide()
+
         # draw the magnifier
         if self.action == ACTION_SELECT:
             self.drawMagnifier()
-            if self.mousePressed:
-                self.drawSizeInfo()
+        else:
+            self.magnifier.hide()
 
-        if self.action == ACTION_MOVE_SELECTED:
+        if (self.action == ACTION_SELECT and self.mousePressed) or self.action == ACTION_MOVE_SELECTED:
             self.drawSizeInfo()
+        else:
+            self.sizeInfoBackground.hide()
+            self.sizeInfoText.hide()
 
-    # deal with every step in drawList
-    def drawOneStep(self, step):
+        for item in floatingItems:
+            self.markItemDirty(item)
+        self.updateViewport()
+
+    def updateMask(self, rect):
         """
-        :type step: tuple
+        :type rect: QRectF
+        :param rect: the normalized selected area, which is left uncovered
         """
-        if step[0] == ACTION_RECT:
-            self.graphics_scene.addRect(QRectF(QPointF(step[1], step[2]),
-                                               QPointF(step[3], step[4])), step[5])
-        elif step[0] == ACTION_ELLIPSE:
-            self.graphics_scene.addEllipse(QRectF(QPointF(step[1], step[2]),
-                                                  QPointF(step[3], step[4])), step[5])
-        elif step[0] == ACTION_ARROW:
-            arrow = QPolygonF()
+        width, height = self.graphics_scene.width(), self.graphics_scene.height()
+        if self.selected_area == QRect():
+            geometries = [QRectF(0, 0, width, height), QRectF(), QRectF(), QRectF()]
+        else:
+            geometries = [QRectF(0, 0, width, rect.top()),
+                          QRectF(0, rect.top(), rect.left(), rect.height()),
+                          QRectF(rect.right(), rect.top(), width - rect.right(), rect.height()),
+                          QRectF(0, rect.bottom(), width, height - rect.bottom())]
 
-            linex = float(step[1] - step[3])
-            liney = float(step[2] - step[4])
-            line = sqrt(pow(linex, 2) + pow(liney, 2))
+        for item, geometry in zip(self.maskItems, geometries):
+            if item.rect() != geometry:
+                item.setRect(geometry)
+            item.setVisible(not geometry.isEmpty())
 
-            # in case to divided by 0
-            if line == 0:
-                return
+    def updateSelectionFrame(self, rect):
+        """
+        :type rect: QRectF
+        :param rect: the normalized selected area
+        """
+        visible = self.selected_area != QRect()
+        self.selectionItem.setVisible(visible)
+        for item in self.handleItems:
+            item.setVisible(visible)
+        if not visible:
+            return
+
+        if self.selectionItem.rect() != rect:
+            self.selectionItem.setRect(rect)
+
+        top_left_point = rect.topLeft()
+        top_right_point = rect.topRight()
+        bottom_left_point = rect.bottomLeft()
+        bottom_right_point = rect.bottomRight()
+        top_middle_point = (top_left_point + top_right_point) / 2
+        left_middle_point = (top_left_point + bottom_left_point) / 2
+        bottom_middle_point = (bottom_left_point + bottom_right_point) / 2
+        right_middle_point = (top_right_point + bottom_right_point) / 2
+
+        # draw the drag point
+        radius = QPointF(3, 3)
+        points = [top_left_point, top_middle_point, top_right_point, left_middle_point,
+                  right_middle_point, bottom_left_point, bottom_middle_point, bottom_right_point]
+        for item, point in zip(self.handleItems, points):
+            handle = QRectF(point - radius, point + radius)
+            if item.rect() != handle:
+                item.setRect(handle)
+
+    def updateAnnotationItems(self):
+        """ keep one scene item per step of drawListResult, only touching the steps that changed """
+        index = 0
+        while index < len(self.annotationItems) and index < len(self.drawListResult) \
+                and self.annotationItems[index][0] is self.drawListResult[index]:
+            index += 1
+
+        for step, item in self.annotationItems[index:]:
+            self.removeSceneItem(item)
+            self.annotationIndex.remove(step)
+            self.annotationOrder.pop(step, None)
+        del self.annotationItems[index:]
+
+        for step in self.drawListResult[index:]:
+            item = self.drawOneStep(step)
+            if item is not None:
+                self.addSceneItem(item, Z_ANNOTATION, 'annotation')
+            self.annotationItems.append([step, item])
+            self.annotationIndex.insert(step, step.bounds())
+            self.orderAnnotation(len(self.annotationItems) - 1)
+
+    def updatePickedFrame(self):
+        self.markItemDirty(self.pickedItem)
+        if self.pickedStep is not None and self.pickedStep in self.annotationIndex:
+            self.pickedItem.setRect(self.pickedStep.bounds())
+            self.pickedItem.show()
+        else:
+            self.pickedItem.hide()
+        self.markItemDirty(self.pickedItem)
+
+    def insertAnnotation(self, index, step):
+        """ put step into drawListResult at index, with its scene item, nothing else is redrawn """
+        item = self.drawOneStep(step)
+        if item is not None:
+            self.addSceneItem(item, Z_ANNOTATION, 'annotation')
+            # the steps after it stay painted on top of it
+            following = [other for other_step, other in self.annotationItems[index:] if other is not None]
+            if following:
+                item.stackBefore(following[0])
+        self.drawListResult.insert(index, step)
+        self.annotationItems.insert(index, [step, item])
+        self.annotationIndex.insert(step, step.bounds())
+        self.orderAnnotation(index)
+
+    def removeAnnotation(self, index):
+        """ :return: Annotation, the step taken out of drawListResult together with its scene item """
+        step, item = self.annotationItems.pop(index)
+        self.removeSceneItem(item)
+        self.annotationIndex.remove(step)
+        self.annotationOrder.pop(step, None)
+        return self.drawListResult.pop(index)
+
+    def orderAnnotation(self, index):
+        """ give drawListResult[index] an order between the ones of its neighbours, see annotationAt() """
+        steps = self.drawListResult
+        before = self.annotationOrder[steps[index - 1]] if index > 0 else 0.0
+        after = self.annotationOrder.get(steps[index + 1]) if index + 1 < len(steps) else None
+        after = before + 2 if after is None else after
+        order = (before + after) / 2
+        if before < order < after:
+            self.annotationOrder[steps[index]] = order
+        else:
+            # no number left in between, count them again
+            for position, step in enumerate(steps):
+                self.annotationOrder[step] = position + 1.0
+
+    def replaceAnnotation(self, index, step):
+        self.removeAnnotation(index)
+        self.insertAnnotation(index, step)
+
+    def annotationAt(self, point):
+        """
+        :type point: QPoint
+        :return: Annotation, the topmost one under point, None if there is none
+        """
+        tolerance = ERRORRANGE / 2
+        # one more pixel, the edges of the bounds count as hits but not as intersections
+        area = QRectF(point.x() - tolerance - 1, point.y() - tolerance - 1, 2 * tolerance + 2, 2 * tolerance + 2)
+        hits = [step for step in self.annotationIndex.query(area) if step.hitTest(QPointF(point), tolerance)]
+        if len(hits) > 1:
+            return max(hits, key=self.annotationOrder.__getitem__)
+        return hits[0] if hits else None
+
+    def movePickedAnnotation(self, dx, dy):
+        if self.pickedStep is None or (dx == 0 and dy == 0):
+            return
+        moved = self.pickedStep.translated(dx, dy)
+        # the moves of one drag are merged into one undo step
+        self.history.push(ModifyAnnotationCommand(self, self.pickedIndex, moved, merge=self.pickedMoved))
+        self.pickedMoved = True
+        self.pickedStep = moved
+
+    def deletePickedAnnotation(self):
+        if self.pickedStep is None or self.pickedStep not in self.annotationIndex:
+            return
+        self.history.push(RemoveAnnotationCommand(self, self.drawListResult.index(self.pickedStep)))
+        self.pickedStep = None
+        self.redraw()
 
-            sinAngel = liney / line
-            cosAngel = linex / line
-
-            # sideLength is the length of bottom side of the body of an arrow
-            # arrowSize is the size of the head of an arrow, left and right
-            # sides' size is arrowSize, and the bottom side's size is arrowSize / 2
-            sideLength = step[5].width()
-            arrowSize = 8
-            bottomSize = arrowSize / 2
-
-            tmpPoint = QPointF(step[3] + arrowSize * sideLength * cosAngel, step[4] + arrowSize * sideLength * sinAngel)
-
-            point1 = QPointF(step[1] + sideLength * sinAngel, step[2] - sideLength * cosAngel)
-            point2 = QPointF(step[1] - sideLength * sinAngel, step[2] + sideLength * cosAngel)
-            point3 = QPointF(tmpPoint.x() - sideLength * sinAngel, tmpPoint.y() + sideLength * cosAngel)
-            point4 = QPointF(tmpPoint.x() - bottomSize * sideLength * sinAngel,
-                             tmpPoint.y() + bottomSize * sideLength * cosAngel)
-            point5 = QPointF(step[3], step[4])
-            point6 = QPointF(tmpPoint.x() + bottomSize * sideLength * sinAngel,
-                             tmpPoint.y() - bottomSize * sideLength * cosAngel)
-            point7 = QPointF(tmpPoint.x() + sideLength * sinAngel, tmpPoint.y() - sideLength * cosAngel)
-
-            arrow.append(point1)
-            arrow.append(point2)
-            arrow.append(point3)
-            arrow.append(point4)
-            arrow.append(point5)
-            arrow.append(point6)
-            arrow.append(point7)
-            arrow.append(point1)
-
-            self.graphics_scene.addPolygon(arrow, step[5], step[6])
-        elif step[0] == ACTION_LINE:
-            self.graphics_scene.addLine(QLineF(QPointF(step[1], step[2]), QPointF(step[3], step[4])), step[5])
-        elif step[0] == ACTION_FREEPEN:
-            self.graphics_scene.addPath(step[1], step[2])
-        elif step[0] == ACTION_TEXT:
-            textAdd = self.graphics_scene.addSimpleText(step[1], step[2])
-            textAdd.setPos(step[3])
-            textAdd.setBrush(QBrush(step[4]))
-            self.textRect = textAdd.boundingRect()
+    def setSelection(self, area, action):
+        self.selected_area = QRect(area)
+        self.selectedAreaRaw = QRect(area)
+        self.action = action
+
+    # deal with every step in drawList
+    def drawOneStep(self, step):
+        """
+        :type step: Annotation
+        :return: the scene item drawn for the step, or None
+        """
+        item = step.createItem()
+        if item is None:
+            return None
+        self.graphics_scene.addItem(item)
+        if step.kind == ACTION_TEXT:
+            self.textRect = item.boundingRect()
+        return item
+
+    def penStyle(self):
+        """ :return: Style, the shared style of the pen now """
+        return self.stylePool.style(self.penColorNow, self.penSizeNow)
 
     # draw the size information on the top left corner
     def drawSizeInfo(self):
@@ -689,30 +1362,41 @@ class Screenshot(QGraphicsView):
 
         if sizeInfoArea.top() < 0:
             sizeInfoArea.moveTopLeft(rect.topLeft() + QPoint(spacing, spacing))
-        if sizeInfoArea.right() >= self.screenPixel.width():
+        if sizeInfoArea.right() >= self.graphics_scene.width():
             sizeInfoArea.moveTopLeft(rect.topLeft() - QPoint(spacing, spacing) - QPoint(sizeInfoAreaWidth, 0))
         if sizeInfoArea.left() < spacing:
             sizeInfoArea.moveLeft(spacing)
         if sizeInfoArea.top() < spacing:
             sizeInfoArea.moveTop(spacing)
 
-        self.items_to_remove.append(self.graphics_scene.addRect(QRectF(sizeInfoArea), Qt.white, QBrush(Qt.black)))
+        self.sizeInfoBackground.setRect(QRectF(sizeInfoArea))
+        self.sizeInfoBackground.show()
 
-        sizeInfo = self.graphics_scene.addSimpleText(
-            '  {0} x {1}'.format(rect.width() * self.scale, rect.height() * self.scale))
-        sizeInfo.setPos(sizeInfoArea.topLeft() + QPoint(0, 2))
-        sizeInfo.setPen(QPen(QColor(255, 255, 255), 2))
-        self.items_to_remove.append(sizeInfo)
+        size = self.deviceSelection().size()
+        self.sizeInfoText.setText('  {0} x {1}'.format(size.width(), size.height()))
+        self.sizeInfoText.setPos(QPointF(sizeInfoArea.topLeft() + QPoint(0, 2)))
+        self.sizeInfoText.show()
 
     def drawRect(self, x1, x2, y1, y2, result):
         rect = self.selected_area.normalized()
         tmpRect = QRect(QPoint(x1, x2), QPoint(y1, y2)).normalized()
         resultRect = rect & tmpRect
-        tmp = [ACTION_RECT, resultRect.topLeft().x(), resultRect.topLeft().y(),
-               resultRect.bottomRight().x(), resultRect.bottomRight().y(),
-               QPen(QColor(self.penColorNow), int(self.penSizeNow))]
+        tmp = RectAnnotation(resultRect.topLeft().x(), resultRect.topLeft().y(),
+                             resultRect.bottomRight().x(), resultRect.bottomRight().y(), self.penStyle())
         if result:
-            self.drawListResult.append(tmp)
+            self.history.push(AddAnnotationCommand(self, tmp))
+        else:
+            self.drawListProcess = tmp
+
+    def drawRedact(self, x1, x2, y1, y2, result):
+        rect = self.selected_area.normalized()
+        tmpRect = QRect(QPoint(x1, x2), QPoint(y1, y2)).normalized()
+        resultRect = rect & tmpRect
+        tmp = RedactAnnotation(resultRect.topLeft().x(), resultRect.topLeft().y(),
+                               resultRect.bottomRight().x(), resultRect.bottomRight().y(), self.penStyle(),
+                               self.stylePool.effect(self.redactMode, self.redactBlockSize))
+        if result:
+            self.history.push(AddAnnotationCommand(self, tmp))
         else:
             self.drawListProcess = tmp
 
@@ -720,11 +1404,10 @@ class Screenshot(QGraphicsView):
         rect = self.selected_area.normalized()
         tmpRect = QRect(QPoint(x1, x2), QPoint(y1, y2)).normalized()
         resultRect = rect & tmpRect
-        tmp = [ACTION_ELLIPSE, resultRect.topLeft().x(), resultRect.topLeft().y(),
-               resultRect.bottomRight().x(), resultRect.bottomRight().y(),
-               QPen(QColor(self.penColorNow), int(self.penSizeNow))]
+        tmp = EllipseAnnotation(resultRect.topLeft().x(), resultRect.topLeft().y(),
+                                resultRect.bottomRight().x(), resultRect.bottomRight().y(), self.penStyle())
         if result:
-            self.drawListResult.append(tmp)
+            self.history.push(AddAnnotationCommand(self, tmp))
         else:
             self.drawListProcess = tmp
 
@@ -740,11 +1423,9 @@ class Screenshot(QGraphicsView):
         elif y2 >= rect.bottom():
             y2 = rect.bottom()
 
-        tmp = [ACTION_ARROW, x1, x2, y1, y2,
-               QPen(QColor(self.penColorNow), int(self.penSizeNow)),
-               QBrush(QColor(self.penColorNow))]
+        tmp = ArrowAnnotation(x1, x2, y1, y2, self.penStyle())
         if result:
-            self.drawListResult.append(tmp)
+            self.history.push(AddAnnotationCommand(self, tmp))
         else:
             self.drawListProcess = tmp
 
@@ -760,40 +1441,45 @@ class Screenshot(QGraphicsView):
         elif y2 >= rect.bottom():
             y2 = rect.bottom()
 
-        tmp = [ACTION_LINE, x1, x2, y1, y2,
-               QPen(QColor(self.penColorNow), int(self.penSizeNow))]
+        tmp = LineAnnotation(x1, x2, y1, y2, self.penStyle())
         if result:
-            self.drawListResult.append(tmp)
+            self.history.push(AddAnnotationCommand(self, tmp))
         else:
             self.drawListProcess = tmp
 
-    def drawFreeLine(self, pointPath, result):
-        tmp = [ACTION_FREEPEN, QPainterPath(pointPath), QPen(QColor(self.penColorNow), int(self.penSizeNow))]
-        if result:
-            self.drawListResult.append(tmp)
-        else:
-            self.drawListProcess = tmp
+    def drawFreeLine(self):
+        """ commit the stroke being drawn, simplified """
+        if self.strokeItem is None:
+            return
+        self.history.push(AddAnnotationCommand(self, self.strokeItem.finish()))
+        self.removeSceneItem(self.strokeItem)
+        self.strokeItem = None
 
     def textChange(self):
         if self.textPosition is None:
             return
         self.text = self.textInput.getText()
-        self.drawListProcess = [ACTION_TEXT, str(self.text), QFont(self.fontNow), QPoint(self.textPosition),
-                                QColor(self.penColorNow)]
+        self.drawListProcess = TextAnnotation(str(self.text), self.stylePool.font(self.fontNow),
+                                              QPointF(self.textPosition), self.penStyle())
         self.redraw()
 
     def undoOperation(self):
-        if len(self.drawListResult) == 0:
-            self.action = ACTION_SELECT
-            self.selected_area = QRect()
-            self.selectedAreaRaw = QRect()
-            self.tooBar.hide()
+        if self.history.canUndo():
+            self.history.undo()
+        else:
+            # nothing left to undo, drop the selected area
+            self.setSelection(QRect(), ACTION_SELECT)
+            if self.tooBar is not None:
+                self.tooBar.hide()
             if self.penSetBar is not None:
                 self.penSetBar.hide()
-        else:
-            self.drawListResult.pop()
         self.redraw()
 
+    def redoOperation(self):
+        if self.history.canRedo():
+            self.history.redo()
+            self.redraw()
+
     def saveOperation(self):
         filename = QFileDialog.getSaveFileName(self, 'Save file', './screenshot.png', '*.png;;*.jpg')
         if len(filename[0]) == 0:
@@ -802,25 +1488,32 @@ class Screenshot(QGraphicsView):
             self.saveScreenshot(False, filename[0], filename[1][2:])
             self.close()
 
+    def saveSessionOperation(self):
+        filename = QFileDialog.getSaveFileName(self, 'Save session', './screenshot.pqss', '*.pqss')
+        if len(filename[0]) != 0:
+            self.saveSession(filename[0])
+
     def close(self):
+        self.redrawTimer.stop()
         self.widget_closed.emit()
         super().close()
-        self.tooBar.close()
+        for view in self.screenViews:
+            view.close()
+        if self.tooBar is not None:
+            self.tooBar.close()
         if self.penSetBar is not None:
             self.penSetBar.close()
 
     def saveToClipboard(self):
-        QApplication.clipboard().setText('Test in save function')
-
         self.saveScreenshot(True)
         self.close()
 
     # slots
     def changeAction(self, nextAction):
-        QApplication.clipboard().setText('Test in changeAction function')
-
         if nextAction == ACTION_UNDO:
             self.undoOperation()
+        elif nextAction == ACTION_REDO:
+            self.redoOperation()
         elif nextAction == ACTION_SAVE:
             self.saveOperation()
         elif nextAction == ACTION_CANCEL:
@@ -830,6 +1523,8 @@ class Screenshot(QGraphicsView):
 
         else:
             self.action = nextAction
+            if nextAction == ACTION_REDACT:
+                self.prepareRedaction()
 
         self.setFocus()
 
@@ -843,19 +1538,33 @@ class Screenshot(QGraphicsView):
         self.drawListProcess = None
         self.textPosition = None
         self.textRect = None
-        self.textInput.hide()
+        self.getTextInput().hide()
         self.textInput.clearText()
         self.redraw()
 
     def okInput(self):
         self.text = self.textInput.getText()
-        self.drawListResult.append(
-            [ACTION_TEXT, str(self.text), QFont(self.fontNow), QPoint(self.textPosition), QColor(self.penColorNow)])
+        self.history.push(AddAnnotationCommand(self, TextAnnotation(str(self.text), self.stylePool.font(self.fontNow),
+                                                                    QPointF(self.textPosition), self.penStyle())))
         self.textPosition = None
         self.textRect = None
         self.textInput.hide()
         self.textInput.clearText()
         self.redraw()
 
+    def changeRedactMode(self, mode):
+        self.redactMode = mode
+        self.prepareRedaction()
+
+    def changeRedactBlockSize(self, blockSize):
+        self.redactBlockSize = blockSize
+        self.prepareRedaction()
+
+    def prepareRedaction(self):
+        """ compute the effect of the redaction tool in the encoder pool, it is ready before an area is dragged """
+        from pyqt_screenshot.encoder import encoder_pool
+
+        encoder_pool().submit(self.stylePool.effect(self.redactMode, self.redactBlockSize).image)
+
     def changeFont(self, font):
         self.fontNow = font
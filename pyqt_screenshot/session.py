@@ -0,0 +1,130 @@
+"""
+sessions keep the grab and its annotations, so a screenshot can be edited again after the overlay closed
+
+    from pyqt_screenshot.session import load_session
+
+    session = load_session('screenshot.pqss')  # only the header is read here
+    img = session.image()  # QImage mapped from the file, the pixels are read when they are used
+
+a session file is a fixed header, the json metadata and the raw pixels of the grab. the pixels start at a
+multiple of mmap.ALLOCATIONGRANULARITY, so they are mapped as they are, without decoding or copying
+"""
+import os
+import json
+import mmap
+import struct
+
+from PyQt5 import sip
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QImage
+
+from pyqt_screenshot.annotation import StylePool, annotation_from_dict
+
+MAGIC = b'PQSHOT\r\n'
+VERSION = 1
+# magic, version, length of the metadata, offset of the pixels
+HEADER = struct.Struct('<8sIIQ')
+
+
+def _rect_to_list(rect):
+    return [rect.x(), rect.y(), rect.width(), rect.height()]
+
+
+def _aligned(offset):
+    granularity = mmap.ALLOCATIONGRANULARITY
+    return (offset + granularity - 1) // granularity * granularity
+
+
+def save_session(fileName, image, steps, selection=None, geometry=None):
+    """
+    write the grab and its annotations to fileName
+    :type image: QImage
+    :param image: the grab, in device pixels
+    :param steps: [Annotation], drawListResult
+    :param selection: QRect, the selected area in logical scene coordinates
+    :param geometry: QRect, the logical geometry of the desktop the grab covers
+    :return: the absolute path of the file
+    """
+    metadata = {
+        'image': {
+            'width': image.width(),
+            'height': image.height(),
+            'bytesPerLine': image.bytesPerLine(),
+            'format': int(image.format()),
+            'devicePixelRatio': image.devicePixelRatio(),
+        },
+        'selection': _rect_to_list(selection or QRect()),
+        'geometry': _rect_to_list(geometry or QRect()),
+        'annotations': [step.toDict() for step in steps],
+    }
+    encoded = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+    offset = _aligned(HEADER.size + len(encoded))
+
+    pixels = image.constBits()
+    pixels.setsize(image.sizeInBytes())
+    # written next to the file and then renamed, a session mapped from fileName keeps its pixels
+    temporary = fileName + '.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(encoded), offset))
+        f.write(encoded)
+        f.write(b'\0' * (offset - HEADER.size - len(encoded)))
+        f.write(memoryview(pixels))
+    os.replace(temporary, fileName)
+    return os.path.abspath(fileName)
+
+
+def load_session(fileName):
+    """
+    :return: Session, the pixels are not read yet
+    """
+    with open(fileName, 'rb') as f:
+        magic, version, length, offset = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError('{0} is not a screenshot session'.format(fileName))
+        if version > VERSION:
+            raise ValueError('session version {0} of {1} is not supported'.format(version, fileName))
+        metadata = json.loads(f.read(length).decode('utf-8'))
+    return Session(fileName, metadata, offset)
+
+
+class Session:
+    """ A session file opened by load_session() """
+
+    def __init__(self, fileName, metadata, offset):
+        self.fileName = os.path.abspath(fileName)
+        self.metadata = metadata
+        self.offset = offset
+        self.buffer = None  # the mapped pixels, once image() was called
+
+        self.selection = QRect(*metadata['selection'])
+        self.geometry = QRect(*metadata['geometry'])
+
+    def annotations(self, stylePool=None):
+        """
+        :param stylePool: StylePool the styles and fonts are interned in, a new one by default
+        :return: [Annotation]
+        """
+        stylePool = stylePool or StylePool()
+        return [annotation_from_dict(data, stylePool) for data in self.metadata['annotations']]
+
+    def image(self):
+        """
+        :return: QImage over the pixels mapped from the file, copy on write. it must not outlive the session
+        """
+        info = self.metadata['image']
+        if info['height'] == 0:
+            return QImage()
+        if self.buffer is None:
+            with open(self.fileName, 'rb') as f:
+                self.buffer = mmap.mmap(f.fileno(), info['bytesPerLine'] * info['height'],
+                                        access=mmap.ACCESS_COPY, offset=self.offset)
+
+        image = QImage(sip.voidptr(self.buffer), info['width'], info['height'], info['bytesPerLine'],
+                       QImage.Format(info['format']))
+        image.setDevicePixelRatio(info['devicePixelRatio'])
+        return image
+
+    def close(self):
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
@@ -0,0 +1,127 @@
+"""
+named shared memory blocks handing data to other processes without pipes or temporary files.
+only the standard library is imported here, Qt only by RawImage.image()
+
+raw images are published without encoding, a reader maps the pixels as they are:
+
+    from pyqt_screenshot.shared import open_raw
+
+    raw = open_raw(name)
+    raw.width, raw.height, raw.bytesPerLine, raw.format, raw.devicePixelRatio
+    raw.pixels  # memoryview over the shared memory, nothing is copied
+"""
+import struct
+from multiprocessing import shared_memory, resource_tracker
+
+RAW_MAGIC = b'PQRAW\r\n\0'
+# magic, width, height, bytes per line, QImage.Format, device pixel ratio. the pixels follow
+RAW_HEADER = struct.Struct('<8sIIIId')
+
+
+def _untracked(name=None, size=0):
+    """ :return: SharedMemory, created if name is None, that outlives this process """
+    try:
+        return shared_memory.SharedMemory(name, create=name is None, size=max(1, size), track=False)
+    except TypeError:
+        memory = shared_memory.SharedMemory(name, create=name is None, size=max(1, size))
+        # the resource tracker would unlink the block when this process exits
+        resource_tracker.unregister(memory._name, 'shared_memory')
+        return memory
+
+
+def publish_shared(data):
+    """
+    copy data into a new shared memory block, the reader unlinks it, see read_shared()
+    :return: the name of the block
+    """
+    memory = _untracked(size=len(data))
+    memory.buf[:len(data)] = data
+    name = memory.name
+    memory.close()
+    return name
+
+
+def publish_image(image):
+    """
+    copy the pixels of image into a new shared memory block behind a RAW_HEADER, the reader unlinks it,
+    see open_raw()
+    :type image: QImage
+    :return: the name of the block
+    """
+    size = image.sizeInBytes()
+    memory = _untracked(size=RAW_HEADER.size + size)
+    RAW_HEADER.pack_into(memory.buf, 0, RAW_MAGIC, image.width(), image.height(), image.bytesPerLine(),
+                         int(image.format()), image.devicePixelRatio())
+    if size:
+        pixels = image.constBits()
+        pixels.setsize(size)
+        memory.buf[RAW_HEADER.size:RAW_HEADER.size + size] = memoryview(pixels)
+    name = memory.name
+    memory.close()
+    return name
+
+
+def unlink_shared(name):
+    """ free the block published as name, if no reader did yet """
+    try:
+        memory = shared_memory.SharedMemory(name)
+    except FileNotFoundError:
+        return
+    memory.close()
+    memory.unlink()
+
+
+def read_shared(name, size):
+    """
+    copy the first size bytes out of the block published as name and free the block
+    :return: bytes
+    """
+    memory = shared_memory.SharedMemory(name)
+    try:
+        return bytes(memory.buf[:size])
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def open_raw(name):
+    """ :return: RawImage mapping the block published by publish_image() """
+    return RawImage(_untracked(name))
+
+
+class RawImage:
+    """ The pixels of a shared memory block published by publish_image(), mapped and not copied """
+
+    def __init__(self, memory):
+        magic, self.width, self.height, self.bytesPerLine, self.format, self.devicePixelRatio = \
+            RAW_HEADER.unpack_from(memory.buf)
+        if magic != RAW_MAGIC:
+            memory.close()
+            raise ValueError('{0} is not a raw image'.format(memory.name))
+        self.memory = memory
+        self.name = memory.name
+        self.pixels = memory.buf[RAW_HEADER.size:RAW_HEADER.size + self.bytesPerLine * self.height]
+
+    def image(self):
+        """
+        :return: QImage over the shared pixels, it must not outlive close()
+        """
+        from PyQt5 import sip
+        from PyQt5.QtGui import QImage
+
+        image = QImage(sip.voidptr(self.pixels), self.width, self.height, self.bytesPerLine, QImage.Format(self.format))
+        image.setDevicePixelRatio(self.devicePixelRatio)
+        return image
+
+    def close(self):
+        """ unmap the block, the views of pixels have to be released before """
+        if self.memory is not None:
+            self.pixels.release()
+            self.memory.close()
+            self.memory = None
+
+    def unlink(self):
+        """ free the block, the readers that mapped it keep their mapping until they close it """
+        memory = shared_memory.SharedMemory(self.name)
+        memory.close()
+        memory.unlink()
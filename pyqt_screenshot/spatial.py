@@ -0,0 +1,62 @@
+from math import floor
+
+from PyQt5.QtCore import QRectF
+
+
+class GridIndex:
+    """ A uniform grid over the scene, mapping cells to the keys whose rects reach into them """
+
+    def __init__(self, cellSize):
+        """
+        :param cellSize: the width and height of a cell, in scene units
+        """
+        self.cellSize = cellSize
+        self.cells = {}  # (column, row) -> set of keys
+        self.keys = {}  # key -> (rect, [(column, row)])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def cellRange(self, rect):
+        size = self.cellSize
+        return (floor(rect.left() / size), floor(rect.top() / size),
+                floor(rect.right() / size), floor(rect.bottom() / size))
+
+    def insert(self, key, rect):
+        """
+        :type rect: QRectF
+        :param rect: the bounding rect of key, key is moved if it is in the index already
+        """
+        if key in self.keys:
+            self.remove(key)
+        left, top, right, bottom = self.cellRange(rect)
+        cells = [(column, row) for column in range(left, right + 1) for row in range(top, bottom + 1)]
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(key)
+        self.keys[key] = (QRectF(rect), cells)
+
+    def remove(self, key):
+        rect, cells = self.keys.pop(key, (None, ()))
+        for cell in cells:
+            keys = self.cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+        self.keys.clear()
+
+    def query(self, rect):
+        """ :return: set of the keys whose rects intersect rect """
+        left, top, right, bottom = self.cellRange(rect)
+        found = set()
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                for key in self.cells.get((column, row), ()):
+                    if key not in found and self.keys[key][0].intersects(rect):
+                        found.add(key)
+        return found
@@ -0,0 +1,180 @@
+"""
+a content addressed store for captures that repeat themselves, the same window with a clock ticking.
+images are cut in tiles, every different tile is written once and a capture is a manifest of its tiles
+
+    from pyqt_screenshot.store import TileStore
+
+    store = TileStore('captures')
+    result = store.put(img)  # StoreResult, only the tiles not in the store yet are written
+    img = store.open(result.name).image()
+
+root/tiles/ab/abcdef... hold the zlib compressed pixels of the tiles, root/captures/<name>.json the manifests
+"""
+import os
+import json
+import time
+import zlib
+import hashlib
+import threading
+from collections import namedtuple
+
+from PyQt5.QtCore import QPoint
+from PyQt5.QtGui import QImage, QPainter
+
+from pyqt_screenshot.constant import STORE_TILE_SIZE
+
+# what put() did: the name of the capture, the path of its manifest, the bytes written,
+# the seconds it took, how many tiles it has and how many of them were in the store already
+StoreResult = namedtuple('StoreResult', ['name', 'path', 'size', 'duration', 'tiles', 'reused'])
+
+TILE_FORMAT = QImage.Format_RGB32
+TILE_DEPTH = 4  # bytes per pixel of TILE_FORMAT
+
+
+def _write(fileName, data):
+    """ write next to fileName and rename, readers never see a part of it """
+    temporary = '{0}.{1}-{2}.tmp'.format(fileName, os.getpid(), threading.get_ident())
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, fileName)
+
+
+class TileStore:
+    """ A directory of deduplicated image tiles and the manifests of the captures built from them """
+
+    def __init__(self, root, tileSize=STORE_TILE_SIZE, level=1):
+        """
+        :param root: the directory of the store, created if it does not exist
+        :param tileSize: the width and height of the tiles of the captures put from now on
+        :param level: the zlib level the tiles are compressed with
+        """
+        self.root = os.path.abspath(root)
+        self.tileSize = tileSize
+        self.level = level
+        os.makedirs(os.path.join(self.root, 'captures'), exist_ok=True)
+        os.makedirs(os.path.join(self.root, 'tiles'), exist_ok=True)
+
+    def tilePath(self, digest):
+        return os.path.join(self.root, 'tiles', digest[:2], digest)
+
+    def manifestPath(self, name):
+        return os.path.join(self.root, 'captures', name + '.json')
+
+    def tiles(self, image):
+        """
+        yield (digest, width, height, pixels) of the tiles of image, row by row
+        :type image: QImage
+        :param image: in TILE_FORMAT
+        """
+        size = self.tileSize
+        bytesPerLine = image.bytesPerLine()
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        pixels = memoryview(bits)
+        for top in range(0, image.height(), size):
+            height = min(size, image.height() - top)
+            for left in range(0, image.width(), size):
+                width = min(size, image.width() - left)
+                start = top * bytesPerLine + left * TILE_DEPTH
+                tile = b''.join([pixels[line:line + width * TILE_DEPTH]
+                                 for line in range(start, start + height * bytesPerLine, bytesPerLine)])
+                digest = hashlib.blake2b(tile, digest_size=16, person=b'%dx%d' % (width, height)).hexdigest()
+                yield digest, width, height, tile
+
+    def put(self, image, name=None):
+        """
+        add image to the store, safe to call from several threads
+        :type image: QImage
+        :param name: the name of the capture, the digest of its manifest by default
+        :return: StoreResult
+        """
+        start = time.perf_counter()
+        if image.format() != TILE_FORMAT:
+            image = image.convertToFormat(TILE_FORMAT)
+
+        digests = []
+        written = reused = 0
+        for digest, width, height, tile in self.tiles(image):
+            digests.append(digest)
+            fileName = self.tilePath(digest)
+            if os.path.exists(fileName):
+                reused += 1
+                continue
+            os.makedirs(os.path.dirname(fileName), exist_ok=True)
+            data = zlib.compress(tile, self.level)
+            _write(fileName, data)
+            written += len(data)
+
+        manifest = json.dumps({
+            'width': image.width(),
+            'height': image.height(),
+            'devicePixelRatio': image.devicePixelRatio(),
+            'tileSize': self.tileSize,
+            'tiles': digests,
+        }, separators=(',', ':')).encode('utf-8')
+        name = name or hashlib.blake2b(manifest, digest_size=16).hexdigest()
+        path = self.manifestPath(name)
+        _write(path, manifest)
+        return StoreResult(name, path, written + len(manifest), time.perf_counter() - start, len(digests), reused)
+
+    def open(self, name):
+        """ :return: StoredCapture, no tile is read yet """
+        with open(self.manifestPath(name), 'rb') as f:
+            return StoredCapture(self, json.loads(f.read().decode('utf-8')))
+
+    def names(self):
+        """ :return: [str] the names of the captures in the store """
+        return sorted(fileName[:-len('.json')] for fileName in os.listdir(os.path.join(self.root, 'captures'))
+                      if fileName.endswith('.json'))
+
+
+class StoredCapture:
+    """ A capture of a TileStore, its tiles are read when they are needed """
+
+    def __init__(self, store, manifest):
+        self.store = store
+        self.manifest = manifest
+        self.width = manifest['width']
+        self.height = manifest['height']
+        self.devicePixelRatio = manifest['devicePixelRatio']
+        self.tileSize = manifest['tileSize']
+
+    def readTile(self, digest):
+        """ :return: bytes, the pixels of the tile, one line after the other """
+        with open(self.store.tilePath(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def bands(self):
+        """
+        yield (top, QImage) the capture one row of tiles at a time, only the tiles of that row are read
+        """
+        size = self.tileSize
+        columns = -(-self.width // size)
+        digests = self.manifest['tiles']
+        for row, top in enumerate(range(0, self.height, size)):
+            height = min(size, self.height - top)
+            band = QImage(self.width, height, TILE_FORMAT)
+            bytesPerLine = band.bytesPerLine()
+            bits = band.bits()
+            bits.setsize(band.sizeInBytes())
+            pixels = memoryview(bits)
+            for column, digest in enumerate(digests[row * columns:(row + 1) * columns]):
+                left = column * size * TILE_DEPTH
+                lineSize = min(size, self.width - column * size) * TILE_DEPTH
+                tile = self.readTile(digest)
+                for line in range(height):
+                    offset = line * bytesPerLine + left
+                    pixels[offset:offset + lineSize] = tile[line * lineSize:(line + 1) * lineSize]
+            band.setDevicePixelRatio(self.devicePixelRatio)
+            yield top, band
+
+    def image(self):
+        """ :return: QImage, the whole capture """
+        image = QImage(self.width, self.height, TILE_FORMAT)
+        painter = QPainter(image)
+        for top, band in self.bands():
+            band.setDevicePixelRatio(1)
+            painter.drawImage(QPoint(0, top), band)
+        painter.end()
+        image.setDevicePixelRatio(self.devicePixelRatio)
+        return image
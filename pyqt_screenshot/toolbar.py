@@ -1,11 +1,10 @@
-from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QWidget, QPushButton, QButtonGroup, QFrame, QHBoxLayout
 
 from pyqt_screenshot import constant
 from pyqt_screenshot.constant import *
 from PyQt5.QtCore import pyqtSignal, Qt
 
-import resource.resource
+from pyqt_screenshot.icons import icon
 
 
 class MyToolBar(QWidget):
@@ -30,6 +29,7 @@ class MyToolBar(QWidget):
         self.lineButton = None
         self.freePenButton = None
         self.textButton = None
+        self.redactButton = None
         self.undoButton = None
         self.cancelButton = None
         self.okButton = None
@@ -44,7 +44,7 @@ class MyToolBar(QWidget):
         # draw action buttons
         if flags & constant.RECT:
             self.rectButton = QPushButton(self)
-            self.rectButton.setIcon(QIcon(":/resource/icon/rect.png"))
+            self.rectButton.setIcon(icon('rect'))
             self.rectButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.rectButton.setCheckable(True)
             self.drawButtonGroup.addButton(self.rectButton)
@@ -53,7 +53,7 @@ class MyToolBar(QWidget):
 
         if flags & constant.ELLIPSE:
             self.ellipseButton = QPushButton(self)
-            self.ellipseButton.setIcon(QIcon(":/resource/icon/ellipse.png"))
+            self.ellipseButton.setIcon(icon('ellipse'))
             self.ellipseButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.ellipseButton.setCheckable(True)
             self.drawButtonGroup.addButton(self.ellipseButton)
@@ -62,7 +62,7 @@ class MyToolBar(QWidget):
 
         if flags & constant.ARROW:
             self.arrowButton = QPushButton(self)
-            self.arrowButton.setIcon(QIcon(":/resource/icon/arrow.png"))
+            self.arrowButton.setIcon(icon('arrow'))
             self.arrowButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.arrowButton.setCheckable(True)
             self.drawButtonGroup.addButton(self.arrowButton)
@@ -71,7 +71,7 @@ class MyToolBar(QWidget):
 
         if flags & constant.LINE:
             self.lineButton = QPushButton(self)
-            self.lineButton.setIcon(QIcon(":/resource/icon/line.png"))
+            self.lineButton.setIcon(icon('line'))
             self.lineButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.lineButton.setCheckable(True)
             self.drawButtonGroup.addButton(self.lineButton)
@@ -80,7 +80,7 @@ class MyToolBar(QWidget):
 
         if flags & constant.FREEPEN:
             self.freePenButton = QPushButton(self)
-            self.freePenButton.setIcon(QIcon(":/resource/icon/pen.png"))
+            self.freePenButton.setIcon(icon('pen'))
             self.freePenButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.freePenButton.setCheckable(True)
             self.drawButtonGroup.addButton(self.freePenButton)
@@ -89,13 +89,22 @@ class MyToolBar(QWidget):
 
         if flags & constant.TEXT:
             self.textButton = QPushButton(self)
-            self.textButton.setIcon(QIcon(":/resource/icon/text.png"))
+            self.textButton.setIcon(icon('text'))
             self.textButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.textButton.setCheckable(True)
             self.drawButtonGroup.addButton(self.textButton)
             self.hlayout.addWidget(self.textButton)
             self.button_list.append(self.textButton)
 
+        if flags & constant.REDACT:
+            self.redactButton = QPushButton(self)
+            self.redactButton.setIcon(icon('redact'))
+            self.redactButton.setFixedSize(self.iconWidth, self.iconHeight)
+            self.redactButton.setCheckable(True)
+            self.drawButtonGroup.addButton(self.redactButton)
+            self.hlayout.addWidget(self.redactButton)
+            self.button_list.append(self.redactButton)
+
         self.drawButtonGroup.buttonClicked.connect(self.buttonToggled)
 
     def initOtherButtons(self, flags):
@@ -107,14 +116,14 @@ class MyToolBar(QWidget):
             self.hlayout.addWidget(self.separator1)
 
             self.undoButton = QPushButton(self)
-            self.undoButton.setIcon(QIcon(":/resource/icon/undo.png"))
+            self.undoButton.setIcon(icon('undo'))
             self.undoButton.setFixedSize(self.iconWidth, self.iconWidth)
             self.undoButton.clicked.connect(self.otherButtonsClicked)
             self.hlayout.addWidget(self.undoButton)
 
         if flags & constant.SAVE_TO_FILE:
             self.saveButton = QPushButton(self)
-            self.saveButton.setIcon(QIcon(":/resource/icon/save.png"))
+            self.saveButton.setIcon(icon('save'))
             self.saveButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.saveButton.clicked.connect(self.otherButtonsClicked)
             self.hlayout.addWidget(self.saveButton)
@@ -125,13 +134,13 @@ class MyToolBar(QWidget):
         self.hlayout.addWidget(self.separator2)
 
         self.cancelButton = QPushButton(self)
-        self.cancelButton.setIcon(QIcon(":/resource/icon/close.png"))
+        self.cancelButton.setIcon(icon('close'))
         self.cancelButton.setFixedSize(self.iconWidth, self.iconHeight)
         self.cancelButton.clicked.connect(self.otherButtonsClicked)
 
         if flags & constant.CLIPBOARD:
             self.okButton = QPushButton(self)
-            self.okButton.setIcon(QIcon(":/resource/icon/check.png"))
+            self.okButton.setIcon(icon('check'))
             self.okButton.setFixedSize(self.iconWidth, self.iconHeight)
             self.okButton.clicked.connect(self.otherButtonsClicked)
             self.hlayout.addWidget(self.okButton)
@@ -166,6 +175,8 @@ class MyToolBar(QWidget):
             self.trigger.emit(ACTION_FREEPEN)
         elif button == self.textButton:
             self.trigger.emit(ACTION_TEXT)
+        elif button == self.redactButton:
+            self.trigger.emit(ACTION_REDACT)
         else:
             pass
 
@@ -0,0 +1,123 @@
+"""
+watch an area of a screen and pass on the frames in which it changed, needs numpy
+
+    from pyqt_screenshot.watch import RegionWatch
+
+    watch = RegionWatch(QRect(0, 0, 800, 600), 2000)
+    watch.changed.connect(lambda image, boxes: encode_async(image, 'dashboard.png'))
+    watch.start()
+
+the unchanged frames are dropped right after the grab, they are never encoded
+"""
+from collections import Counter
+
+import numpy
+from PyQt5.QtCore import QObject, QRect, QTimer, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from pyqt_screenshot.arrays import image_to_array
+from pyqt_screenshot.capture import cursor_screen, grab_screen, screen_area
+from pyqt_screenshot.constant import WATCH_TILE_SIZE, WATCH_THRESHOLD
+
+
+def changed_boxes(tiles, tileSize, width, height):
+    """
+    :param tiles: numpy.ndarray of bool, (rows, columns), the changed tiles
+    :param width: the width of the image the tiles cover, the last column is cut there
+    :param height: the height of the image, the last row is cut there
+    :return: [QRect], the changed tiles merged into rectangles, in pixels of the image
+    """
+    boxes = []
+    open_runs = {}  # (first column, last column) -> box growing downwards over the rows
+    for row in range(tiles.shape[0]):
+        flags = numpy.concatenate(([False], tiles[row], [False]))
+        edges = numpy.flatnonzero(flags[1:] != flags[:-1])
+        runs = {}
+        for first, end in zip(edges[::2], edges[1::2]):
+            box = open_runs.pop((first, end), None)
+            if box is None:
+                box = [first, row, end, row + 1]
+                boxes.append(box)
+            box[3] = row + 1
+            runs[(first, end)] = box
+        open_runs = runs
+    return [QRect(left * tileSize, top * tileSize,
+                  min(right * tileSize, width) - left * tileSize, min(bottom * tileSize, height) - top * tileSize)
+            for left, top, right, bottom in boxes]
+
+
+class RegionWatch(QObject):
+    """ Grab an area of a screen at a fixed interval, frames are passed on only when enough of it changed """
+
+    changed = pyqtSignal(QImage, list)  # the frame, [QRect] the changed areas in its pixels
+
+    def __init__(self, rect, interval, screen=None, tileSize=WATCH_TILE_SIZE, threshold=WATCH_THRESHOLD,
+                 parent=None):
+        """
+        :type rect: QRect
+        :param rect: the area in logical pixels, relative to the top left of screen
+        :param interval: the time between two grabs, in milliseconds
+        :param screen: QScreen, the screen under the cursor by default
+        :param tileSize: the frames are compared in squares of tileSize device pixels
+        :param threshold: how many pixels have to change since the last frame passed on
+        """
+        super().__init__(parent)
+
+        self.screen = screen or cursor_screen()
+        self.area = screen_area(rect, self.screen)
+        self.tileSize = tileSize
+        self.threshold = threshold
+        self.stats = Counter()  # frames grabbed, dropped as unchanged and passed on
+
+        self.last = None  # the pixels of the last frame passed on, numpy.ndarray of uint32
+        self.padded = None  # the changed pixels, padded to whole tiles. allocated once for the size of the area
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.captureFrame)
+
+    def start(self):
+        self.captureFrame()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def isActive(self):
+        return self.timer.isActive()
+
+    def captureFrame(self):
+        image = grab_screen(self.screen, self.area).toImage()
+        if image.format() != QImage.Format_RGB32:
+            image = image.convertToFormat(QImage.Format_RGB32)
+        self.stats['grabbed'] += 1
+
+        pixels = image_to_array(image).view(numpy.uint32)[..., 0]
+        boxes = self.compare(pixels)
+        if boxes is None:
+            self.stats['dropped'] += 1
+            return
+        # changes too small to pass are compared again with the next frames, until they add up
+        self.last = pixels
+        self.stats['changed'] += 1
+        self.changed.emit(image, boxes)
+
+    def compare(self, pixels):
+        """
+        :param pixels: numpy.ndarray of uint32, (height, width), the new frame
+        :return: [QRect] the changed areas, None if fewer than threshold pixels changed
+        """
+        height, width = pixels.shape
+        if self.last is None or self.last.shape != pixels.shape:
+            return [QRect(0, 0, width, height)]
+
+        size = self.tileSize
+        rows, columns = -(-height // size), -(-width // size)
+        if self.padded is None or self.padded.shape != (rows * size, columns * size):
+            self.padded = numpy.zeros((rows * size, columns * size), numpy.bool_)
+        numpy.not_equal(pixels, self.last, out=self.padded[:height, :width])
+
+        counts = self.padded.reshape(rows, size, columns, size).sum(axis=(1, 3))
+        if counts.sum() < self.threshold:
+            return None
+        return changed_boxes(counts > 0, size, width, height)
@@ -2,165 +2,13 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.14.1)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x01\xe7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
-\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x64\x49\x44\
-\x41\x54\x48\x89\xed\xd4\x3d\x6b\x13\x50\x14\x06\xe0\xa7\x89\xd1\
-\x8a\x6d\xed\x10\xb3\x38\x38\x58\x84\x3a\x69\x07\x41\xc1\xc1\x45\
-\x7f\x81\x5b\xe6\x0e\x45\x68\x2b\x76\x50\x07\x05\x77\x7f\x85\x74\
-\x72\x68\x71\x13\x1d\x5c\x04\x71\xa8\x68\x8b\x1f\x9b\x6d\xb5\xd0\
-\x36\x14\x31\x60\x42\x13\xdb\xe1\x9e\x60\x08\x6a\x12\xcd\xa2\xe4\
-\x85\xb3\xdc\xc3\x7d\xdf\xf3\x4d\x1f\xff\x3d\x06\xda\xf8\x87\x71\
-\x3a\xac\x80\x11\x64\xb1\x83\x2f\x78\x8f\x37\xd8\xee\x46\x74\x14\
-\xb3\x78\x86\x5d\xec\x75\x60\x4b\xb8\x87\x13\xbf\xcb\x60\x10\xb7\
-\x31\x83\x21\x94\xf1\x14\x2f\xf0\x16\x6b\xf1\x56\xc7\x51\xe4\x23\
-\xb3\x09\x5c\xc1\x31\xd4\x30\x8f\x1b\xd8\x6a\x16\x3a\x8e\xe5\x88\
-\xe6\x35\x8a\x38\xd4\x45\xd6\x19\x5c\xc6\xe3\xe0\xd8\xc4\xb9\x86\
-\xf3\x88\x54\xcb\x3a\x6e\xe2\x40\x17\xc4\x3f\xc3\x55\x7c\x95\x7a\
-\x74\x0a\xee\x86\xea\xf5\xbf\x24\x6e\xc6\x25\x29\xe0\x45\x78\x29\
-\xd5\x37\xdb\x43\x01\x78\x84\x4a\x46\x6a\xce\x46\x28\xf6\x12\xeb\
-\xa2\x8f\x0b\xa8\xe2\x64\x0f\xc9\x0f\xe3\x23\x56\xe1\x3c\xbe\x4b\
-\xb3\x9c\xef\x01\xf9\x41\x3c\x94\xfa\x3a\xd5\x78\x9c\x8b\x87\x4f\
-\xd2\x14\x64\xfe\x90\xfc\x02\x5e\x05\xd7\x03\x2d\x7d\x2d\xa2\x14\
-\xce\x0f\xb8\x85\xb3\x1d\x88\x8d\xe1\x1a\x9e\xc7\xdf\x2a\xee\x34\
-\xc8\x5b\x6f\x51\x01\xd3\x98\xf4\xa3\x5c\x15\x69\x93\x3f\x4b\xf3\
-\x5d\x93\x6e\x52\x01\xe3\xd2\x56\xc3\xb7\x88\xfa\x3e\xde\x35\x08\
-\x7f\x75\xec\x72\xb8\x28\x6d\xe7\x99\x20\x2a\x48\xe7\x84\x74\xa3\
-\x4a\x41\xb4\x82\x27\x61\xe5\x36\xd9\xb6\x45\xae\x49\xa4\x8f\x7f\
-\x04\xfb\x04\x86\x56\xa6\xa5\x3d\xe5\x18\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xe5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
-\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x62\x49\x44\
-\x41\x54\x48\x89\xed\xce\x21\x0e\xc2\x50\x10\x04\xd0\x07\xfc\xd4\
-\x90\x10\x52\x53\xc9\x01\xb8\x6f\x6f\xc2\x7d\xea\x51\x15\x25\xa1\
-\xa2\xc1\x20\x10\x7f\x5b\x51\x83\xd8\x27\x27\xb3\x9b\x21\xa5\x94\
-\x36\x1d\xf0\x40\xf7\x93\x9d\x70\x09\xfa\x67\x34\xc1\x9f\x6b\x25\
-\x1f\x0a\xee\xb8\xed\x18\xb9\xe6\x58\xd0\xa3\xfd\x06\x6f\xbc\x82\
-\xf2\x88\xa5\x92\xcf\x98\x82\x9b\xe7\xae\x79\x29\xa5\x3f\xf1\x01\
-\xbf\x55\x09\x95\xb5\xe4\xcc\x34\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x01\x0e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xa6\x00\x00\x00\xa6\
-\x01\xdd\x7d\xff\x38\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x8b\x49\x44\
-\x41\x54\x48\x89\xed\xd5\x31\x0a\xc2\x40\x10\x05\xd0\x97\x08\x49\
-\x2c\x04\x0b\xaf\xe2\x0d\x2c\x3c\x80\x78\x0b\x2f\xe5\x09\x44\xc1\
-\xe8\x9d\x04\x2b\x41\xab\xb5\xd8\x14\x96\x16\x13\x04\xd9\xa9\xa6\
-\x7a\x7f\x8a\x81\x5f\x19\x67\xe6\xd8\x62\x19\x89\xd6\x58\x61\x8f\
-\x07\x12\x76\x91\x01\x0d\x8e\x03\x9c\xf0\xc2\xa2\x8e\x4c\x40\xf5\
-\xb1\x1f\x70\x8b\x82\x3b\xf4\xf2\xe5\x3d\xce\x58\x8f\x85\x77\x68\
-\x31\x89\xc0\x1b\x9c\x06\xfc\x3a\xe0\x61\x53\xf0\x3f\xc3\xdb\x82\
-\x7f\x83\x4f\x0b\x5e\xf0\xdf\xe0\xe4\x6a\x4b\xb8\x08\xfe\x73\x72\
-\xeb\xdc\x31\xc3\x06\xcf\xe8\x80\x37\x60\xb0\x3b\x9d\xe1\x73\xfd\
-\x67\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\xeb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x02\x98\x00\x00\x02\x98\
-\x01\x36\xd3\x47\xdf\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x68\x49\x44\
-\x41\x54\x48\x89\xdd\x94\x3d\x4b\x03\x41\x10\x86\xdf\xd9\x6c\x2c\
-\x35\x58\x48\x42\x2e\x29\x4c\x1b\x08\xb8\xb9\x56\x50\x43\x40\xf0\
-\x17\x58\xd9\x88\x95\x82\xad\x8d\x60\xeb\x3f\x11\x44\x50\x3b\xd1\
-\x94\x62\xe2\x16\x11\x2b\x45\x25\x42\x38\x2d\x44\xd2\xca\xdd\x8e\
-\x85\x84\xe4\xcc\xf9\x71\x1f\x8d\x4e\xb5\xcc\x2c\xcf\x33\x33\xc5\
-\x00\x7f\x3d\x52\x49\x40\x94\x52\xc5\xa9\xbc\xb5\x9f\xcb\x59\x2f\
-\x4f\x4e\xf7\x76\xb8\x26\x92\x10\xb8\x10\xbb\x00\x16\x98\xf8\xa8\
-\x52\xad\x6e\x0e\xd7\x62\x4d\x50\xb6\xed\x42\x2e\x9f\x3f\x90\x69\
-\xb9\x65\x0c\xcf\x00\xb0\x00\xaa\x67\xb3\x96\x7e\x76\xba\x37\x40\
-\x8c\x09\xca\xb6\x5d\x90\x8c\x06\x18\xf3\xee\x9b\x7b\x28\xd3\xa9\
-\x55\x80\x2e\x00\x10\x04\x6f\xc4\x9a\xa0\x0f\x67\xa0\x04\x00\x20\
-\x64\x8c\x67\x16\xe5\x98\x5c\x36\xc6\x4c\x4a\x36\xeb\x8e\xe3\xf4\
-\x3e\x4a\x21\x43\x29\x55\x74\x49\x34\x00\x4c\x07\x94\x4f\xda\x97\
-\xad\xfa\x70\x42\x86\xed\xdc\x63\x9c\x05\xc3\xa9\xc3\x02\x6b\x23\
-\xd9\x30\x70\xdf\x5a\x46\xe1\x73\x57\xcd\xe6\x43\x24\x41\x54\xf8\
-\xaf\x04\x71\xe0\x3f\x0a\xe2\xc2\xbf\x15\x24\x01\xff\x52\x90\x14\
-\x3c\x50\x90\x24\x7c\x44\x90\x34\x1c\xf8\x74\x8b\x24\xf3\x71\x30\
-\x1c\xf7\x92\xbd\xd9\xb0\x70\x9f\xa0\xac\x54\x89\x89\x7a\x60\xec\
-\xf8\xbf\x50\x87\x05\xd5\xb4\xd6\x8f\x61\xe1\x3e\x41\x8a\xa8\xc6\
-\xcc\xa7\x6d\xdd\xda\x1e\x48\xa2\xad\xc5\xd7\x5e\xff\x51\xb1\xed\
-\x3d\x00\xe3\xcc\x7c\x4e\x10\x35\x80\x27\x24\x9b\xa5\xa8\x9d\xf7\
-\x63\x70\xec\x18\x19\x30\x5e\x85\x20\xc7\x35\xde\xca\xb5\xd6\x77\
-\x71\xc0\xff\x27\xde\x01\xb1\x92\xbd\x19\xce\x13\xe2\x70\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x04\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
-\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x81\x49\x44\
-\x41\x54\x48\x89\xed\xd2\x3b\x0a\xc2\x50\x10\x40\xd1\x93\x90\xf8\
-\xb7\x70\x03\x6e\xc3\x25\xbb\x01\xd7\x64\x29\x88\xbf\xa8\x41\x2d\
-\x54\x98\x4a\x14\x7c\xa9\xde\x85\x29\x2e\x03\xf3\x63\xc8\x64\x32\
-\xc5\x87\x5c\x8d\x49\xf0\x3e\x46\xc1\x87\x18\x04\x1f\xa3\x17\x7c\
-\x8a\x35\xac\xb0\xc1\x16\xf7\x3f\xc7\xb2\x7a\x4d\x32\xfb\x6a\xdf\
-\xdf\xa9\x4a\xb4\x89\x8a\x77\xd2\xa0\x2e\x71\x4d\xd8\xa0\x9b\x13\
-\xa5\xda\x60\x8f\xa6\xc0\x02\x73\xdc\x3c\x5f\xf5\x4d\x8b\x5d\xf0\
-\x0b\x0e\xc1\x1b\x9c\x82\x1f\x71\x4e\x32\x6a\x26\x93\x96\x07\x0d\
-\x6e\x29\x73\x21\xb8\x1d\x49\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x00\xcd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
-\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x4a\x49\x44\
-\x41\x54\x48\x89\xed\xd5\xa1\x11\x00\x20\x0c\x43\xd1\x5f\x8e\xbd\
-\x60\x34\x46\x83\xc9\x40\x14\x04\x9e\x1a\x2e\x31\x75\x79\x57\x15\
-\x03\x26\x81\xc9\xfb\x0e\xa0\x3f\xee\xae\x40\x01\xff\xa0\x3d\x2e\
-\x67\x77\xce\x14\x50\x7c\x45\x80\x00\x01\x02\x04\x08\xf8\x03\x30\
-\x7c\x93\xc3\x46\xff\x00\x61\x59\xdd\x4b\x0a\x29\x38\xa3\xf9\x94\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xdd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
-\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x5a\x49\x44\
-\x41\x54\x48\x89\xed\xd0\xbd\x09\x80\x40\x0c\x86\xe1\xc7\x9f\x29\
-\x6c\xec\x5d\xd5\xb9\xac\x5d\x40\x27\x70\x05\xe5\x6c\x0e\x5b\x0f\
-\xe1\x1a\xc9\x0b\x21\x29\x12\xde\x8f\x34\x98\x31\xa9\xc3\x0e\x0b\
-\x52\xa5\x5a\xdb\x4a\xc9\x1f\x1a\x74\xb9\xbf\xb1\x61\xcc\xf3\x81\
-\xa1\xe0\x26\xf5\xb8\xbe\x65\x73\x96\x2c\x55\x7f\x51\x08\x42\x10\
-\x82\x10\x84\x20\x04\xff\x10\xdc\xe1\xda\x1e\x3b\xe3\x11\xac\x23\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x00\xc6\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -257,6 +105,86 @@ qt_resource_data = b"\
 \xd7\xb5\xc8\xaf\xb3\x19\xd2\x17\x1e\x0b\x89\xc2\x83\xb6\x30\xc3\
 \x4e\x01\xbc\x19\x32\xc3\x46\x85\xb7\x5e\xdf\xd7\x17\xd8\xb9\xa2\
 \x31\xee\x6c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xeb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x02\x98\x00\x00\x02\x98\
+\x01\x36\xd3\x47\xdf\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x68\x49\x44\
+\x41\x54\x48\x89\xdd\x94\x3d\x4b\x03\x41\x10\x86\xdf\xd9\x6c\x2c\
+\x35\x58\x48\x42\x2e\x29\x4c\x1b\x08\xb8\xb9\x56\x50\x43\x40\xf0\
+\x17\x58\xd9\x88\x95\x82\xad\x8d\x60\xeb\x3f\x11\x44\x50\x3b\xd1\
+\x94\x62\xe2\x16\x11\x2b\x45\x25\x42\x38\x2d\x44\xd2\xca\xdd\x8e\
+\x85\x84\xe4\xcc\xf9\x71\x1f\x8d\x4e\xb5\xcc\x2c\xcf\x33\x33\xc5\
+\x00\x7f\x3d\x52\x49\x40\x94\x52\xc5\xa9\xbc\xb5\x9f\xcb\x59\x2f\
+\x4f\x4e\xf7\x76\xb8\x26\x92\x10\xb8\x10\xbb\x00\x16\x98\xf8\xa8\
+\x52\xad\x6e\x0e\xd7\x62\x4d\x50\xb6\xed\x42\x2e\x9f\x3f\x90\x69\
+\xb9\x65\x0c\xcf\x00\xb0\x00\xaa\x67\xb3\x96\x7e\x76\xba\x37\x40\
+\x8c\x09\xca\xb6\x5d\x90\x8c\x06\x18\xf3\xee\x9b\x7b\x28\xd3\xa9\
+\x55\x80\x2e\x00\x10\x04\x6f\xc4\x9a\xa0\x0f\x67\xa0\x04\x00\x20\
+\x64\x8c\x67\x16\xe5\x98\x5c\x36\xc6\x4c\x4a\x36\xeb\x8e\xe3\xf4\
+\x3e\x4a\x21\x43\x29\x55\x74\x49\x34\x00\x4c\x07\x94\x4f\xda\x97\
+\xad\xfa\x70\x42\x86\xed\xdc\x63\x9c\x05\xc3\xa9\xc3\x02\x6b\x23\
+\xd9\x30\x70\xdf\x5a\x46\xe1\x73\x57\xcd\xe6\x43\x24\x41\x54\xf8\
+\xaf\x04\x71\xe0\x3f\x0a\xe2\xc2\xbf\x15\x24\x01\xff\x52\x90\x14\
+\x3c\x50\x90\x24\x7c\x44\x90\x34\x1c\xf8\x74\x8b\x24\xf3\x71\x30\
+\x1c\xf7\x92\xbd\xd9\xb0\x70\x9f\xa0\xac\x54\x89\x89\x7a\x60\xec\
+\xf8\xbf\x50\x87\x05\xd5\xb4\xd6\x8f\x61\xe1\x3e\x41\x8a\xa8\xc6\
+\xcc\xa7\x6d\xdd\xda\x1e\x48\xa2\xad\xc5\xd7\x5e\xff\x51\xb1\xed\
+\x3d\x00\xe3\xcc\x7c\x4e\x10\x35\x80\x27\x24\x9b\xa5\xa8\x9d\xf7\
+\x63\x70\xec\x18\x19\x30\x5e\x85\x20\xc7\x35\xde\xca\xb5\xd6\x77\
+\x71\xc0\xff\x27\xde\x01\xb1\x92\xbd\x19\xce\x13\xe2\x70\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xe7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
+\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x64\x49\x44\
+\x41\x54\x48\x89\xed\xd4\x3d\x6b\x13\x50\x14\x06\xe0\xa7\x89\xd1\
+\x8a\x6d\xed\x10\xb3\x38\x38\x58\x84\x3a\x69\x07\x41\xc1\xc1\x45\
+\x7f\x81\x5b\xe6\x0e\x45\x68\x2b\x76\x50\x07\x05\x77\x7f\x85\x74\
+\x72\x68\x71\x13\x1d\x5c\x04\x71\xa8\x68\x8b\x1f\x9b\x6d\xb5\xd0\
+\x36\x14\x31\x60\x42\x13\xdb\xe1\x9e\x60\x08\x6a\x12\xcd\xa2\xe4\
+\x85\xb3\xdc\xc3\x7d\xdf\xf3\x4d\x1f\xff\x3d\x06\xda\xf8\x87\x71\
+\x3a\xac\x80\x11\x64\xb1\x83\x2f\x78\x8f\x37\xd8\xee\x46\x74\x14\
+\xb3\x78\x86\x5d\xec\x75\x60\x4b\xb8\x87\x13\xbf\xcb\x60\x10\xb7\
+\x31\x83\x21\x94\xf1\x14\x2f\xf0\x16\x6b\xf1\x56\xc7\x51\xe4\x23\
+\xb3\x09\x5c\xc1\x31\xd4\x30\x8f\x1b\xd8\x6a\x16\x3a\x8e\xe5\x88\
+\xe6\x35\x8a\x38\xd4\x45\xd6\x19\x5c\xc6\xe3\xe0\xd8\xc4\xb9\x86\
+\xf3\x88\x54\xcb\x3a\x6e\xe2\x40\x17\xc4\x3f\xc3\x55\x7c\x95\x7a\
+\x74\x0a\xee\x86\xea\xf5\xbf\x24\x6e\xc6\x25\x29\xe0\x45\x78\x29\
+\xd5\x37\xdb\x43\x01\x78\x84\x4a\x46\x6a\xce\x46\x28\xf6\x12\xeb\
+\xa2\x8f\x0b\xa8\xe2\x64\x0f\xc9\x0f\xe3\x23\x56\xe1\x3c\xbe\x4b\
+\xb3\x9c\xef\x01\xf9\x41\x3c\x94\xfa\x3a\xd5\x78\x9c\x8b\x87\x4f\
+\xd2\x14\x64\xfe\x90\xfc\x02\x5e\x05\xd7\x03\x2d\x7d\x2d\xa2\x14\
+\xce\x0f\xb8\x85\xb3\x1d\x88\x8d\xe1\x1a\x9e\xc7\xdf\x2a\xee\x34\
+\xc8\x5b\x6f\x51\x01\xd3\x98\xf4\xa3\x5c\x15\x69\x93\x3f\x4b\xf3\
+\x5d\x93\x6e\x52\x01\xe3\xd2\x56\xc3\xb7\x88\xfa\x3e\xde\x35\x08\
+\x7f\x75\xec\x72\xb8\x28\x6d\xe7\x99\x20\x2a\x48\xe7\x84\x74\xa3\
+\x4a\x41\xb4\x82\x27\x61\xe5\x36\xd9\xb6\x45\xae\x49\xa4\x8f\x7f\
+\x04\xfb\x04\x86\x56\xa6\xa5\x3d\xe5\x18\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xb1\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x00\x63\x49\x44\x41\x54\x48\x89\x63\
+\x64\x60\x60\xf8\xcf\x40\x63\x40\x4b\x0b\xfe\x33\xd1\xd0\x70\x06\
+\x06\x06\x06\x06\x16\x34\xfe\x01\x1c\xea\x26\xe0\x10\x2f\xc0\x21\
+\xee\x00\x63\xd0\xdc\x07\xa3\x16\x0c\xbc\x05\xe8\xa9\x88\xd4\xd4\
+\x82\x4b\x3d\x1c\x0c\xfd\x20\x1a\xb5\x80\x20\x60\x64\x80\x94\xa6\
+\x8c\x50\xfe\x01\x1c\xea\xc8\x2d\x8b\x68\x5f\x9a\x8e\x5a\x30\xf0\
+\x16\x30\x30\x0c\xf5\x3a\x19\x96\x0f\x68\x06\x00\x4c\x86\x0d\xb7\
+\xa6\xbf\x16\x10\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
 \x00\x00\x02\x33\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -295,6 +223,25 @@ qt_resource_data = b"\
 \x61\x71\x1c\x67\x4a\xa9\x77\x44\x64\xf5\x00\xee\x45\xd7\x6c\xbb\
 \x92\x3d\x33\x4e\xc7\xf6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
 \x60\x82\
+\x00\x00\x01\x0e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xa6\x00\x00\x00\xa6\
+\x01\xdd\x7d\xff\x38\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x8b\x49\x44\
+\x41\x54\x48\x89\xed\xd5\x31\x0a\xc2\x40\x10\x05\xd0\x97\x08\x49\
+\x2c\x04\x0b\xaf\xe2\x0d\x2c\x3c\x80\x78\x0b\x2f\xe5\x09\x44\xc1\
+\xe8\x9d\x04\x2b\x41\xab\xb5\xd8\x14\x96\x16\x13\x04\xd9\xa9\xa6\
+\x7a\x7f\x8a\x81\x5f\x19\x67\xe6\xd8\x62\x19\x89\xd6\x58\x61\x8f\
+\x07\x12\x76\x91\x01\x0d\x8e\x03\x9c\xf0\xc2\xa2\x8e\x4c\x40\xf5\
+\xb1\x1f\x70\x8b\x82\x3b\xf4\xf2\xe5\x3d\xce\x58\x8f\x85\x77\x68\
+\x31\x89\xc0\x1b\x9c\x06\xfc\x3a\xe0\x61\x53\xf0\x3f\xc3\xdb\x82\
+\x7f\x83\x4f\x0b\x5e\xf0\xdf\xe0\xe4\x6a\x4b\xb8\x08\xfe\x73\x72\
+\xeb\xdc\x31\xc3\x06\xcf\xe8\x80\x37\x60\xb0\x3b\x9d\xe1\x73\xfd\
+\x67\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x01\x64\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -320,6 +267,21 @@ qt_resource_data = b"\
 \xf2\xa9\xe1\x0f\x4d\xcd\x2a\x9e\xb1\xdf\x05\x3e\x09\xf8\x06\x0e\
 \x33\x88\x04\x0f\x53\xf9\xbf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
 \x42\x60\x82\
+\x00\x00\x00\xcd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
+\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x4a\x49\x44\
+\x41\x54\x48\x89\xed\xd5\xa1\x11\x00\x20\x0c\x43\xd1\x5f\x8e\xbd\
+\x60\x34\x46\x83\xc9\x40\x14\x04\x9e\x1a\x2e\x31\x75\x79\x57\x15\
+\x03\x26\x81\xc9\xfb\x0e\xa0\x3f\xee\xae\x40\x01\xff\xa0\x3d\x2e\
+\x67\x77\xce\x14\x50\x7c\x45\x80\x00\x01\x02\x04\x08\xf8\x03\x30\
+\x7c\x93\xc3\x46\xff\x00\x61\x59\xdd\x4b\x0a\x29\x38\xa3\xf9\x94\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x01\x0e\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -339,6 +301,39 @@ qt_resource_data = b"\
 \x7f\x83\x4f\x0b\x5e\xf0\xdf\xe0\xe4\x6a\x4b\xb8\x08\xfe\x73\x72\
 \xeb\xdc\x31\xc3\x06\xcf\xe8\x80\x37\x60\xb0\x3b\x9d\xe1\x73\xfd\
 \x67\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xdd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
+\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x5a\x49\x44\
+\x41\x54\x48\x89\xed\xd0\xbd\x09\x80\x40\x0c\x86\xe1\xc7\x9f\x29\
+\x6c\xec\x5d\xd5\xb9\xac\x5d\x40\x27\x70\x05\xe5\x6c\x0e\x5b\x0f\
+\xe1\x1a\xc9\x0b\x21\x29\x12\xde\x8f\x34\x98\x31\xa9\xc3\x0e\x0b\
+\x52\xa5\x5a\xdb\x4a\xc9\x1f\x1a\x74\xb9\xbf\xb1\x61\xcc\xf3\x81\
+\xa1\xe0\x26\xf5\xb8\xbe\x65\x73\x96\x2c\x55\x7f\x51\x08\x42\x10\
+\x82\x10\x84\x20\x04\xff\x10\xdc\xe1\xda\x1e\x3b\xe3\x11\xac\x23\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xe5\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
+\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x62\x49\x44\
+\x41\x54\x48\x89\xed\xce\x21\x0e\xc2\x50\x10\x04\xd0\x07\xfc\xd4\
+\x90\x10\x52\x53\xc9\x01\xb8\x6f\x6f\xc2\x7d\xea\x51\x15\x25\xa1\
+\xa2\xc1\x20\x10\x7f\x5b\x51\x83\xd8\x27\x27\xb3\x9b\x21\xa5\x94\
+\x36\x1d\xf0\x40\xf7\x93\x9d\x70\x09\xfa\x67\x34\xc1\x9f\x6b\x25\
+\x1f\x0a\xee\xb8\xed\x18\xb9\xe6\x58\xd0\xa3\xfd\x06\x6f\xbc\x82\
+\xf2\x88\xa5\x92\xcf\x98\x82\x9b\xe7\xae\x79\x29\xa5\x3f\xf1\x01\
+\xbf\x55\x09\x95\xb5\xe4\xcc\x34\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
 \x00\x00\x00\xe8\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -356,6 +351,25 @@ qt_resource_data = b"\
 \x57\xdc\x2b\xcb\x9e\x78\x14\xf2\x8c\xe5\x6d\x36\x37\x9d\x17\x42\
 \xf8\xcd\x0a\xed\x87\x24\x53\x2e\xa7\xf9\xe9\x00\x00\x00\x00\x49\
 \x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x04\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x14\xc3\x00\x00\x14\xc3\
+\x01\x15\x70\x4d\x42\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x81\x49\x44\
+\x41\x54\x48\x89\xed\xd2\x3b\x0a\xc2\x50\x10\x40\xd1\x93\x90\xf8\
+\xb7\x70\x03\x6e\xc3\x25\xbb\x01\xd7\x64\x29\x88\xbf\xa8\x41\x2d\
+\x54\x98\x4a\x14\x7c\xa9\xde\x85\x29\x2e\x03\xf3\x63\xc8\x64\x32\
+\xc5\x87\x5c\x8d\x49\xf0\x3e\x46\xc1\x87\x18\x04\x1f\xa3\x17\x7c\
+\x8a\x35\xac\xb0\xc1\x16\xf7\x3f\xc7\xb2\x7a\x4d\x32\xfb\x6a\xdf\
+\xdf\xa9\x4a\xb4\x89\x8a\x77\xd2\xa0\x2e\x71\x4d\xd8\xa0\x9b\x13\
+\xa5\xda\x60\x8f\xa6\xc0\x02\x73\xdc\x3c\x5f\xf5\x4d\x8b\x5d\xf0\
+\x0b\x0e\xc1\x1b\x9c\x82\x1f\x71\x4e\x32\x6a\x26\x93\x96\x07\x0d\
+\x6e\x29\x73\x21\xb8\x1d\x49\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
 "
 
 qt_resource_name = b"\
@@ -367,34 +381,6 @@ qt_resource_name = b"\
 \x00\x06\xfa\x5e\
 \x00\x69\
 \x00\x63\x00\x6f\x00\x6e\
-\x00\x0b\
-\x07\x50\x31\x47\
-\x00\x65\
-\x00\x6c\x00\x6c\x00\x69\x00\x70\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x0e\x5c\xe3\x67\
-\x00\x70\
-\x00\x65\x00\x6e\x00\x73\x00\x69\x00\x7a\x00\x65\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x0c\x5e\x06\xa7\
-\x00\x6c\
-\x00\x61\x00\x79\x00\x65\x00\x72\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x06\xc1\x57\xa7\
-\x00\x70\
-\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x0e\x5e\xe3\x67\
-\x00\x70\
-\x00\x65\x00\x6e\x00\x73\x00\x69\x00\x7a\x00\x65\x00\x33\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0b\xa7\x58\x47\
-\x00\x72\
-\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0c\xf7\x58\x07\
-\x00\x74\
-\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
 \x00\x48\x59\x27\
 \x00\x6c\
@@ -407,42 +393,75 @@ qt_resource_name = b"\
 \x06\x98\x83\x27\
 \x00\x63\
 \x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x06\xc1\x57\xa7\
+\x00\x70\
+\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x07\x50\x31\x47\
+\x00\x65\
+\x00\x6c\x00\x6c\x00\x69\x00\x70\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x07\xa8\x40\x07\
+\x00\x72\
+\x00\x65\x00\x64\x00\x61\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
 \x08\xc8\x58\x67\
 \x00\x73\
 \x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x09\
-\x0b\x9e\x84\x87\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
 \x09\x6a\x86\x67\
 \x00\x61\
 \x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0b\x9e\x84\x87\
+\x00\x63\
+\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0b\xa7\x58\x47\
+\x00\x72\
+\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0c\x5e\x06\xa7\
+\x00\x6c\
+\x00\x61\x00\x79\x00\x65\x00\x72\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\xf7\x58\x07\
+\x00\x74\
+\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x0e\x5c\xe3\x67\
+\x00\x70\
+\x00\x65\x00\x6e\x00\x73\x00\x69\x00\x7a\x00\x65\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0c\
 \x0e\x5d\xe3\x67\
 \x00\x70\
 \x00\x65\x00\x6e\x00\x73\x00\x69\x00\x7a\x00\x65\x00\x32\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x0e\x5e\xe3\x67\
+\x00\x70\
+\x00\x65\x00\x6e\x00\x73\x00\x69\x00\x7a\x00\x65\x00\x33\x00\x2e\x00\x70\x00\x6e\x00\x67\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x16\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x03\
-\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x08\x8f\
-\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x00\x09\x59\
-\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x94\
-\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x03\xe6\
+\x00\x00\x00\x16\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x03\
 \x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x1a\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x28\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x11\xc7\
-\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x00\x10\x5f\
-\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x06\xdd\
-\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x02\xd4\
-\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x07\xae\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x01\xeb\
-\x00\x00\x01\x60\x00\x00\x00\x00\x00\x01\x00\x00\x12\xd9\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x05\xd5\
+\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x00\xca\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x04\x05\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x05\x99\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x07\x88\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x09\x73\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x28\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x5f\
+\x00\x00\x00\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x71\
+\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xd9\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x0f\xaa\
+\x00\x00\x01\x28\x00\x00\x00\x00\x00\x01\x00\x00\x10\xbc\
+\x00\x00\x01\x3e\x00\x00\x00\x00\x00\x01\x00\x00\x11\x9d\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x12\x86\
+\x00\x00\x01\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x13\x72\
 "
 
 qt_resource_struct_v2 = b"\
@@ -450,36 +469,38 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x16\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x03\
+\x00\x00\x00\x16\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x08\x8f\
-\x00\x00\x01\x70\x39\xd9\x27\x8a\
-\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x00\x09\x59\
-\x00\x00\x01\x70\x39\xd9\x27\x91\
-\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x94\
-\x00\x00\x01\x70\x39\xd9\x27\x86\
-\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x03\xe6\
-\x00\x00\x01\x70\x39\xd9\x27\x8c\
 \x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x70\x39\xd9\x27\x87\
-\x00\x00\x01\x1a\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x28\
-\x00\x00\x01\x70\x39\xd9\x27\x90\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x11\xc7\
-\x00\x00\x01\x70\x39\xd9\x27\x86\
-\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x00\x10\x5f\
-\x00\x00\x01\x70\x39\xd9\x27\x86\
-\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x06\xdd\
-\x00\x00\x01\x70\x39\xd9\x27\x90\
-\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x02\xd4\
-\x00\x00\x01\x70\x39\xd9\x27\x88\
-\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x07\xae\
-\x00\x00\x01\x70\x39\xd9\x27\x91\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x01\xeb\
-\x00\x00\x01\x70\x39\xd9\x27\x8d\
-\x00\x00\x01\x60\x00\x00\x00\x00\x00\x01\x00\x00\x12\xd9\
-\x00\x00\x01\x70\x39\xd9\x27\x8f\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x05\xd5\
-\x00\x00\x01\x70\x39\xd9\x27\x8f\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x00\xca\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x04\x05\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x05\x99\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x07\x88\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x09\x73\
+\x00\x00\x01\xa1\x48\xd2\xd0\xde\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x28\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x5f\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x71\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xd9\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x0f\xaa\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x01\x28\x00\x00\x00\x00\x00\x01\x00\x00\x10\xbc\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x01\x3e\x00\x00\x00\x00\x00\x01\x00\x00\x11\x9d\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x12\x86\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
+\x00\x00\x01\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x13\x72\
+\x00\x00\x01\x70\xf7\xad\x8c\x98\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import Qt, QEvent, QPoint, QPointF, QRect
+from PyQt5.QtGui import QColor, QImage, QMouseEvent, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from pyqt_screenshot import constant
+from pyqt_screenshot.screenshot import Screenshot
+
+MOUSE_EVENTS = {'press': QEvent.MouseButtonPress, 'move': QEvent.MouseMove, 'release': QEvent.MouseButtonRelease}
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def mouse():
+    """ :return: function sending a 'press', 'move' or 'release' of the left button at x, y to a widget """
+    def send(widget, kind, x, y):
+        button = Qt.NoButton if kind == 'move' else Qt.LeftButton
+        buttons = Qt.LeftButton if kind == 'press' else Qt.NoButton
+        QApplication.sendEvent(widget, QMouseEvent(MOUSE_EVENTS[kind], QPointF(x, y), QPointF(x, y), button,
+                                                   buttons, Qt.NoModifier))
+    return send
+
+
+@pytest.fixture
+def make_overlay(qapp, monkeypatch):
+    """
+    :return: function building a hidden Screenshot over an image instead of a grab of the screens, or over the
+             grab of a session
+    """
+    overlays = []
+    grab = Screenshot.getscreenshot
+
+    def make(image=None, flags=constant.CLIPBOARD, session=None):
+        if image is None:
+            image = QImage(640, 480, QImage.Format_RGB32)
+            image.fill(QColor(240, 240, 240))
+
+        def getscreenshot(self):
+            if self.session is not None:
+                return grab(self)
+            self.screenImage = image
+            self.screenPixel = QPixmap.fromImage(image)
+            self.desktopGeometry = QRect(QPoint(0, 0), image.size() / image.devicePixelRatio())
+
+        monkeypatch.setattr(Screenshot, 'getscreenshot', getscreenshot)
+        overlay = Screenshot(flags, hidden=True, session=session)
+        overlays.append(overlay)
+        return overlay
+
+    yield make
+    for overlay in overlays:
+        overlay.close()
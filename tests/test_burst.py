@@ -0,0 +1,23 @@
+from concurrent.futures import Future
+
+from PyQt5.QtCore import QRect
+
+from pyqt_screenshot.burst import BurstCapture
+
+
+def test_slot_being_encoded_is_not_painted(qapp):
+    burst = BurstCapture(QRect(0, 0, 40, 30), 4, 10, capacity=2)
+    burst.captureFrame()
+    burst.captureFrame()
+    frame = burst.ring[0]
+    pending = Future()
+    burst.encoding[0] = pending
+
+    # the next frame goes into slot 0, it waits for the encode
+    burst.captureFrame()
+    assert (burst.captured, burst.skipped) == (2, 1)
+
+    pending.set_result(None)
+    burst.captureFrame()
+    assert (burst.captured, burst.skipped) == (3, 1)
+    assert burst.ring[0] is frame and burst.encoding[0] is None
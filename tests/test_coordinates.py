@@ -0,0 +1,100 @@
+from math import floor
+
+import pytest
+
+from PyQt5.QtCore import QPoint, QRect, QSize
+from PyQt5.QtGui import QColor, QImage, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from pyqt_screenshot import capture, constant
+from pyqt_screenshot.coordinates import to_device, device_rect, crop_rect, device_size
+from pyqt_screenshot.screenshot import Screenshot
+
+SCALES = (1.25, 1.5, 1.75)
+
+
+@pytest.mark.parametrize('scale, value, expected', [
+    (1.25, 1, 1), (1.25, 2, 3), (1.25, 3, 4), (1.25, 6, 8),
+    (1.5, 1, 2), (1.5, 2, 3), (1.5, 3, 5), (1.5, 5, 8),
+    (1.75, 1, 2), (1.75, 2, 4), (1.75, 3, 5), (1.75, 6, 11),
+])
+def test_to_device_rounds_half_up(scale, value, expected):
+    assert to_device(value, scale) == expected
+
+
+@pytest.mark.parametrize('scale', SCALES)
+def test_device_rect_of_adjacent_areas_share_their_edge(scale):
+    for x in range(1, 12):
+        left = device_rect(QRect(0, 0, x, 1), scale)
+        right = device_rect(QRect(x, 0, 7, 1), scale)
+        assert left.right() + 1 == right.left()
+
+
+@pytest.mark.parametrize('scale', SCALES)
+@pytest.mark.parametrize('x', [1, 3, 5, 7])
+def test_odd_origin_pixel(scale, x):
+    rect = device_rect(QRect(x, x, 1, 1), scale)
+    assert rect.left() == to_device(x, scale)
+    assert rect.width() == to_device(x + 1, scale) - to_device(x, scale)
+    assert rect.width() >= 1
+
+
+@pytest.mark.parametrize('scale', SCALES)
+def test_crop_rect_clips_to_the_grab(scale):
+    bounds = QRect(0, 0, 100, 80)
+    assert crop_rect(QRect(90, 70, 20, 20), bounds, scale) == device_rect(QRect(90, 70, 10, 10), scale)
+    # dragged up left, both corners are included
+    assert crop_rect(QRect(QPoint(30, 20), QPoint(10, 5)), bounds, scale) == device_rect(QRect(10, 5, 21, 16), scale)
+
+
+@pytest.mark.parametrize('scale, size, expected', [
+    (1.25, QSize(3, 5), QSize(4, 6)), (1.5, QSize(3, 5), QSize(5, 8)), (1.75, QSize(3, 5), QSize(5, 9)),
+])
+def test_device_size(scale, size, expected):
+    assert device_size(size, scale) == expected
+
+
+def q_round(value):
+    return floor(value + 0.5)
+
+
+def screen_image(screen, scale):
+    """ the whole screen, the device pixels of the top left corner colored after their position """
+    image = QImage(device_size(screen.geometry().size(), scale), QImage.Format_RGB32)
+    image.fill(QColor(0, 0, 0))
+    for y in range(64):
+        for x in range(64):
+            image.setPixel(x, y, QColor(x * 4, y * 4, 128).rgb())
+    image.setDevicePixelRatio(scale)
+    return image
+
+
+@pytest.mark.parametrize('scale', SCALES)
+@pytest.mark.parametrize('rect', [QRect(1, 1, 1, 1), QRect(3, 5, 1, 1), QRect(7, 3, 10, 9), QRect(0, 0, 33, 21)])
+def test_grab_region_crops_like_the_overlay(qapp, monkeypatch, scale, rect):
+    screen = QApplication.primaryScreen()
+    image = screen_image(screen, scale)
+
+    def grab_screen(screen, area=None):
+        # the way QScreen.grabWindow() maps an area to native pixels, the origin and the size rounded apart
+        native = QRect(QPoint(q_round(area.x() * scale), q_round(area.y() * scale)),
+                       QSize(q_round(area.width() * scale), q_round(area.height() * scale)))
+        pixmap = QPixmap.fromImage(image.copy(native))
+        pixmap.setDevicePixelRatio(scale)
+        return pixmap
+
+    def getscreenshot(self):
+        self.screenImage = image
+        self.screenPixel = QPixmap.fromImage(image)
+        self.desktopGeometry = QRect(QPoint(0, 0), screen.geometry().size())
+
+    monkeypatch.setattr(capture, 'grab_screen', grab_screen)
+    monkeypatch.setattr(Screenshot, 'getscreenshot', getscreenshot)
+    overlay = Screenshot(constant.CLIPBOARD, hidden=True)
+    overlay.selected_area = QRect(rect)
+    expected = image.copy(overlay.deviceSelection())
+    overlay.close()
+
+    grabbed = capture.grab_region(rect, screen)
+    assert grabbed.size() == expected.size()
+    assert grabbed.convertToFormat(QImage.Format_RGB32) == expected
@@ -0,0 +1,34 @@
+from array import array
+
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QColor
+
+from pyqt_screenshot.annotation import Style, StrokeItem, simplify_points
+from pyqt_screenshot.constant import FREEPEN_TOLERANCE
+
+
+def test_dense_straight_stroke_is_reduced():
+    stroke = StrokeItem(0, 100, Style(QColor(255, 0, 0), 3), QRectF(0, 0, 1000, 1000))
+    for x in range(1, 401):
+        # a hand drawn line wobbles well under the tolerance
+        stroke.addPoint(x * 0.5, 100 + (x % 2) * 0.2, force=x == 400)
+    # moves closer than the minimum distance were dropped while drawing
+    assert len(stroke.points) // 2 < 200
+
+    annotation = stroke.finish()
+    assert list(annotation.points) == [0, 100, 200, 100]
+    assert annotation.points[-2:] == stroke.points[-2:]
+
+
+def test_corner_is_kept():
+    points = array('d')
+    for i in range(101):
+        points.extend((i, 0))
+    for i in range(1, 101):
+        points.extend((100, i))
+    simplified = simplify_points(points, FREEPEN_TOLERANCE)
+    assert list(simplified) == [0, 0, 100, 0, 100, 100]
+
+
+def test_short_strokes_are_kept():
+    assert list(simplify_points(array('d', (0, 0, 5, 5)), FREEPEN_TOLERANCE)) == [0, 0, 5, 5]
@@ -0,0 +1,90 @@
+from PyQt5.QtCore import QRect
+
+from pyqt_screenshot import constant
+from pyqt_screenshot.constant import UNDO_LIMIT
+from pyqt_screenshot.history import RemoveAnnotationCommand, ModifyAnnotationCommand, ClearSelectionCommand
+
+
+def overlay_with_selection(make_overlay):
+    overlay = make_overlay(flags=constant.CLIPBOARD | constant.RECT)
+    overlay.setSelection(QRect(0, 0, 400, 300), constant.ACTION_MOVE_SELECTED)
+    return overlay
+
+
+def test_add_undo_redo(make_overlay):
+    overlay = overlay_with_selection(make_overlay)
+    overlay.drawRect(10, 10, 50, 40, True)
+    step = overlay.drawListResult[0]
+
+    overlay.history.undo()
+    assert overlay.drawListResult == []
+    assert overlay.annotationAt(step.bounds().center()) is None
+    overlay.history.redo()
+    assert overlay.drawListResult == [step]
+
+
+def test_remove_undo_redo(make_overlay):
+    overlay = overlay_with_selection(make_overlay)
+    overlay.drawRect(10, 10, 50, 40, True)
+    overlay.drawRect(100, 100, 150, 140, True)
+    first, second = overlay.drawListResult
+
+    overlay.history.push(RemoveAnnotationCommand(overlay, 0))
+    assert overlay.drawListResult == [second]
+    overlay.history.undo()
+    assert overlay.drawListResult == [first, second]
+    overlay.history.redo()
+    assert overlay.drawListResult == [second]
+
+
+def test_moves_of_one_annotation_are_one_undo_step(make_overlay):
+    overlay = overlay_with_selection(make_overlay)
+    overlay.drawRect(10, 10, 50, 40, True)
+    original = overlay.drawListResult[0]
+    count = overlay.history.count()
+
+    for i in range(5):
+        overlay.history.push(ModifyAnnotationCommand(overlay, 0, overlay.drawListResult[0].translated(3, 2),
+                                                     merge=True))
+    assert overlay.history.count() == count + 1
+    assert (overlay.drawListResult[0].x1, overlay.drawListResult[0].y1) == (original.x1 + 15, original.y1 + 10)
+
+    overlay.history.undo()
+    assert overlay.drawListResult == [original]
+
+
+def test_moves_not_asked_to_merge_are_undone_one_by_one(make_overlay):
+    overlay = overlay_with_selection(make_overlay)
+    overlay.drawRect(10, 10, 50, 40, True)
+    count = overlay.history.count()
+
+    for i in range(3):
+        overlay.history.push(ModifyAnnotationCommand(overlay, 0, overlay.drawListResult[0].translated(3, 2)))
+    assert overlay.history.count() == count + 3
+
+
+def test_undo_limit(make_overlay):
+    overlay = overlay_with_selection(make_overlay)
+    for i in range(UNDO_LIMIT + 5):
+        overlay.drawRect(i, 10, i + 20, 40, True)
+    assert overlay.history.count() == UNDO_LIMIT
+
+    while overlay.history.canUndo():
+        overlay.history.undo()
+    # the oldest steps can not be undone anymore
+    assert len(overlay.drawListResult) == 5
+
+
+def test_clearing_two_selections_takes_two_undo_steps(make_overlay):
+    overlay = overlay_with_selection(make_overlay)
+    overlay.history.push(ClearSelectionCommand(overlay))
+    overlay.setSelection(QRect(50, 50, 100, 100), constant.ACTION_MOVE_SELECTED)
+    overlay.history.push(ClearSelectionCommand(overlay))
+    # clearing the cleared selection again changes nothing
+    overlay.history.push(ClearSelectionCommand(overlay))
+    assert overlay.history.count() == 2
+
+    overlay.history.undo()
+    assert overlay.selected_area == QRect(50, 50, 100, 100)
+    overlay.history.undo()
+    assert overlay.selected_area == QRect(0, 0, 400, 300)
@@ -0,0 +1,63 @@
+from PyQt5.QtCore import QPoint, QRect
+from PyQt5.QtTest import QTest
+
+
+def drag_selection(overlay, mouse, start, points):
+    """ press at start and move through points, one frame per move, without releasing """
+    viewport = overlay.viewport()
+    mouse(viewport, 'move', *start)
+    overlay.renderFrame()
+    mouse(viewport, 'press', *start)
+    for point in points:
+        mouse(viewport, 'move', *point)
+        overlay.renderFrame()
+
+
+def test_dragging_a_selection_creates_no_scene_items(make_overlay, mouse):
+    overlay = make_overlay()
+    overlay.renderFrame()
+    created = overlay.itemStats['overlay']
+    items = len(overlay.graphics_scene.items())
+
+    drag_selection(overlay, mouse, (50, 50), [(50 + i * 7, 50 + i * 5) for i in range(1, 30)])
+    mouse(overlay.viewport(), 'release', 260, 195)
+    overlay.renderFrame()
+
+    assert overlay.selected_area == QRect(50, 50, 211, 146)
+    assert overlay.itemStats['overlay'] == created
+    assert len(overlay.graphics_scene.items()) == items
+
+
+def test_a_burst_of_mouse_moves_is_rendered_once(make_overlay, mouse):
+    overlay = make_overlay()
+    overlay.setMaxFps(30)
+    overlay.renderFrame()
+    overlay.frameStats.clear()
+
+    # all of them arrive before the frame is due
+    for i in range(40):
+        mouse(overlay.viewport(), 'move', 100 + i, 80 + i)
+    QTest.qWait(2 * 1000 // 30)
+
+    assert overlay.frameStats['requested'] == 40
+    assert overlay.frameStats['rendered'] < overlay.frameStats['requested']
+    assert overlay.frameStats['rendered'] <= 2
+    assert overlay.frameStats['moves_dropped'] == 39
+    # the latest move is the one rendered
+    assert overlay.mousePoint == QPoint(139, 119)
+
+
+def test_moving_a_small_selection_repaints_a_fraction_of_the_screen(make_overlay, mouse):
+    overlay = make_overlay()
+    drag_selection(overlay, mouse, (200, 150), [(300, 230)])
+    mouse(overlay.viewport(), 'release', 300, 230)
+    overlay.renderFrame()
+    overlay.frameStats.clear()
+
+    # drag the selection from inside it by a few pixels
+    drag_selection(overlay, mouse, (250, 190), [(254, 193)])
+    mouse(overlay.viewport(), 'release', 254, 193)
+    overlay.renderFrame()
+
+    assert overlay.selected_area == QRect(204, 153, 101, 81)
+    assert 0 < overlay.frameStats['repainted_pixels'] < overlay.frameStats['viewport_pixels'] / 10
@@ -0,0 +1,38 @@
+from PyQt5.QtCore import QRect, QRectF
+from PyQt5.QtGui import QColor, QImage, QPainter
+
+from pyqt_screenshot import constant
+from pyqt_screenshot.session import load_session
+
+
+def test_save_and_load_session(make_overlay, tmp_path):
+    image = QImage(640, 480, QImage.Format_RGB32)
+    image.fill(QColor(240, 240, 240))
+    image.setPixel(150, 120, QColor(200, 30, 40).rgb())
+    overlay = make_overlay(image, constant.CLIPBOARD | constant.RECT | constant.LINE)
+    overlay.selected_area = QRect(100, 80, 200, 150)
+    overlay.drawRect(110, 90, 180, 140, True)
+    overlay.drawLine(120, 200, 250, 210, True)
+    steps = [step.toDict() for step in overlay.drawListResult]
+    fileName = overlay.saveSession(str(tmp_path / 'capture.pqss')).result()
+
+    session = load_session(fileName)
+    assert session.selection == QRect(100, 80, 200, 150)
+    assert [step.toDict() for step in session.annotations()] == steps
+    assert session.image().pixel(150, 120) == image.pixel(150, 120)
+    assert session.image().pixel(10, 10) == image.pixel(10, 10)
+
+    reopened = make_overlay(flags=constant.CLIPBOARD | constant.RECT | constant.LINE, session=session)
+    reopened.showOverlay()
+    assert reopened.selected_area == QRect(100, 80, 200, 150)
+    assert [step.toDict() for step in reopened.drawListResult] == steps
+    # the mapped pixels are shown as they are, no pixmap copy of them is made
+    assert reopened.screenPixel is None
+
+    shown = QImage(640, 480, QImage.Format_RGB32)
+    painter = QPainter(shown)
+    reopened.graphics_scene.render(painter, QRectF(shown.rect()), reopened.graphics_scene.sceneRect())
+    painter.end()
+    assert shown.pixel(150, 120) == image.pixel(150, 120)
+    reopened.close()
+    session.close()
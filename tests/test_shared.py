@@ -0,0 +1,62 @@
+from multiprocessing import shared_memory
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QImage
+
+from pyqt_screenshot import constant
+from pyqt_screenshot.shared import publish_shared, read_shared, publish_image, open_raw, unlink_shared
+
+
+def exists(name):
+    try:
+        shared_memory.SharedMemory(name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def test_read_shared_frees_the_block():
+    name = publish_shared(b'screenshot')
+    assert read_shared(name, 10) == b'screenshot'
+    assert not exists(name)
+
+
+def test_raw_image_round_trip_and_unlink():
+    image = QImage(50, 40, QImage.Format_RGB32)
+    image.fill(QColor(10, 20, 30))
+    image.setPixel(49, 39, QColor(200, 100, 50).rgb())
+    name = publish_image(image)
+
+    raw = open_raw(name)
+    assert (raw.width, raw.height, raw.bytesPerLine) == (50, 40, 200)
+    copy = raw.image().copy()
+    raw.close()
+    raw.unlink()
+
+    assert copy == image
+    assert not exists(name)
+
+
+def test_unlink_shared_ignores_blocks_read_already():
+    name = publish_shared(b'x')
+    read_shared(name, 1)
+    unlink_shared(name)
+
+
+def test_overlay_frees_the_result_nobody_read(make_overlay):
+    overlay = make_overlay(flags=constant.CLIPBOARD | constant.SHARED_MEMORY)
+    overlay.copyToClipboard = False
+    overlay.selected_area = QRect(10, 10, 20, 20)
+
+    overlay.saveScreenshot(True)
+    first = overlay.sharedName
+    assert exists(first)
+
+    overlay.saveScreenshot(True)
+    second = overlay.sharedName
+    assert not exists(first)
+    assert exists(second)
+
+    overlay.reset()
+    assert overlay.sharedName is None
+    assert not exists(second)
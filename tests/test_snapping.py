@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QImage, QPainter
+
+WINDOW = QRect(100, 120, 300, 200)
+
+
+@pytest.fixture
+def overlay(make_overlay):
+    image = QImage(640, 480, QImage.Format_RGB32)
+    image.fill(QColor(240, 240, 240))
+    painter = QPainter(image)
+    painter.fillRect(WINDOW, QColor(40, 40, 90))
+    painter.end()
+    return make_overlay(image)
+
+
+def drag(overlay, mouse, start, end):
+    viewport = overlay.viewport()
+    mouse(viewport, 'move', *start)
+    overlay.flushMouseMove()
+    assert overlay.edges(wait=True) is not None
+    mouse(viewport, 'press', *start)
+    mouse(viewport, 'move', *end)
+    overlay.flushMouseMove()
+    moved = QRect(overlay.selected_area)
+    mouse(viewport, 'release', *end)
+    return moved, overlay.selected_area
+
+
+@pytest.mark.parametrize('start, end', [
+    ((97, 117), (402, 322)),  # down right
+    ((97, 322), (402, 117)),  # up right
+    ((402, 322), (97, 117)),  # up left
+    ((402, 117), (97, 322)),  # down left
+])
+def test_drag_snaps_every_side(overlay, mouse, start, end):
+    moved, released = drag(overlay, mouse, start, end)
+    assert moved == WINDOW
+    assert released == WINDOW
+
+
+def test_drag_far_from_edges_is_not_snapped(overlay, mouse):
+    moved, released = drag(overlay, mouse, (20, 30), (50, 60))
+    assert released == QRect(20, 30, 31, 31)
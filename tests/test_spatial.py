@@ -0,0 +1,47 @@
+from PyQt5.QtCore import QRectF
+
+from pyqt_screenshot.spatial import GridIndex
+
+
+def test_insert_query_remove():
+    index = GridIndex(64)
+    index.insert('a', QRectF(10, 10, 20, 20))
+    index.insert('b', QRectF(200, 200, 20, 20))
+    assert len(index) == 2 and 'a' in index
+
+    assert index.query(QRectF(0, 0, 40, 40)) == {'a'}
+    assert index.query(QRectF(0, 0, 300, 300)) == {'a', 'b'}
+    # same cell, but outside the rect itself
+    assert index.query(QRectF(40, 40, 10, 10)) == set()
+
+    index.remove('a')
+    assert 'a' not in index
+    assert index.query(QRectF(0, 0, 40, 40)) == set()
+    assert (0, 0) not in index.cells
+    # removing a missing key is ignored
+    index.remove('a')
+
+
+def test_item_spanning_cells():
+    index = GridIndex(64)
+    index.insert('wide', QRectF(-30, 30, 300, 100))
+    assert len(index.keys['wide'][1]) == 6 * 3
+
+    # found from any cell it reaches, reported once
+    assert index.query(QRectF(250, 100, 5, 5)) == {'wide'}
+    assert index.query(QRectF(-20, 40, 5, 5)) == {'wide'}
+    assert index.query(QRectF(-100, 0, 500, 500)) == {'wide'}
+
+    index.remove('wide')
+    assert index.cells == {}
+
+
+def test_query_after_move():
+    index = GridIndex(64)
+    index.insert('a', QRectF(10, 10, 20, 20))
+    index.insert('a', QRectF(500, 500, 20, 20))
+    assert len(index) == 1
+
+    assert index.query(QRectF(0, 0, 64, 64)) == set()
+    assert index.query(QRectF(490, 490, 40, 40)) == {'a'}
+    assert set(index.cells) == {(7, 7), (8, 7), (7, 8), (8, 8)}